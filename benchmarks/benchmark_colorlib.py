@@ -0,0 +1,125 @@
+# -------------------------------------------------------------------
+# - NAME:        benchmark_colorlib.py
+# - AUTHORS:     Reto Stauffer, Achim Zeileis
+# - LICENSE:     GPL-2 | GPL-3, Reto Stauffer and Achim Zeileis,
+#                copyright 2022-2024
+# -------------------------------------------------------------------
+# - DESCRIPTION: Simple timing benchmarks for the colorlib conversion
+#                kernels. Not part of the test suite; run manually via
+#                `make benchmark` or
+#                `python benchmarks/benchmark_colorlib.py [--full]`.
+# -------------------------------------------------------------------
+
+import argparse
+import numpy as np
+from time import perf_counter
+
+from colorspace.colorlib import colorlib, HCL
+
+
+# -------------------------------------------------------------------
+# Reference implementations: the former per-element loops, used to
+# show the speedup of the vectorized kernels.
+# -------------------------------------------------------------------
+def ref_XYZ_to_LUV(clib, X, Y, Z):
+    [XN, YN, ZN] = clib._get_white_("ref_XYZ_to_LUV", len(X))
+    [u,  v]  = clib.XYZ_to_uv(X,  Y,  Z )
+    [uN, vN] = clib.XYZ_to_uv(XN, YN, ZN)
+    L = np.ndarray(len(X), dtype = "float"); L[:] = 0.
+    y = Y / YN
+    for i,val in np.ndenumerate(y):
+        L[i] = 116. * np.power(val, 1./3.) - 16. if val > clib._EPSILON else clib._KAPPA * val
+    return [L, 13. * L * (u - uN), 13. * L * (v - vN)]
+
+def ref_LUV_to_XYZ(clib, L, U, V):
+    [XN, YN, ZN] = clib._get_white_("ref_LUV_to_XYZ", len(L))
+    X = np.ndarray(len(L), dtype = "float"); X[:] = 0.
+    Y = np.ndarray(len(L), dtype = "float"); Y[:] = 0.
+    Z = np.ndarray(len(L), dtype = "float"); Z[:] = 0.
+    def fun(L, U, V):
+        return False if L <= 0. and U == 0. and V == 0. else True
+    idx = np.where([fun(L[i], U[i], V[i]) for i in range(0, len(L))])[0]
+    if len(idx) == 0: return [X, Y, Z]
+    for i in idx:
+        Y[i] = YN[i] * (np.power((L[i] + 16.)/116., 3.) if L[i] > 8. else L[i] / clib._KAPPA)
+    L = np.fmax(np.finfo(float).eps*10, L)
+    [uN, vN] = clib.XYZ_to_uv(XN, YN, ZN)
+    u = U / (13. * L) + uN
+    v = V / (13. * L) + vN
+    X =  9.0 * Y * u / (4 * v)
+    Z =  -X / 3. - 5. * Y + 3. * Y / v
+    return [X, Y, Z]
+
+
+def timeit(fun, *args, repeat = 3):
+    """Returns the best (minimum) wall time of `repeat` calls in seconds."""
+    res = []
+    for i in range(repeat):
+        t0 = perf_counter()
+        fun(*args)
+        res.append(perf_counter() - t0)
+    return min(res)
+
+
+def random_luv(n, seed = 1):
+    """Random CIELUV coordinates including a few black colors."""
+    rng = np.random.default_rng(seed)
+    L = rng.uniform(0., 100., n)
+    U = rng.normal(0., 50., n)
+    V = rng.normal(0., 50., n)
+    L[::100] = 0.; U[::100] = 0.; V[::100] = 0.
+    return [L, U, V]
+
+
+def benchmark_luv(sizes, refmax):
+    clib = colorlib()
+    print(f"{'kernel':<14s}{'n':>10s}{'vectorized':>14s}{'loop':>14s}{'speedup':>10s}")
+    for n in sizes:
+        LUV = random_luv(n)
+        XYZ = clib.LUV_to_XYZ(*LUV)
+        for name, args, ref in [("LUV_to_XYZ", LUV, ref_LUV_to_XYZ),
+                                ("XYZ_to_LUV", XYZ, ref_XYZ_to_LUV)]:
+            tnew = timeit(getattr(clib, name), *args)
+            if n <= refmax:
+                tref = timeit(ref, clib, *args, repeat = 1)
+                tmp  = f"{tref:13.4f}s{tref / tnew:9.1f}x"
+            else:
+                tmp  = f"{'---':>14s}{'---':>10s}"
+            print(f"{name:<14s}{n:>10d}{tnew:13.4f}s{tmp}")
+
+
+def benchmark_hex(sizes):
+    """Hex encoder (sRGB_to_hex) for large numbers of colors."""
+    clib = colorlib()
+    print(f"{'kernel':<14s}{'n':>10s}{'vectorized':>14s}")
+    rng = np.random.default_rng(1)
+    for n in sizes:
+        rgb = rng.uniform(-0.05, 1.05, (3, n))
+        t = timeit(clib.sRGB_to_hex, *rgb)
+        print(f"{'sRGB_to_hex':<14s}{n:>10d}{t:13.4f}s")
+
+
+def benchmark_objects(sizes, repeat = 200):
+    """Color object conversion HCL -> hex; dominated by overhead for small n."""
+    print(f"{'conversion':<14s}{'n':>10s}{'per call':>14s}")
+    rng = np.random.default_rng(1)
+    for n in sizes:
+        H = rng.uniform(0., 360., n)
+        C = rng.uniform(0.,  80., n)
+        L = rng.uniform(0., 100., n)
+        t = timeit(lambda: [HCL(H, C, L).colors() for i in range(repeat)])
+        print(f"{'HCL -> hex':<14s}{n:>10d}{t / repeat * 1e3:12.4f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description = "Benchmarking colorlib kernels")
+    parser.add_argument("--full", action = "store_true",
+            help = "Also time the (slow) loop reference for 1e7 colors")
+    args = parser.parse_args()
+
+    sizes = [int(1e3), int(1e5), int(1e7)]
+    benchmark_luv(sizes, refmax = int(1e7) if args.full else int(1e5))
+    print("")
+    benchmark_hex([int(1e3), int(1e5), int(1e6)])
+    print("")
+    benchmark_objects([7, 100, 1000])
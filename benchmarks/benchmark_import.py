@@ -0,0 +1,35 @@
+# -------------------------------------------------------------------
+# - NAME:        benchmark_import.py
+# - AUTHORS:     Reto Stauffer, Achim Zeileis
+# - LICENSE:     GPL-2 | GPL-3, Reto Stauffer and Achim Zeileis,
+#                copyright 2022-2024
+# -------------------------------------------------------------------
+# - DESCRIPTION: Import time of the package (lazy, only `import
+#                colorspace`) compared to loading all public names.
+#                Not part of the test suite; run manually via
+#                `make benchmark` or `python benchmarks/benchmark_import.py`.
+# -------------------------------------------------------------------
+
+import os
+import sys
+import subprocess
+
+
+def import_time(code, repeat = 5):
+    """Best (minimum) time in seconds of `import colorspace` plus `code`,
+    each measured in a fresh interpreter."""
+    code = "import time; t = time.perf_counter(); import colorspace" + code + \
+           "; print(time.perf_counter() - t)"
+    env  = dict(os.environ, PYTHONPATH = os.pathsep.join(sys.path))
+    res  = [float(subprocess.run([sys.executable, "-c", code], capture_output = True,
+                                 text = True, check = True, env = env).stdout)
+            for i in range(repeat)]
+    return min(res)
+
+
+if __name__ == "__main__":
+    lazy = import_time("")
+    full = import_time("; [getattr(colorspace, x) for x in colorspace.__all__]")
+    print(f"{'import':<24s}{'time':>12s}")
+    print(f"{'import colorspace':<24s}{lazy * 1e3:10.1f}ms")
+    print(f"{'all public names':<24s}{full * 1e3:10.1f}ms")
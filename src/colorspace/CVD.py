@@ -10,6 +10,74 @@
 # formulas along with tables of certain constants that allow to simulate various types of
 # CVD. See \code{\link{simulate_cvd}} for the corresponding simulation functions.
 
+import numpy as np
+
+# CVD transformation matrices of shape (3, 11, 3, 3); protan, deutan,
+# tritan (order of `_CVD_TYPES_`) for the severities 0.0, 0.1, ..., 1.0.
+# Each row contains the matrix in column-major order.
+_CVD_TYPES_    = ["protan", "deutan", "tritan"]
+_CVD_MATRICES_ = np.asarray([
+    # Protanope CVD transformation matrices (severity 0.0, 0.1, ..., 1.0)
+    [(1.000000,  0.000000, -0.000000, 0.000000,  1.000000,  0.000000, -0.000000, -0.000000,  1.000000),
+     (0.856167,  0.182038, -0.038205, 0.029342,  0.955115,  0.015544, -0.002880, -0.001563,  1.004443),
+     (0.734766,  0.334872, -0.069637, 0.051840,  0.919198,  0.028963, -0.004928, -0.004209,  1.009137),
+     (0.630323,  0.465641, -0.095964, 0.069181,  0.890046,  0.040773, -0.006308, -0.007724,  1.014032),
+     (0.539009,  0.579343, -0.118352, 0.082546,  0.866121,  0.051332, -0.007136, -0.011959,  1.019095),
+     (0.458064,  0.679578, -0.137642, 0.092785,  0.846313,  0.060902, -0.007494, -0.016807,  1.024301),
+     (0.385450,  0.769005, -0.154455, 0.100526,  0.829802,  0.069673, -0.007442, -0.022190,  1.029632),
+     (0.319627,  0.849633, -0.169261, 0.106241,  0.815969,  0.077790, -0.007025, -0.028051,  1.035076),
+     (0.259411,  0.923008, -0.182420, 0.110296,  0.804340,  0.085364, -0.006276, -0.034346,  1.040622),
+     (0.203876,  0.990338, -0.194214, 0.112975,  0.794542,  0.092483, -0.005222, -0.041043,  1.046265),
+     (0.152286,  1.052583, -0.204868, 0.114503,  0.786281,  0.099216, -0.003882, -0.048116,  1.051998)],
+    # Deuteranope CVD transformation matrices (severity 0.0, 0.1, ..., 1.0)
+    [(1.000000,  0.000000, -0.000000, 0.000000,  1.000000,  0.000000, -0.000000, -0.000000,  1.000000),
+     (0.866435,  0.177704, -0.044139, 0.049567,  0.939063,  0.011370, -0.003453,  0.007233,  0.996220),
+     (0.760729,  0.319078, -0.079807, 0.090568,  0.889315,  0.020117, -0.006027,  0.013325,  0.992702),
+     (0.675425,  0.433850, -0.109275, 0.125303,  0.847755,  0.026942, -0.007950,  0.018572,  0.989378),
+     (0.605511,  0.528560, -0.134071, 0.155318,  0.812366,  0.032316, -0.009376,  0.023176,  0.986200),
+     (0.547494,  0.607765, -0.155259, 0.181692,  0.781742,  0.036566, -0.010410,  0.027275,  0.983136),
+     (0.498864,  0.674741, -0.173604, 0.205199,  0.754872,  0.039929, -0.011131,  0.030969,  0.980162),
+     (0.457771,  0.731899, -0.189670, 0.226409,  0.731012,  0.042579, -0.011595,  0.034333,  0.977261),
+     (0.422823,  0.781057, -0.203881, 0.245752,  0.709602,  0.044646, -0.011843,  0.037423,  0.974421),
+     (0.392952,  0.823610, -0.216562, 0.263559,  0.690210,  0.046232, -0.011910,  0.040281,  0.971630),
+     (0.367322,  0.860646, -0.227968, 0.280085,  0.672501,  0.047413, -0.011820,  0.042940,  0.968881)],
+    # Tritanope CVD transformation matrices (severity 0.0, 0.1, ..., 1.0)
+    [(1.000000,  0.000000, -0.000000,  0.000000,  1.000000,  0.000000, -0.000000, -0.000000,  1.000000),
+     (0.926670,  0.092514, -0.019184,  0.021191,  0.964503,  0.014306,  0.008437,  0.054813,  0.936750),
+     (0.895720,  0.133330, -0.029050,  0.029997,  0.945400,  0.024603,  0.013027,  0.104707,  0.882266),
+     (0.905871,  0.127791, -0.033662,  0.026856,  0.941251,  0.031893,  0.013410,  0.148296,  0.838294),
+     (0.948035,  0.089490, -0.037526,  0.014364,  0.946792,  0.038844,  0.010853,  0.193991,  0.795156),
+     (1.017277,  0.027029, -0.044306, -0.006113,  0.958479,  0.047634,  0.006379,  0.248708,  0.744913),
+     (1.104996, -0.046633, -0.058363, -0.032137,  0.971635,  0.060503,  0.001336,  0.317922,  0.680742),
+     (1.193214, -0.109812, -0.083402, -0.058496,  0.979410,  0.079086, -0.002346,  0.403492,  0.598854),
+     (1.257728, -0.139648, -0.118081, -0.078003,  0.975409,  0.102594, -0.003316,  0.501214,  0.502102),
+     (1.278864, -0.125333, -0.153531, -0.084748,  0.957674,  0.127074, -0.000989,  0.601151,  0.399838),
+     (1.255528, -0.076749, -0.178779, -0.078411,  0.930809,  0.147602,  0.004733,  0.691367,  0.303900)]
+    ], dtype = float).reshape((3, 11, 3, 3)).swapaxes(2, 3).copy()
+_CVD_MATRICES_.flags.writeable = False
+
+def _cvd_transform_(types, severities):
+    """Interpolated CVD Transformation Matrices
+
+    Linear interpolation between the 11 transformation matrices depending
+    on the severity (see `_CVD_MATRICES_`).
+
+    Args:
+        types (list): Names of the deficiencies (see `_CVD_TYPES_`).
+        severities (numpy.ndarray): Severities in `[0., 1.]`.
+
+    Returns:
+        numpy.ndarray: Transformation matrices of shape `(len(types), len(severities), 3, 3)`.
+    """
+    mat = _CVD_MATRICES_[[_CVD_TYPES_.index(x) for x in types]]
+    sev = np.clip(np.asarray(severities, dtype = float), 0., 1.) * 10.
+    lo  = np.floor(sev).astype(int)
+    hi  = np.ceil(sev).astype(int)
+    wlo = np.where(lo == hi, 1., hi - sev)[:, None, None]
+    whi = (sev - lo)[:, None, None]
+    return wlo * mat[:, lo] + whi * mat[:, hi]
+
+
 def deutan(cols, severity = 1., linear = True):
     """Simulate Color Vision Deficiency
 
@@ -200,6 +268,93 @@ def tritan(cols, severity = 1., linear = True):
     return res.tolist() if isinstance(res, ndarray) else res
 
 
+def simulate_cvd(cols, types = None, severities = 1., linear = True):
+    """Simulate Multiple Color Vision Deficiencies
+
+    Simulates several types of color vision deficiencies for several
+    severities at once (see :py:func:`deutan`, :py:func:`protan`, and
+    :py:func:`tritan`). The (interpolated) transformation matrices for all
+    types and severities are applied in one single step, returning the
+    sRGB coordinates of all simulated colors as one array (e.g., for
+    automated accessibility checks).
+
+    Args:
+        cols (str, list, palette, colorobject): Single hex color, list of hex
+            colors (str), a palette, or a color object (such as RGB, hexcols, CIELUV).
+        types (None, str, list): Type(s) of color vision deficiencies, any
+            of `"protan"`, `"deutan"`, and `"tritan"`. If `None` (default)
+            all three are simulated (in this order).
+        severities (float, list, numpy.ndarray): One or multiple severities in `[0., 1.]`,
+            defaults to `1.`.
+        linear (bool): Should the color vision deficiency transformation be applied to the
+            linearised RGB coordinates (default)? If `False`, the transformation is applied to the
+            gamma-corrected sRGB coordinates (as in the Machado et al. 2009 supplementary materials).
+
+    Returns:
+        numpy.ndarray: Array of shape `(len(types), len(severities), n, 3)` with
+        the sRGB coordinates (`[0., 1.]`, values outside are limited) of the
+        simulated colors where `n` is the number of colors.
+
+    Example:
+
+        >>> from colorspace import simulate_cvd, diverging_hcl
+        >>> cols = diverging_hcl()(5)
+        >>> res = simulate_cvd(cols, severities = [0., 0.5, 1.])
+        >>> res.shape
+        >>> #: Deuteranope vision, severity 0.5
+        >>> res[1, 1]
+
+    Raises:
+        TypeError: If `cols` is not among the allowed types.
+        TypeError: If `types` is not None, str, or list of str.
+        ValueError: If `types` contains unknown deficiencies.
+        ValueError: If `severities` are not (finite) values in `[0., 1.]`.
+        TypeError: If argument `linear` is no bool.
+    """
+
+    from .colorlib import colorobject, hexcols
+    from .palettes import palette
+    from .utils import check_hex_colors
+
+    if isinstance(cols, palette):
+        cols = cols.colors()
+    if isinstance(cols, (str, list)):
+        cols = hexcols(check_hex_colors(cols))
+    elif not isinstance(cols, colorobject):
+        raise TypeError("argument `cols` not among the allowed types")
+
+    if types is None:
+        types = _CVD_TYPES_
+    elif isinstance(types, str):
+        types = [types]
+    if not isinstance(types, list) or not all([isinstance(x, str) for x in types]):
+        raise TypeError("argument `types` must be None, str, or list of str")
+    types = [x.lower() for x in types]
+    if not all([x in _CVD_TYPES_ for x in types]):
+        raise ValueError(f"argument `types` wrong, must be any of {', '.join(_CVD_TYPES_)}")
+
+    try:
+        severities = np.asarray(severities, dtype = float).reshape(-1)
+    except Exception:
+        raise ValueError("argument `severities` must be float or a list of floats")
+    if not np.all((severities >= 0.) & (severities <= 1.)):
+        raise ValueError("argument `severities` must be in `[0., 1.]`")
+    if not isinstance(linear, bool):
+        raise TypeError("argument `linear` must be bool")
+
+    # Apply all transformation matrices in one go; coordinates are
+    # converted without modifying the input object.
+    RGB = np.stack(cols._convert_coords_("RGB" if linear else "sRGB"), axis = 1)
+    res = np.einsum("ni,tsij->tsnj", RGB, _cvd_transform_(types, severities))
+
+    # Convert linear RGB coordinates to sRGB
+    if linear:
+        res = np.stack(cols._convert_coords_("sRGB", coords = list(res.reshape(-1, 3).T),
+                                             from_ = "RGB"), axis = 1).reshape(res.shape)
+
+    return np.clip(res, 0., 1.)
+
+
 class CVD(object):
     """Simulate Color Vision Defficiency
 
@@ -324,22 +479,10 @@ class CVD(object):
             if not isinstance(cols, colorobject):
                 raise TypeError("argument `cols` does not match any of the allowed types")
 
-        # Convert
-        from copy import deepcopy
-        self._colors_ = deepcopy(cols)
-
-    def _tomat(self, x):
-        """Transformation/Rotation Matrix
-
-        Helper function to convert input `x` to a proper (3 x 3)
-        `numpy.ndarray` (matrix).
-
-        Returns:
-            numpy.ndarray: Returns a numpy float matrix of shape `3 x 3`.
-            The color deficiency transformation or rotation matrix.
-        """
-        from numpy import reshape, asarray
-        return asarray(x, dtype = float).reshape((3,3), order = "F")
+        # Keep (a shallow copy of) the colors; the coordinates are never
+        # modified in place (see _simulate).
+        from copy import copy
+        self._colors_ = copy(cols)
 
     def protan_cvd_matrizes(self, s):
         """Protanope Transformation Matrix
@@ -361,20 +504,7 @@ class CVD(object):
         if not isinstance(s, int): raise TypeError("argument `s` must be int")
         elif s < 0 or s > 11:      raise ValueError("argument `s` must be in [0, 11]")
 
-        # Protanope CDV transformation matrix definition
-        x = []
-        x.append(self._tomat(( 1.000000,  0.000000, -0.000000, 0.000000,  1.000000,  0.000000, -0.000000, -0.000000,  1.000000)))
-        x.append(self._tomat(( 0.856167,  0.182038, -0.038205, 0.029342,  0.955115,  0.015544, -0.002880, -0.001563,  1.004443)))
-        x.append(self._tomat(( 0.734766,  0.334872, -0.069637, 0.051840,  0.919198,  0.028963, -0.004928, -0.004209,  1.009137)))
-        x.append(self._tomat(( 0.630323,  0.465641, -0.095964, 0.069181,  0.890046,  0.040773, -0.006308, -0.007724,  1.014032)))
-        x.append(self._tomat(( 0.539009,  0.579343, -0.118352, 0.082546,  0.866121,  0.051332, -0.007136, -0.011959,  1.019095)))
-        x.append(self._tomat(( 0.458064,  0.679578, -0.137642, 0.092785,  0.846313,  0.060902, -0.007494, -0.016807,  1.024301)))
-        x.append(self._tomat(( 0.385450,  0.769005, -0.154455, 0.100526,  0.829802,  0.069673, -0.007442, -0.022190,  1.029632)))
-        x.append(self._tomat(( 0.319627,  0.849633, -0.169261, 0.106241,  0.815969,  0.077790, -0.007025, -0.028051,  1.035076)))
-        x.append(self._tomat(( 0.259411,  0.923008, -0.182420, 0.110296,  0.804340,  0.085364, -0.006276, -0.034346,  1.040622)))
-        x.append(self._tomat(( 0.203876,  0.990338, -0.194214, 0.112975,  0.794542,  0.092483, -0.005222, -0.041043,  1.046265)))
-        x.append(self._tomat(( 0.152286,  1.052583, -0.204868, 0.114503,  0.786281,  0.099216, -0.003882, -0.048116,  1.051998)))
-        return x[s]
+        return _CVD_MATRICES_[0][s]
 
 
     def deutan_cvd_matrizes(self, s):
@@ -397,20 +527,7 @@ class CVD(object):
         if not isinstance(s, int): raise TypeError("argument `s` must be int")
         elif s < 0 or s > 11:      raise ValueError("argument `s` must be in [0, 11]")
 
-        # Deuteranope CDV transformation matrix definition
-        x = []
-        x.append(self._tomat(( 1.000000,  0.000000, -0.000000, 0.000000,  1.000000,  0.000000, -0.000000, -0.000000,  1.000000)))
-        x.append(self._tomat(( 0.866435,  0.177704, -0.044139, 0.049567,  0.939063,  0.011370, -0.003453,  0.007233,  0.996220)))
-        x.append(self._tomat(( 0.760729,  0.319078, -0.079807, 0.090568,  0.889315,  0.020117, -0.006027,  0.013325,  0.992702)))
-        x.append(self._tomat(( 0.675425,  0.433850, -0.109275, 0.125303,  0.847755,  0.026942, -0.007950,  0.018572,  0.989378)))
-        x.append(self._tomat(( 0.605511,  0.528560, -0.134071, 0.155318,  0.812366,  0.032316, -0.009376,  0.023176,  0.986200)))
-        x.append(self._tomat(( 0.547494,  0.607765, -0.155259, 0.181692,  0.781742,  0.036566, -0.010410,  0.027275,  0.983136)))
-        x.append(self._tomat(( 0.498864,  0.674741, -0.173604, 0.205199,  0.754872,  0.039929, -0.011131,  0.030969,  0.980162)))
-        x.append(self._tomat(( 0.457771,  0.731899, -0.189670, 0.226409,  0.731012,  0.042579, -0.011595,  0.034333,  0.977261)))
-        x.append(self._tomat(( 0.422823,  0.781057, -0.203881, 0.245752,  0.709602,  0.044646, -0.011843,  0.037423,  0.974421)))
-        x.append(self._tomat(( 0.392952,  0.823610, -0.216562, 0.263559,  0.690210,  0.046232, -0.011910,  0.040281,  0.971630)))
-        x.append(self._tomat(( 0.367322,  0.860646, -0.227968, 0.280085,  0.672501,  0.047413, -0.011820,  0.042940,  0.968881)))
-        return x[s]
+        return _CVD_MATRICES_[1][s]
 
 
     # tritanomaly CVD
@@ -434,20 +551,7 @@ class CVD(object):
         if not isinstance(s, int): raise TypeError("argument `s` must be int")
         elif s < 0 or s > 11:      raise ValueError("argument `s` must be in [0, 11]")
 
-        # Tritanope CDV transformation matrix definition
-        x = []
-        x.append(self._tomat(( 1.000000,  0.000000, -0.000000,  0.000000,  1.000000,  0.000000, -0.000000, -0.000000,  1.000000)))
-        x.append(self._tomat(( 0.926670,  0.092514, -0.019184,  0.021191,  0.964503,  0.014306,  0.008437,  0.054813,  0.936750)))
-        x.append(self._tomat(( 0.895720,  0.133330, -0.029050,  0.029997,  0.945400,  0.024603,  0.013027,  0.104707,  0.882266)))
-        x.append(self._tomat(( 0.905871,  0.127791, -0.033662,  0.026856,  0.941251,  0.031893,  0.013410,  0.148296,  0.838294)))
-        x.append(self._tomat(( 0.948035,  0.089490, -0.037526,  0.014364,  0.946792,  0.038844,  0.010853,  0.193991,  0.795156)))
-        x.append(self._tomat(( 1.017277,  0.027029, -0.044306, -0.006113,  0.958479,  0.047634,  0.006379,  0.248708,  0.744913)))
-        x.append(self._tomat(( 1.104996, -0.046633, -0.058363, -0.032137,  0.971635,  0.060503,  0.001336,  0.317922,  0.680742)))
-        x.append(self._tomat(( 1.193214, -0.109812, -0.083402, -0.058496,  0.979410,  0.079086, -0.002346,  0.403492,  0.598854)))
-        x.append(self._tomat(( 1.257728, -0.139648, -0.118081, -0.078003,  0.975409,  0.102594, -0.003316,  0.501214,  0.502102)))
-        x.append(self._tomat(( 1.278864, -0.125333, -0.153531, -0.084748,  0.957674,  0.127074, -0.000989,  0.601151,  0.399838)))
-        x.append(self._tomat(( 1.255528, -0.076749, -0.178779, -0.078411,  0.930809,  0.147602,  0.004733,  0.691367,  0.303900)))
-        return x[s]
+        return _CVD_MATRICES_[2][s]
 
     def _interpolate_cvd_transform(self):
         """Interpolate Transformation Matrices
@@ -462,24 +566,7 @@ class CVD(object):
             The interpolated color deficiency transformation or rotation matrix.
         """
 
-        # Getting severity
-        fun = getattr(self, f"{self._type.lower()}_cvd_matrizes")
-        severity = self._severity
-        if severity <= 0.:
-            cvd = fun(0)
-        elif severity >= 1.:
-            cvd = fun(10)
-        else:
-            from numpy import floor, ceil
-            lo = int(floor(severity * 10.))
-            hi = int(ceil(severity * 10.))
-            if lo == hi:
-                cvd = fun(lo) 
-            else:
-                cvd = (hi - severity * 10.) * fun(lo) + \
-                      (severity * 10. - lo) * fun(hi)
-
-        return cvd
+        return _cvd_transform_([self._type], [self._severity])[0, 0]
 
     def _simulate(self):
         """Perform Color Transformation
@@ -492,38 +579,25 @@ class CVD(object):
         """
 
 
-        from copy import deepcopy
-        cols = deepcopy(self._colors_)
-
+        from copy import copy
         from .colorlib import colorobject
 
-        if not isinstance(cols, colorobject):
+        if not isinstance(self._colors_, colorobject):
             raise ValueError("input cols to {:s}".format(self.__class__.__name__) + \
                     "has to be a colorobject (e.g., CIELAB, RGB, hexcols).")
 
-        # Convert to linear RGB or gamma-corrected sRGB
-        if self._linear:
-            cols.to("RGB")
-        else:
-            cols.to("sRGB")
-
-        # Transform color
-        from numpy import dot, vstack
-        RGB = vstack([cols.get("R"), cols.get("G"), cols.get("B")])
-        CVD = self._interpolate_cvd_transform()
+        # Convert to linear RGB or gamma-corrected sRGB; shallow copy
+        # as the coordinates are replaced, not modified.
+        cols = copy(self._colors_)
+        cols.to("RGB" if self._linear else "sRGB")
 
         # Apply coefficients/CVD transformation matrix
-        RGB = RGB.transpose().dot(CVD).transpose()
-
-        # Save simulated data
-        cols.set(R = RGB[0], G = RGB[1], B = RGB[2])
+        RGB = np.stack([cols.get(x, copy = False) for x in ["R", "G", "B"]], axis = 1)
+        RGB = RGB.dot(self._interpolate_cvd_transform())
+        cols._replace_coords_(cols.__class__.__name__, list(RGB.T))
 
         # User provided hex colors?
-        from copy import copy
-        if self._hexinput:
-            return copy(cols.colors())
-        else:
-            return copy(cols)
+        return cols.colors() if self._hexinput else cols
 
     def colors(self):
         """Get Color Object
@@ -667,8 +741,7 @@ def desaturate(cols, amount = 1.):
     elif isinstance(cols, list) or isinstance(cols, str):
         cols = hexcols(cols)
     elif not isinstance(cols, colorobject):
-        import inspect
-        raise TypeError(f"argument `cols` to {inspect.stack()[0][3]} not among the allowed types.")
+        raise TypeError("argument `cols` to desaturate not among the allowed types.")
 
     # From here on "col" needs to be a colorspace.colorlib.colorobject
     if not isinstance(cols, colorobject):
@@ -1,63 +1,112 @@
+# Public functions and classes are imported lazily on first access
+# (PEP 562) such that `import colorspace` stays fast; only the modules
+# actually used are loaded (e.g., `choose_palette` tries to import tkinter,
+# the plotting functions matplotlib). Maps the names to the modules.
+_LAZY_ = {
+    # The color library which contains all the
+    # color objects and required transformation
+    # methods.
+    "colorlib":                "colorlib",
+    "polarLUV":                "colorlib",
+    "HCL":                     "colorlib",
+    "CIELUV":                  "colorlib",
+    "CIEXYZ":                  "colorlib",
+    "RGB":                     "colorlib",
+    "sRGB":                    "colorlib",
+    "CIELAB":                  "colorlib",
+    "polarLAB":                "colorlib",
+    "HSV":                     "colorlib",
+    "HLS":                     "colorlib",
+    "hexcols":                 "colorlib",
+    "compare_colors":          "colorlib",
+    "color_distance":          "colorlib",
+    # Color vision deficiency functions.
+    "tritan":                  "CVD",
+    "protan":                  "CVD",
+    "deutan":                  "CVD",
+    "desaturate":              "CVD",
+    "simulate_cvd":            "CVD",
+    # Default HCL color palettes methods and
+    # functions.
+    "palette":                 "palettes",
+    "hclpalettes":             "palettes",
+    "qualitative_hcl":         "palettes",
+    "diverging_hcl":           "palettes",
+    "divergingx_hcl":          "palettes",
+    "sequential_hcl":          "palettes",
+    "rainbow_hcl":             "palettes",
+    "heat_hcl":                "palettes",
+    "terrain_hcl":             "palettes",
+    "diverging_hsv":           "palettes",
+    "rainbow":                 "palettes",
+    "set_palette_cache":       "palettes",
+    "palette_cache_info":      "palettes",
+    "clear_palette_cache":     "palettes",
+    # Color manipulation utils
+    "mixcolor":                "utils",
+    "lighten":                 "utils",
+    "darken":                  "utils",
+    "max_chroma":              "utils",
+    "make_max_chroma_table":   "utils",
+    "contrast_ratio":          "utils",
+    "check_hex_colors":        "utils",
+    "extract_transparency":    "utils",
+    "adjust_transparency":     "utils",
+    # Helper functions and methods
+    "hcl_palettes":            "hcl_palettes",
+    "divergingx_palettes":     "hcl_palettes",
+    "swatchplot":              "swatchplot",
+    "specplot":                "specplot",
+    "hclplot":                 "hclplot",
+    "choose_palette":          "choose_palette",
+    "cvd_image":               "cvd_image",
+    "simulate_cvd_image":      "cvd_image",
+    "demoplot":                "demos",
+    "dataset":                 "datasets",
+    # Three-dimensional lookup tables
+    "lut3d":                   "lut",
+    "bake_lut":                "lut",
+    "load_lut":                "lut"
+}
 
+# Submodules are part of `from colorspace import *` for backwards compatibility
+__all__ = list(_LAZY_.keys()) + ["CVD", "datasets", "demos", "palettes", "utils"]
 
-# The color library which contains all the
-# color objects and required transformation
-# methods.
-from .colorlib import colorlib
-from .colorlib import polarLUV
-from .colorlib import HCL
-from .colorlib import CIELUV
-from .colorlib import CIEXYZ
-from .colorlib import RGB
-from .colorlib import sRGB
-from .colorlib import CIELAB
-from .colorlib import polarLAB
-from .colorlib import HSV
-from .colorlib import HLS
-from .colorlib import hexcols
-from .colorlib import compare_colors
 
-# Color vision deficiency functions.
-from .CVD import tritan
-from .CVD import protan
-from .CVD import deutan
-from .CVD import desaturate
+def __getattr__(name):
+    """Imports public functions and classes (and submodules) on first access."""
+    from importlib import import_module
+    if name in _LAZY_:
+        obj = getattr(import_module(f".{_LAZY_[name]}", __name__), name)
+    # Submodules not yet imported (e.g., `colorspace.statshelper`)
+    elif not name.startswith("__"):
+        from importlib.util import find_spec
+        if find_spec(f".{name}", __name__) is None:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        obj = import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Default HCL color palettes methods and
-# functions.
-from .palettes import palette
-from .palettes import hclpalettes
-from .palettes import qualitative_hcl
-from .palettes import diverging_hcl
-from .palettes import divergingx_hcl
-from .palettes import sequential_hcl
-from .palettes import rainbow_hcl
-from .palettes import heat_hcl
-from .palettes import terrain_hcl
-from .palettes import diverging_hsv
-from .palettes import rainbow
+    globals()[name] = obj
+    return obj
 
-# Color manipulation utils
-from .utils import mixcolor
-from .utils import lighten
-from .utils import darken
-from .utils import max_chroma
-from .utils import contrast_ratio
-from .utils import check_hex_colors
-from .utils import extract_transparency
-from .utils import adjust_transparency
-from .utils import mixcolor
 
-# Helper functions and methods
-from .hcl_palettes import hcl_palettes
-from .hcl_palettes import divergingx_palettes
-from .swatchplot import swatchplot
-from .specplot import specplot
-from .hclplot import hclplot
-from .choose_palette import choose_palette
-from .cvd_image import cvd_image
-from .demos import demoplot
-from .datasets import dataset
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_))
+
+
+# Importing a submodule sets it as an attribute on the package. Some
+# submodules are named like the public function they provide (e.g.,
+# `swatchplot`); the function is kept.
+from types import ModuleType as _ModuleType
+class _LazyModule_(_ModuleType):
+    def __setattr__(self, name, value):
+        if not (isinstance(value, _ModuleType) and _LAZY_.get(name) == name):
+            super().__setattr__(name, value)
+
+import sys as _sys
+_sys.modules[__name__].__class__ = _LazyModule_
+del _sys
 
 # Adding version
 from colorspace import version
@@ -33,7 +33,8 @@
 
 import sys
 import numpy as np
-import inspect
+from functools import lru_cache
+from collections.abc import MutableMapping
 
 class colorlib:
     """Color Handling Superclass
@@ -47,9 +48,20 @@ class colorlib:
     :py:class:`CIELAB`, :py:class:`CIELUV`, :py:class:`CIEXYZ`,
     :py:class:`HLS`, :py:class:`HSV`, :py:class:`RGB`, :py:class:`hexcols`,
     :py:class:`polarLAB`, :py:class:`polarLUV`, and :py:class:`sRGB`.
+
+    Args:
+        validate (bool): If `True` (default) the inputs to the conversion
+            methods are checked (type, length). Color objects validate
+            their coordinates when created and use `validate = False`
+            internally to avoid checking the same arrays on every step.
     """
 
-    # No initialization method, but some constants are specified here
+    def __init__(self, validate = True):
+        if not isinstance(validate, bool):
+            raise TypeError("argument `validate` must be bool")
+        self._validate = validate
+
+    # Some constants are specified here
 
     _KAPPA   = 24389.0 / 27.0
     """Static constant; required for coordinate transformations.
@@ -67,6 +79,14 @@ class colorlib:
     ZN = np.asarray([108.883])
     """Z value for default white spot. Used for coordinate transformations."""
 
+    _HEXDIGITS_ = np.frombuffer(b"0123456789ABCDEF", dtype = np.uint8)
+    """Lookup table (bytes) for the hex digits, see :py:method:`_hex_encode_`."""
+    _HEXVALUES_ = np.full(128, -1, dtype = np.int16)
+    _HEXVALUES_[np.frombuffer(b"0123456789ABCDEF", dtype = np.uint8)] = np.arange(16)
+    _HEXVALUES_[np.frombuffer(b"abcdef", dtype = np.uint8)] = np.arange(10, 16)
+    """Lookup table (ASCII code to value) of the hex digits, `-1` for all
+    other characters, see :py:method:`_hex_decode_`."""
+
     # Conversion function
     def _DEG2RAD(self, x):
         """Convert degrees into radiant
@@ -129,9 +149,9 @@ class colorlib:
         """
 
         # Take defaults if not further specified
-        if not XN: XN = self.XN
-        if not YN: YN = self.YN
-        if not ZN: ZN = self.ZN
+        if XN is None: XN = self.XN
+        if YN is None: YN = self.YN
+        if ZN is None: ZN = self.ZN
 
         if isinstance(XN, float): XN = np.asarray([XN])
         if isinstance(YN, float): YN = np.asarray([YN])
@@ -162,26 +182,29 @@ class colorlib:
 
         Returns:
             bool: Returns `True` if everything is OK, else an exception will be thrown.
+            Always returns `True` if the object has been created with
+            `validate = False`.
         """
 
-        # Message will be dropped if problems occur
-        msg = "Problem while checking inputs \"{:s}\" to method \"{:s}\":".format(
-                ", ".join(kwargs.keys()), __fname__)
+        # Trusted inputs (e.g., from colorobjects); skip checks
+        if not self._validate: return True
 
         from numpy import asarray
         lengths = []
         for key,val in kwargs.items():
 
-            try:
-                val = asarray(val)
-            except Exception as e:
-                raise ValueError(f"argument `{key}` to {self.__class__.__name__} " + \
-                                  "could not have been converted to numpy.ndarray")
+            # Only convert if needed (not yet a numpy.ndarray)
+            if not isinstance(val, np.ndarray):
+                try:
+                    val = asarray(val)
+                except Exception as e:
+                    raise ValueError(f"argument `{key}` to {self.__class__.__name__} " + \
+                                      "could not have been converted to numpy.ndarray")
             # Else append length and proceed
             lengths.append(len(val))
 
         # Check if all do have the same length
-        if not np.all([x == lengths[0] for x in lengths]):
+        if not all([x == lengths[0] for x in lengths]):
             tmp = []
             for k,v in kwargs.items(): tmp.append(f"{k} = {v}")
             msg = f" Arguments of different lengths: {', '.join(tmp)}."
@@ -231,7 +254,7 @@ class colorlib:
             numpy.ndarray: Gamma corrected values, same length as input `u`.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "gtrans" # Name of this method
 
         # Input check
         if isinstance(gamma, float): gamma = np.asarray([gamma])
@@ -245,14 +268,8 @@ class colorlib:
         self._check_input_arrays_(__fname__, u = u, gamma = gamma)
 
         # Transform
-        for i,val in np.ndenumerate(u):
-            # np.fmax to avoid overflow
-            if val > 0.00304:
-                u[i] = 1.055 * np.power(val, (1. / gamma[i])) - 0.055
-            else:
-                u[i] = 12.92 * val
-
-        return u
+        with np.errstate(invalid = "ignore"):
+            return np.where(u > 0.00304, 1.055 * np.power(u, (1. / gamma)) - 0.055, 12.92 * u)
 
     def ftrans(self, u, gamma):
         """Gamma Correction
@@ -274,7 +291,7 @@ class colorlib:
             numpy.ndarray: Gamma corrected values, same length as input `u`.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "ftrans" # Name of this method
 
         # Input check
         if isinstance(gamma, float): gamma = np.asarray([gamma])
@@ -287,22 +304,20 @@ class colorlib:
         # Convert input to float
         u = np.asarray(u, dtype = "float")
 
-        # Transform 
-        for i,val in np.ndenumerate(u):
-            if val > 0.03928: u[i] = np.power((val + 0.055) / 1.055, gamma[i])
-            else:             u[i] = val / 12.92
-
-        return u
+        # Transform
+        with np.errstate(invalid = "ignore"):
+            return np.where(u > 0.03928, np.power((u + 0.055) / 1.055, gamma), u / 12.92)
 
-    # Support function qtrans
+    # Support function qtrans; works on floats as well as on numpy.ndarrays
     def _qtrans(self, q1, q2, hue):
-        if hue > 360.:   hue = hue - 360.
-        if hue < 0:      hue = hue + 360.
+        hue = np.where(hue > 360., hue - 360., hue)
+        hue = np.where(hue < 0.,   hue + 360., hue)
 
-        if hue < 60.:    return q1 + (q2 - q1) * hue / 60.
-        elif hue < 180.: return q2
-        elif hue < 240.: return q1 + (q2 - q1) * (240. - hue) / 60.
-        else:            return q1
+        return np.select([hue < 60., hue < 180., hue < 240.],
+                         [q1 + (q2 - q1) * hue / 60.,
+                          q2,
+                          q1 + (q2 - q1) * (240. - hue) / 60.],
+                         default = q1)
 
 
     def sRGB_to_RGB(self, R, G, B, gamma = 2.4):
@@ -320,7 +335,7 @@ class colorlib:
             list: Returns a list of `numpy.ndarray`s with `R`, `G`, and `B` values.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "sRGB_to_RGB" # Name of this method
 
         # Input check
         if isinstance(gamma, float): gamma = np.asarray([gamma])
@@ -350,7 +365,7 @@ class colorlib:
             list: Returns a list of `numpy.ndarray`s with `R`, `G`, and `B` values.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "RGB_to_sRGB" # Name of this method
 
         # Input check
         if isinstance(gamma, float): gamma = np.asarray([gamma])
@@ -395,7 +410,7 @@ class colorlib:
             list of `numpy.ndarray`s of the same length as the inputs (`[X, Y, Z]`).
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "RGB_to_XYZ" # Name of this method
         n = len(R) # Number of colors
 
         # Loading definition of white
@@ -431,7 +446,7 @@ class colorlib:
             `numpy.ndarray`s of the same length as the inputs (`[R, G, B]`).
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "XYZ_to_RGB" # Name of this method
         n = len(X) # Number of colors
 
         # Loading definition of white
@@ -481,7 +496,7 @@ class colorlib:
     ##          Z]`).
     ##      """
 
-    ##      __fname__ = inspect.stack()[0][3] # Name of this method
+    ##      __fname__ = "sRGB_to_XYZ" # Name of this method
     ##      n = len(R) # Number of colors
 
     ##      # Loading definition of white
@@ -522,7 +537,7 @@ class colorlib:
     ##          of `numpy.ndarray`'s of the same length as the inputs (`[R, G, B]`).
     ##      """
 
-    ##      __fname__ = inspect.stack()[0][3] # Name of this method
+    ##      __fname__ = "XYZ_to_sRGB" # Name of this method
     ##      n = len(X) # Number of colors
 
     ##      # Loading definition of white
@@ -568,7 +583,7 @@ class colorlib:
             list of `numpy.ndarray`s of the same length as the inputs (`[X, Y, Z]`).
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "LAB_to_XYZ" # Name of this method
         n = len(L) # Number of colors
 
         # Loading definition of white
@@ -577,40 +592,29 @@ class colorlib:
         # Checking input
         self._check_input_arrays_(__fname__, L = L, A = A, B = B)
 
-        # Result arrays
-        X = np.ndarray(len(L), dtype = "float"); X[:] = 0.
-        Y = np.ndarray(len(L), dtype = "float"); Y[:] = 0.
-        Z = np.ndarray(len(L), dtype = "float"); Z[:] = 0.
+        L = np.asarray(L, dtype = "float")
 
         # Calculate Y
-        for i,val in np.ndenumerate(L):
-            if   val <= 0:    Y[i] = 0.
-            elif val <= 8.0:  Y[i] = val * YN[i] / self._KAPPA
-            elif val <= 100.: Y[i] = YN[i] * np.power((val + 16.) / 116., 3.)
-            else:             Y[i] = YN[i]
-
-        fy = np.ndarray(len(Y), dtype = "float")
-        for i,val in np.ndenumerate(Y):
-            if val <= (self._EPSILON * YN[i]):
-                fy[i] = (self._KAPPA / 116.) * val / YN[i] + 16. / 116.
-            else:
-                fy[i] = np.power(val / YN[i], 1. / 3.)
+        Y = np.where(L <= 0., 0.,
+            np.where(L <= 8., L * YN / self._KAPPA,
+            np.where(L <= 100., YN * np.power((L + 16.) / 116., 3.), YN)))
+
+        with np.errstate(invalid = "ignore", divide = "ignore"):
+            fy = np.where(Y <= (self._EPSILON * YN),
+                          (self._KAPPA / 116.) * Y / YN + 16. / 116.,
+                          np.power(Y / YN, 1. / 3.))
 
         # Calculate X
         fx = fy + (A / 500.)
-        for i,val in np.ndenumerate(fx):
-            if np.power(val, 3.) <= self._EPSILON:
-                X[i] = XN[i] * (val - 16. / 116.) / (self._KAPPA / 116.)
-            else:
-                X[i] = XN[i] * np.power(val, 3.)
+        X  = np.where(np.power(fx, 3.) <= self._EPSILON,
+                      XN * (fx - 16. / 116.) / (self._KAPPA / 116.),
+                      XN * np.power(fx, 3.))
 
         # Calculate Z
         fz = fy - (B / 200.)
-        for i,val in np.ndenumerate(fz):
-            if np.power(val, 3.) <= self._EPSILON:
-                Z[i] = ZN[i] * (val - 16. / 116.) / (self._KAPPA / 116.)
-            else:
-                Z[i] = ZN[i] * np.power(val, 3)
+        Z  = np.where(np.power(fz, 3.) <= self._EPSILON,
+                      ZN * (fz - 16. / 116.) / (self._KAPPA / 116.),
+                      ZN * np.power(fz, 3))
 
         return [X, Y, Z]
 
@@ -637,7 +641,7 @@ class colorlib:
             a list of `numpy.ndarray`s of the same length as the inputs (`[L, A, B]`).
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "XYZ_to_LAB" # Name of this method
         n = len(X) # Number of colors
 
         # Loading definition of white
@@ -648,12 +652,8 @@ class colorlib:
 
         # Support function
         def f(t, _KAPPA, _EPSILON):
-            for i,val in np.ndenumerate(t):
-                if val > _EPSILON:
-                    t[i] = np.power(val, 1./3.)
-                else:
-                    t[i] = (_KAPPA / 116.) * val + 16. / 116.
-            return t
+            with np.errstate(invalid = "ignore"):
+                return np.where(t > _EPSILON, np.power(t, 1./3.), (_KAPPA / 116.) * t + 16. / 116.)
 
         # Scaling
         xr = X / XN;
@@ -661,12 +661,8 @@ class colorlib:
         zr = Z / ZN;
 
         # Calculate L
-        L = np.ndarray(len(X), dtype = "float"); L[:] = 0.
-        for i,val in np.ndenumerate(yr):
-            if val > self._EPSILON:
-                L[i] = 116. * np.power(val, 1./3.) - 16.
-            else:
-                L[i] = self._KAPPA * val
+        with np.errstate(invalid = "ignore"):
+            L = np.where(yr > self._EPSILON, 116. * np.power(yr, 1./3.) - 16., self._KAPPA * yr)
 
         xt = f(xr, self._KAPPA, self._EPSILON);
         yt = f(yr, self._KAPPA, self._EPSILON);
@@ -704,7 +700,7 @@ class colorlib:
     ##         `numpy.ndarray`'s of the same length as the inputs (`[L, A, B]`).
     ##     """
 
-    ##     __fname__ = inspect.stack()[0][3] # Name of this method
+    ##     __fname__ = "XYZ_to_HLAB" # Name of this method
     ##     n = len(X) # Number of colors
 
     ##     # Loading definition of white
@@ -742,7 +738,7 @@ class colorlib:
     ##         `numpy.ndarray`'s of the same length as the inputs (`[X, Y, Z]`).
     ##     """
 
-    ##     __fname__ = inspect.stack()[0][3] # Name of this method
+    ##     __fname__ = "HLAB_to_XYZ" # Name of this method
     ##     n = len(L) # Number of colors
 
     ##     # Loading definition of white
@@ -785,17 +781,15 @@ class colorlib:
             `numpy.ndarray`s of the same length as the inputs (`[L, A, B]`).
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "LAB_to_polarLAB" # Name of this method
 
         # Checking input
         self._check_input_arrays_(__fname__, L = L, A = A, B = B)
 
         # Compute H
         H = self._RAD2DEG(np.arctan2(B, A))
-        for i,val in np.ndenumerate(H):
-            while val > 360.:   val -= 360.
-            while val <   0.:   val += 360.
-            H[i] = val
+        # arctan2 returns [-pi, pi], shift negative angles to [0, 360]
+        H = np.where(H < 0., H + 360., H)
         # Compute C
         C = np.sqrt(A * A + B * B)
 
@@ -818,7 +812,7 @@ class colorlib:
             `numpy.ndarray`s of the same length as the inputs (`[L, A, B]`).
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "polarLAB_to_LAB" # Name of this method
 
         # Checking input
         self._check_input_arrays_(__fname__, L = L, H = H, C = C)
@@ -850,38 +844,29 @@ class colorlib:
             the inputs.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "sRGB_to_HSV" # Name of this method
 
         # Checking input
         self._check_input_arrays_(__fname__, r = r, g = g, b = b)
 
-        # Support function
-        def gethsv(r, g, b):
-            x = np.min([r, g, b])
-            y = np.max([r, g, b])
-            if y != x:
-                f = g - b if r == x else b - r if g == x else r - g
-                i = 3. if r == x else 5. if g == x else 1.
-                h = 60. * (i - f /(y - x))
-                s = (y - x)/y
-                v = y
-            else:
-                h = 0.
-                s = 0.
-                v = y
-            return [h, s, v]
+        r = np.asarray(r, dtype = "float")
+        g = np.asarray(g, dtype = "float")
+        b = np.asarray(b, dtype = "float")
 
-        # Result arrays
-        h = np.ndarray(len(r), dtype = "float"); h[:] = 0.
-        s = np.ndarray(len(r), dtype = "float"); s[:] = 0.
-        v = np.ndarray(len(r), dtype = "float"); v[:] = 0.
+        # Minimum and maximum per color
+        x = np.minimum(np.minimum(r, g), b)
+        y = np.maximum(np.maximum(r, g), b)
 
-        # Calculate h/s/v
-        for i in range(0, len(r)):
-            tmp = gethsv(r[i], g[i], b[i])
-            h[i] = tmp[0]; s[i] = tmp[1]; v[i] = tmp[2]
+        # Colors with y == x (grays) have h = s = 0
+        idx = y != x
+        f = np.where(r == x, g - b, np.where(g == x, b - r, r - g))
+        i = np.where(r == x, 3., np.where(g == x, 5., 1.))
 
-        return [h, s, v]
+        with np.errstate(divide = "ignore", invalid = "ignore"):
+            h = np.where(idx, 60. * (i - f / (y - x)), 0.)
+            s = np.where(idx, (y - x) / y, 0.)
+
+        return [h, s, y]
 
 
     def HSV_to_sRGB(self, h, s, v):
@@ -901,46 +886,33 @@ class colorlib:
             the inputs.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "HSV_to_sRGB" # Name of this method
 
         # Checking input
         self._check_input_arrays_(__fname__, h = h, s = s, v = v)
 
-        # Support function
-        def getrgb(h, s, v):
-
-            # If Hue is not defined:
-            if h == np.nan: return np.repeat(v, 3)
-
-            # Convert to [0-6]
-            h = h / 60.
-            i = np.floor(h)
-            f = h - i
-
-            if (i % 2) == 0:  # if i is even 
-                f = 1 - f
-
-            m = v * (1 - s)
-            n = v * (1 - s * f)
-            if i in [0, 6]:    return [v, n, m]
-            elif i == 1:       return [n, v, m]
-            elif i == 2:       return [m, v, n]
-            elif i == 3:       return [m, n, v]
-            elif i == 4:       return [n, m, v]
-            elif i == 5:       return [v, m, n]
-            else:
-                raise Exception(f"ended up in a non-defined ifelse with i = {i:d}")
+        h = np.asarray(h, dtype = "float")
+        s = np.asarray(s, dtype = "float")
+        v = np.asarray(v, dtype = "float")
 
-        # Result arrays
-        r = np.ndarray(len(h), dtype = "float"); r[:] = 0.
-        g = np.ndarray(len(h), dtype = "float"); g[:] = 0.
-        b = np.ndarray(len(h), dtype = "float"); b[:] = 0.
+        # Convert to [0-6]
+        h = h / 60.
+        i = np.floor(h)
+        f = h - i
+        f = np.where((i % 2) == 0, 1. - f, f) # if i is even
 
-        for i in range(0,len(h)):
-           tmp = getrgb(h[i], s[i], v[i])
-           r[i] = tmp[0]; g[i] = tmp[1]; b[i] = tmp[2]
+        # Hue sectors must be within [0, 6]
+        bad = np.isfinite(i) & ((i < 0.) | (i > 6.))
+        if np.any(bad):
+            raise Exception(f"ended up in a non-defined ifelse with i = {int(i[bad][0]):d}")
 
-        return [r, g, b]
+        m = v * (1. - s)
+        n = v * (1. - s * f)
+
+        cond = [(i == 0.) | (i == 6.), i == 1., i == 2., i == 3., i == 4., i == 5.]
+        return [np.select(cond, [v, n, m, m, n, v], default = np.nan),   # r
+                np.select(cond, [n, v, v, n, m, m], default = np.nan),   # g
+                np.select(cond, [m, m, n, v, v, n], default = np.nan)]   # b
 
 
     # -------------------------------------------------------------------
@@ -964,45 +936,36 @@ class colorlib:
             the inputs.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "sRGB_to_HLS" # Name of this method
 
         # Checking input
         self._check_input_arrays_(__fname__, r = r, g = g, b = b)
 
-        # Support function
-        def gethls(r, g, b):
-            min = np.min([r, g, b])
-            max = np.max([r, g, b])
+        r = np.asarray(r, dtype = "float")
+        g = np.asarray(g, dtype = "float")
+        b = np.asarray(b, dtype = "float")
 
-            l = (max + min)/2.;
+        # Minimum and maximum per color
+        min = np.minimum(np.minimum(r, g), b)
+        max = np.maximum(np.maximum(r, g), b)
 
-            if max != min:
-                if   l <  0.5: s = (max - min) / (max + min)
-                elif l >= 0.5: s = (max - min) / (2. - max - min)
+        l = (max + min) / 2.
 
-                if r == max:  h = (g - b) / (max - min);
-                if g == max:  h = 2. + (b - r) / (max - min);
-                if b == max:  h = 4. + (r - g) / (max - min);
+        # Colors with max == min (grays) have h = s = 0
+        idx = max != min
+        with np.errstate(divide = "ignore", invalid = "ignore"):
+            s = np.where(l < 0.5, (max - min) / (max + min), (max - min) / (2. - max - min))
 
-                h = h * 60.;
-                if h < 0.:    h = h + 360.;
-                if h > 360.:  h = h - 360.;
-            else:
-                s = 0
-                h = 0;
+            # If multiple channels equal max, blue has priority over green over red
+            h = np.where(b == max, 4. + (r - g) / (max - min),
+                np.where(g == max, 2. + (b - r) / (max - min),
+                                   (g - b) / (max - min)))
 
-            return [h, l, s]
+        h = h * 60.
+        h = np.where(h < 0.,   h + 360., h)
+        h = np.where(h > 360., h - 360., h)
 
-        # Result arrays
-        h = np.ndarray(len(r), dtype = "float"); h[:] = 0.
-        l = np.ndarray(len(r), dtype = "float"); l[:] = 0.
-        s = np.ndarray(len(r), dtype = "float"); s[:] = 0.
-
-        for i in range(0,len(h)):
-           tmp = gethls(r[i], g[i], b[i])
-           h[i] = tmp[0]; l[i] = tmp[1]; s[i] = tmp[2]
-
-        return [h, l, s]
+        return [np.where(idx, h, 0.), l, np.where(idx, s, 0.)]
 
 
     def HLS_to_sRGB(self, h, l, s):
@@ -1021,33 +984,23 @@ class colorlib:
             the inputs.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "HLS_to_sRGB" # Name of this method
 
         # Checking input
         self._check_input_arrays_(__fname__, h = h, l = l, s = s)
 
-        # Support function
-        def getrgb(h, l, s):
-            p2 = l * (1. + s) if l <= 0.5 else l + s - (l * s)
-            p1 = 2 * l - p2
-
-            # If saturation is zero
-            if (s == 0):    return np.repeat(l, 3)
-            # Else
-            return [self._qtrans(p1, p2, h + 120.),   # r
-                    self._qtrans(p1, p2, h),          # g
-                    self._qtrans(p1, p2, h - 120.)]   # b
-
-        # Result arrays
-        r = np.ndarray(len(h), dtype = "float"); r[:] = 0.
-        g = np.ndarray(len(h), dtype = "float"); g[:] = 0.
-        b = np.ndarray(len(h), dtype = "float"); b[:] = 0.
+        h = np.asarray(h, dtype = "float")
+        l = np.asarray(l, dtype = "float")
+        s = np.asarray(s, dtype = "float")
 
-        for i in range(0,len(r)):
-           tmp = getrgb(h[i], l[i], s[i])
-           r[i] = tmp[0]; g[i] = tmp[1]; b[i] = tmp[2]
+        p2 = np.where(l <= 0.5, l * (1. + s), l + s - (l * s))
+        p1 = 2 * l - p2
 
-        return [r, g, b]
+        # If saturation is zero r = g = b = l
+        idx = s == 0
+        return [np.where(idx, l, self._qtrans(p1, p2, h + 120.)),   # r
+                np.where(idx, l, self._qtrans(p1, p2, h)),          # g
+                np.where(idx, l, self._qtrans(p1, p2, h - 120.))]   # b
 
 
     # -------------------------------------------------------------------
@@ -1070,7 +1023,7 @@ class colorlib:
             list: Returns a list of `numpy.ndarray`s (`[u, v]`). 
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "XYZ_to_uv" # Name of this method
 
         # Checking input
         self._check_input_arrays_(__fname__, X = X, Y = Y, Z = Z)
@@ -1110,7 +1063,7 @@ class colorlib:
             a list of `numpy.ndarray`s of the same length as the inputs (`[L, U, V]`).
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "XYZ_to_LUV" # Name of this method
         n = len(X) # Number of colors
 
         # Loading definition of white
@@ -1124,10 +1077,9 @@ class colorlib:
         [uN, vN] = self.XYZ_to_uv(XN, YN, ZN)
 
         # Calculate L
-        L = np.ndarray(len(X), dtype = "float"); L[:] = 0.
         y = Y / YN
-        for i,val in np.ndenumerate(y):
-            L[i] = 116. * np.power(val, 1./3.) - 16. if val > self._EPSILON else self._KAPPA * val
+        with np.errstate(invalid = "ignore"):
+            L = np.where(y > self._EPSILON, 116. * np.power(y, 1./3.) - 16., self._KAPPA * y)
 
         # Calculate U/V
         return [L, 13. * L * (u - uN), 13. * L * (v - vN)]  # [L, U, V]
@@ -1155,7 +1107,7 @@ class colorlib:
             a list of `numpy.ndarray`s of the same length as the inputs (`[L, A, B]`).
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "LUV_to_XYZ" # Name of this method
         n = len(L) # Number of colors
 
         # Loading definition of white
@@ -1164,27 +1116,20 @@ class colorlib:
         # Checking input
         self._check_input_arrays_(__fname__, L = L, U = U, V = V)
 
-        # Result arrays
-        X = np.ndarray(len(L), dtype = "float"); X[:] = 0.
-        Y = np.ndarray(len(L), dtype = "float"); Y[:] = 0.
-        Z = np.ndarray(len(L), dtype = "float"); Z[:] = 0.
+        L = np.asarray(L, dtype = "float")
+        U = np.asarray(U, dtype = "float")
+        V = np.asarray(V, dtype = "float")
 
-        # Check for which values we do have to do the transformation
-        def fun(L, U, V):
-            return False if L <= 0. and U == 0. and V == 0. else True
-        idx = np.where([fun(L[i], U[i], V[i]) for i in range(0, len(L))])[0]
-        if len(idx) == 0: return [X, Y, Z]
+        # Black (L <= 0 and U == V == 0) is not transformed, X = Y = Z = 0
+        idx = ~((L <= 0.) & (U == 0.) & (V == 0.))
 
         # Compute Y
-        for i in idx:
-            Y[i] = YN[i] * (np.power((L[i] + 16.)/116., 3.) if L[i] > 8. else L[i] / self._KAPPA)
+        Y = np.where(L > 8., np.power((L + 16.) / 116., 3.), L / self._KAPPA)
+        Y = np.where(idx, YN * Y, 0.)
 
-        # Calculate X/Z
-        from numpy import finfo, fmax
-
-        # Avoiding division by zero
+        # Calculate X/Z; avoiding division by zero
         eps = np.finfo(float).eps*10
-        L = fmax(eps, L)
+        L = np.fmax(eps, L)
 
         [uN, vN] = self.XYZ_to_uv(XN, YN, ZN)
         u = U / (13. * L) + uN
@@ -1216,17 +1161,15 @@ class colorlib:
             also known as `[H, C, L]` coordinates.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "LUV_to_polarLUV" # Name of this method
 
         self._check_input_arrays_(__fname__, L = L, U = U, V = V)
 
         # Calculate polarLUV coordinates
         C = np.sqrt(U * U + V * V)
         H = self._RAD2DEG(np.arctan2(V, U))
-        for i,val in np.ndenumerate(H):
-            while val > 360: val -= 360.
-            while val < 0.:  val += 360.
-            H[i] = val
+        # arctan2 returns [-pi, pi], shift negative angles to [0, 360]
+        H = np.where(H < 0., H + 360., H)
 
         return [L, C, H]
 
@@ -1247,7 +1190,7 @@ class colorlib:
             `numpy.ndarray`s of the same length as the inputs (`[L, U, V]`).
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "polarLUV_to_LUV" # Name of this method
 
         # Checking input
         self._check_input_arrays_(__fname__, L = L, C = C, H = H)
@@ -1274,68 +1217,41 @@ class colorlib:
             list: A list with hex color str.
         """
 
-        # Color fixup: limit r/g/b to [0-1]
-        def rgbfixup(r, g, b):
-            def fun(x):
-                return np.asarray([np.max([0, np.min([1, e])]) \
-                       if np.isfinite(e) else np.nan for e in x])
-            return [fun(r), fun(g), fun(b)]
-
-        def rgbcleanup(r, g, b):
-            def fun(x):
-                tol = 1. / (2 * 255.)
-                # Allow tiny correction close to 0. and 1.
-                x[np.logical_and(x < 0.0, x >= -tol)] = 0.0
-                x[np.logical_and(x > 1.0, x <= 1.0 + tol)] = 1.0
-                return np.asarray([e if np.logical_and(e >= 0., e <= 1.)
-                       else np.nan for e in x])
-            return [fun(r), fun(g), fun(b)]
-
-        # Checking which r/g/b values are outside limits.
-        # This only happens if fixup = FALSE.
-        def validrgb(r, g, b):
-            idxr = np.isfinite(r)
-            idxg = np.isfinite(g)
-            idxb = np.isfinite(b)
-            return np.where(idxr * idxg * idxb)[0]
-
-        # Support function to create hex coded colors
-        def gethex(r, g, b):
-
-            # Converts int to hex string
-            def applyfun(x):
-                x = np.asarray(x * 255. + .5, dtype = int)
-                return f"#{x[0]:02X}{x[1]:02X}{x[2]:02X}"
-
-            h = np.vstack([r,g,b]).transpose().flatten().reshape([len(r), 3])
-            return np.apply_along_axis(applyfun, 1, h)
-
-        # Let's do the conversion!
-        if fixup: [r, g, b] = rgbfixup(r, g, b)
-        else:     [r, g, b] = rgbcleanup(r, g, b)
-
-        # Create return array
-        res = np.ndarray(len(r), dtype = "|S7"); res[:] = ""
-
-        # Check valid r/g/b coordinates
-        valid = validrgb(r, g, b)
-        if len(valid) > 0:
-            # Convert valid colors to hex
-            res[valid] = gethex(r[valid], g[valid], b[valid])
-
-        # Create return list with NAN's for invalid colors
-        res = [None if len(x) == 0 else x.decode() for x in res]
-
-        # Return numpy array
-        return np.asarray(res)
+        rgb = np.vstack([np.asarray(r, dtype = float),
+                         np.asarray(g, dtype = float),
+                         np.asarray(b, dtype = float)])
+
+        # Checking which r/g/b values are valid. With fixup = True all finite
+        # values are valid and limited to [0-1], else only values within [0-1]
+        # (allowing for a tiny correction close to 0. and 1.).
+        with np.errstate(invalid = "ignore"):
+            if fixup:
+                valid = np.all(np.isfinite(rgb), axis = 0)
+            else:
+                tol   = 1. / (2 * 255.)
+                valid = np.all((rgb >= -tol) & (rgb <= 1. + tol), axis = 0)
+        rgb = np.clip(np.where(valid, rgb, 0.), 0., 1.)
+
+        # Converting to int [0-255], creating hex colors
+        res = self._hex_encode_(np.floor(rgb * 255. + .5))
+
+        # Return numpy array with None for invalid colors
+        if len(res) == 0:
+            return np.asarray([])
+        elif not np.all(valid):
+            res = res.astype(object)
+            res[~valid] = None
+        return res
 
     def hex_to_sRGB(self, hex_, gamma = 2.4):
         """Convert Hex Colors to Standard RGB (sRGB)
 
-        Convert one (or multiple) hex colors to sRGB.
+        Convert one (or multiple) hex colors to sRGB. Three, six, and eight
+        digit hex colors are decoded (alpha is ignored), invalid hex colors
+        and `None` result in `numpy.nan`.
 
         Args:
-            hex_ (str, list of str): hex color str or list of str.
+            hex_ (str, list of str, numpy.ndarray): hex color str or list of str.
             gamma (float): Gamma correction factor, defaults to `2.4`.
 
         Returns:
@@ -1343,39 +1259,100 @@ class colorlib:
             red, green, and blue intensities (`[r, g, b]`), all in `[0., 1.]`.
         """
 
-        if isinstance(hex_,str): hex_ = [hex_]
-        hex_ = np.asarray(hex_)
+        # Decoding hex colors; invalid colors (and None) result in NaN
+        [rgb, alpha, valid, isnone] = self._hex_decode_(hex_)
+        rgb = np.where(valid, rgb / 255., np.nan)
+
+        return [rgb[0], rgb[1], rgb[2]]
 
-        # Check for valid hex colors
-        def validhex(hex_):
-            from re import compile
-            pat = compile("^#[0-9A-Fa-f]{6}([0-9]{2})?$")
-            from re import match
-            return np.where([None if x is None else pat.match(x) is not None for x in hex_])[0]
+    def _hex_encode_(self, rgb, alpha = None):
+        """Encode Hex Colors
 
-        # Convert hex to rgb
-        def getrgb(x):
-            def applyfun(x):
-                return np.asarray([int(x[i:i+2], 16) for i in (1, 3, 5)])
-            rgb = [applyfun(e) for e in x]
-            rgb = np.vstack(rgb).transpose().flatten().reshape([3,len(x)])
-            return [rgb[0] / 255., rgb[1] / 255., rgb[2] / 255.]
+        Creates hex colors by looking up the hex digits (`_HEXDIGITS_`) on a
+        byte buffer of fixed width (`#RRGGBB` or `#RRGGBBAA`).
 
-        # Result arrays
-        r = np.ndarray(len(hex_), dtype = "float"); r[:] = np.nan 
-        g = np.ndarray(len(hex_), dtype = "float"); g[:] = np.nan 
-        b = np.ndarray(len(hex_), dtype = "float"); b[:] = np.nan 
+        Args:
+            rgb (numpy.ndarray): Array of shape `(3, N)` with red, green,
+                and blue intensities as integers in `[0, 255]`.
+            alpha (None, numpy.ndarray): `None` (default) or array of length
+                `N` with the alpha channel as integers in `[0, 255]`. Negative
+                values indicate 'no alpha' for the specific color.
+
+        Returns:
+            numpy.ndarray: Array of hex color str (upper case).
+        """
+        rgb = np.asarray(rgb).astype(np.uint8).transpose()
+        width = 7 if alpha is None else 9
+
+        buf = np.zeros((rgb.shape[0], width), dtype = np.uint8)
+        buf[:, 0]      = ord("#")
+        buf[:, 1:7:2]  = self._HEXDIGITS_[rgb >> 4]
+        buf[:, 2:7:2]  = self._HEXDIGITS_[rgb & 15]
+        if alpha is not None:
+            alpha = np.asarray(alpha)
+            tmp   = np.where(alpha >= 0, alpha, 0).astype(np.uint8)
+            # Trailing zero bytes are dropped when converting to str
+            buf[:, 7] = np.where(alpha >= 0, self._HEXDIGITS_[tmp >> 4], 0)
+            buf[:, 8] = np.where(alpha >= 0, self._HEXDIGITS_[tmp & 15], 0)
+
+        return buf.view(f"|S{width}").ravel().astype(f"<U{width}")
+
+    def _hex_decode_(self, hex_):
+        """Decode Hex Colors
+
+        Decodes all hex colors at once. The str are stored in a fixed-width
+        array, the character codes of which are translated into hex digit values
+        via a lookup table (`_HEXVALUES_`). Validates the colors, expands three
+        digit hex colors and extracts the alpha channel of eight digit hex colors
+        in the same pass.
+
+        Args:
+            hex_ (str, list, numpy.ndarray): Hex color str or list/array of str
+                and `None`.
 
-        # Check valid hex colors
-        valid = validhex(hex_)
-        if not len(valid) == 0:
-            # Decode valid hex strings
-            rgb = getrgb(hex_[valid])
-            r[valid] = rgb[0]
-            g[valid] = rgb[1]
-            b[valid] = rgb[2]
+        Returns:
+            list: List of four `numpy.ndarray`s; the red, green, and blue
+            intensities as integers in `[0, 255]` (shape `(3, N)`), alpha
+            (`[0, 255]`, `-1` if not defined), and two bool arrays indicating
+            valid hex colors and `None` entries. Coordinates of invalid
+            colors are set to `0`.
+        """
 
-        return [r, g, b]
+        if isinstance(hex_, str): hex_ = [hex_]
+        if isinstance(hex_, np.ndarray) and hex_.dtype.kind == "U":
+            hex_   = np.ascontiguousarray(hex_.ravel())
+            isnone = np.zeros(len(hex_), dtype = bool)
+        else:
+            hex_   = np.asarray(hex_, dtype = object).ravel()
+            isnone = np.equal(hex_, None)
+            hex_   = np.where(isnone, "", hex_).astype("U")
+
+        n     = len(hex_)
+        rgb   = np.zeros((3, n), dtype = np.int16)
+        alpha = np.full(n, -1, dtype = np.int16)
+        if n == 0: return [rgb, alpha, np.zeros(0, dtype = bool), isnone]
+
+        # Character codes (UCS4) of the first nine characters, translated
+        # into hex digit values (-1 for non-hex-digits, including padding).
+        codes = hex_.view(np.uint32).reshape(n, -1)
+        nchar = np.count_nonzero(codes, axis = 1)
+        if codes.shape[1] < 9:
+            codes = np.pad(codes, ((0, 0), (0, 9 - codes.shape[1])))
+        codes = codes[:, :9]
+        d     = self._HEXVALUES_[np.where(codes < 128, codes, 0)]
+
+        # Valid: "#" followed by 3, 6, or 8 hex digits
+        used  = np.arange(1, 9) < nchar[:, np.newaxis]
+        valid = (codes[:, 0] == ord("#")) & np.isin(nchar, (4, 7, 9)) & \
+                np.all((d[:, 1:] >= 0) | ~used, axis = 1)
+
+        # Three digit hex colors use each digit twice
+        short = (nchar == 4)[:, np.newaxis]
+        tmp   = np.where(short, d[:, 1:4] * 17, d[:, 1:7:2] * 16 + d[:, 2:7:2])
+        rgb   = np.where(valid, tmp.transpose(), 0).astype(np.int16)
+        alpha = np.where(valid & (nchar == 9), d[:, 7] * 16 + d[:, 8], -1).astype(np.int16)
+
+        return [rgb, alpha, valid, isnone]
 
 
     # -------------------------------------------------------------------
@@ -1397,40 +1374,35 @@ class colorlib:
             the inputs.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "RGB_to_HLS" # Name of this method
 
         # Checking input
         self._check_input_arrays_(__fname__, r = r, g = g, b = b)
 
-        # Create 2d numpy array where the first dimension corresponds
-        # to specific colors, the second one to [r, g, b] of that color.
-        tmp = np.transpose(np.stack((r, g, b)))
-
-        def gethls(x):
-            """x is expected to be a numpy array of length 3 with [r, g, b] coordinates."""
-
-            mn = np.min(x)
-            mx = np.max(x)
+        r = np.asarray(r, dtype = "float")
+        g = np.asarray(g, dtype = "float")
+        b = np.asarray(b, dtype = "float")
 
-            # If minimum equals maximum we know the solution already
-            if mn == mx:        return [0., mn, 0.] # [h, l, s]
+        mn = np.minimum(np.minimum(r, g), b)
+        mx = np.maximum(np.maximum(r, g), b)
 
-            # Else do the calculations
-            l = (mn + mx) / 2.
-            s = (mx - mn) / (mx + mn) if l < 0.5 else (mx - mn) / (2. - mx - mn)
+        # If minimum equals maximum we know the solution already (h = s = 0)
+        idx = mn != mx
 
-            # x[0] is 'r', x[1] = 'g', x[2] = 'b'
-            if x[0] == mx:      h = 60. * (x[1] - x[2]) / (mx - mn)
-            elif x[1] == mx:    h = 60. * (2. + (x[2] - x[0]) / (mx - mn))
-            else:               h = 60. * (4. + (x[0] - x[1]) / (mx - mn))
+        # Else do the calculations
+        l = (mn + mx) / 2.
+        with np.errstate(divide = "ignore", invalid = "ignore"):
+            s = np.where(l < 0.5, (mx - mn) / (mx + mn), (mx - mn) / (2. - mx - mn))
 
-            if h < 0.:          h = h + 360.
-            elif h > 360.:      h = h - 360.
+            # If multiple channels equal mx, red has priority over green over blue
+            h = np.where(r == mx, 60. * (g - b) / (mx - mn),
+                np.where(g == mx, 60. * (2. + (b - r) / (mx - mn)),
+                                  60. * (4. + (r - g) / (mx - mn))))
 
-            return [h, l, s]
+        h = np.where(h < 0.,   h + 360., h)
+        h = np.where(h > 360., h - 360., h)
 
-
-        return np.transpose([gethls(x) for x in tmp])
+        return [np.where(idx, h, 0.), l, np.where(idx, s, 0.)]
 
 
     # -------------------------------------------------------------------
@@ -1452,30 +1424,23 @@ class colorlib:
             the inputs.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "HLS_to_RGB" # Name of this method
 
         # Checking input
         self._check_input_arrays_(__fname__, h = h, l = l, s = s)
 
-        # Create 2d numpy array where the first dimension corresponds
-        # to specific colors, the second one to [r, g, b] of that color.
-        tmp = np.transpose(np.stack((h, l, s)))
-
-        def getrgb(x):
-            """x is expected to be a numpy array of length 3 with [h, l, s] coordinates."""
-
-            # If saturation equals zero, return [l, l, l]
-            if x[2] == 0.: return [x[1], x[1], x[1]]
+        h = np.asarray(h, dtype = "float")
+        l = np.asarray(l, dtype = "float")
+        s = np.asarray(s, dtype = "float")
 
-            # x[0] = 'h', x[1] = 'l', x[2] = 's'
-            p2 = x[1] * (1 + x[2]) if x[1] <= 0.5 else x[1] + x[2] - (x[1] * x[2])
-            p1 = 2 * x[1] - p2
+        p2 = np.where(l <= 0.5, l * (1 + s), l + s - (l * s))
+        p1 = 2 * l - p2
 
-            return [self._qtrans(p1, p2, x[0] + 120.),
-                    self._qtrans(p1, p2, x[0]),
-                    self._qtrans(p1, p2, x[0] - 120.)]
-
-        return np.transpose([getrgb(x) for x in tmp])
+        # If saturation equals zero, return [l, l, l]
+        idx = s == 0.
+        return [np.where(idx, l, self._qtrans(p1, p2, h + 120.)),
+                np.where(idx, l, self._qtrans(p1, p2, h)),
+                np.where(idx, l, self._qtrans(p1, p2, h - 120.))]
 
     # -------------------------------------------------------------------
     # Direct conversion ('shortcut') from RGB to HSV
@@ -1496,32 +1461,30 @@ class colorlib:
             the inputs.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "RGB_to_HSV" # Name of this method
 
         # Checking input
         self._check_input_arrays_(__fname__, r = r, g = g, b = b)
 
-        # Create 2d numpy array where the first dimension corresponds
-        # to specific colors, the second one to [r, g, b] of that color.
-        tmp = np.transpose(np.stack((r, g, b)))
-
-        def gethsv(x):
-            """x is expected to be a numpy array of length 3 with [r, g, b] coordinates."""
-
-            mn = np.min(x)
-            mx = np.max(x)
+        r = np.asarray(r, dtype = "float")
+        g = np.asarray(g, dtype = "float")
+        b = np.asarray(b, dtype = "float")
 
-            # If minimum equals maximum we know the solution already
-            if mn == mx:        return [0., 0., mx] # [h, s, v]
+        mn = np.minimum(np.minimum(r, g), b)
+        mx = np.maximum(np.maximum(r, g), b)
 
-            # Else calculate new dimensions
-            f = (x[1] - x[2]) if x[0] == mn else x[2] - x[0] if x[1] == mn else x[0] - x[1]
-            i = 3. if x[0] == mn else 5. if x[1] == mn else 1.
+        # If minimum equals maximum we know the solution already (h = s = 0)
+        idx = mn != mx
 
-            # Returning [h, s, v]
-            return [60. * (i - f / (mx - mn)),  (mx - mn) / mx,  mx]
+        # Else calculate new dimensions
+        f = np.where(r == mn, g - b, np.where(g == mn, b - r, r - g))
+        i = np.where(r == mn, 3., np.where(g == mn, 5., 1.))
 
-        return np.transpose([gethsv(x) for x in tmp])
+        # Returning [h, s, v]
+        with np.errstate(divide = "ignore", invalid = "ignore"):
+            return [np.where(idx, 60. * (i - f / (mx - mn)), 0.),
+                    np.where(idx, (mx - mn) / mx, 0.),
+                    mx]
 
 
     # -------------------------------------------------------------------
@@ -1543,34 +1506,127 @@ class colorlib:
             the inputs.
         """
 
-        __fname__ = inspect.stack()[0][3] # Name of this method
+        __fname__ = "HSV_to_RGB" # Name of this method
 
         # Checking input
         self._check_input_arrays_(__fname__, h = h, s = s, v = v)
 
-        # Create 2d numpy array where the first dimension corresponds
-        # to specific colors, the second one to [r, g, b] of that color.
-        tmp = np.transpose(np.stack((h, s, v)))
+        h = np.asarray(h, dtype = "float")
+        s = np.asarray(s, dtype = "float")
+        v = np.asarray(v, dtype = "float")
 
-        def getrgb(x):
-            """x is expected to be a numpy array of length 3 with [h, s, v] coordinates."""
+        h = h / 60.       # Convert to [0, 6]
+        i = np.floor(h)
+        f = h - i
+        f = np.where(i % 2 == 0, 1. - f, f)  # if i is even
 
-            h = x[0] / 60.       # Convert to [0, 6]
-            i = np.int8(np.floor(h))
-            f = h - i
-            if i % 2 == 0:    f = 1. - f  # if i is even
+        # Hue sectors must be within [0, 6]
+        bad = np.isfinite(i) & ((i < 0.) | (i > 6.))
+        if np.any(bad):
+            raise Exception(f"ended up in a non-defined ifelse with i = {int(i[bad][0]):d}")
 
-            m = x[2] * (1. - x[1])
-            n = x[2] * (1. - x[1] * f)
+        m = v * (1. - s)
+        n = v * (1. - s * f)
+
+        cond = [(i == 0.) | (i == 6.), i == 1., i == 2., i == 3., i == 4., i == 5.]
+        return [np.select(cond, [v, n, m, m, n, v], default = np.nan),
+                np.select(cond, [n, v, v, n, m, m], default = np.nan),
+                np.select(cond, [m, m, n, v, v, n], default = np.nan)]
+
+
+# -------------------------------------------------------------------
+# Packed storage of the color coordinates (used as colorobject._data_)
+# -------------------------------------------------------------------
+class _packedcoords_(MutableMapping):
+    """Packed Color Coordinates
+
+    Dict-like container used to store the coordinates of a
+    :py:class:`colorobject` (attribute `_data_`). All numeric dimensions
+    (including alpha, if defined) are stored in one contiguous `numpy.ndarray`
+    of shape `(N, k)` (attribute `buffer`, one column per dimension); indexing
+    returns a view on the corresponding column. Non-numeric dimensions (the hex
+    colors of :py:class:`hexcols`) and `None` are stored as they are.
+
+    Args:
+        data (None, dict): Dictionary with the dimensions (names) and
+            `numpy.ndarray`s (or `None`), all of the same length.
+
+    Raises:
+        ValueError: If the number of values does not match the length of the
+            dimensions already stored.
+    """
 
-            if i == 0 or i == 6:   return [x[2], n, m]
-            elif i == 1:           return [n, x[2], m]
-            elif i == 2:           return [m, x[2], n]
-            elif i == 3:           return [m, n, x[2]]
-            elif i == 4:           return [n, m, x[2]]
-            elif i == 5:           return [x[2], m, n]
+    def __init__(self, data = None):
+        data = {} if data is None else dict(data)
 
-        return np.transpose([getrgb(x) for x in tmp])
+        self._keys_  = list(data.keys())
+        self._other_ = {k: v for k, v in data.items() if not self._isnumeric_(v)}
+        self.names   = [k for k in self._keys_ if not k in self._other_]
+        """List of dimensions stored in the (columns of the) buffer."""
+
+        n = None if len(self.names) == 0 else len(data[self.names[0]])
+        self.buffer = np.empty((0 if n is None else n, len(self.names)), dtype = np.float64)
+        """`numpy.ndarray` of shape `(N, k)` with all numeric coordinates."""
+        for i, k in enumerate(self.names):
+            if not len(data[k]) == n:
+                raise ValueError("dimensions stored on a color object must be of the same length")
+            self.buffer[:, i] = data[k]
+
+    @staticmethod
+    def _isnumeric_(x):
+        return isinstance(x, np.ndarray) and x.ndim == 1 and x.dtype.kind in "biuf"
+
+    def __getitem__(self, key):
+        if key in self._other_: return self._other_[key]
+        elif key in self.names: return self.buffer[:, self.names.index(key)]
+        raise KeyError(key)
+
+    def __setitem__(self, key, val):
+        if not self._isnumeric_(val):
+            if key in self.names: del self[key]
+            if not key in self._keys_: self._keys_.append(key)
+            self._other_[key] = val
+        elif len(self.names) > 0 and not len(val) == self.buffer.shape[0]:
+            raise ValueError("dimensions stored on a color object must be of the same length")
+        elif key in self.names:
+            self.buffer[:, self.names.index(key)] = val
+        else:
+            # New numeric dimension; append column
+            if key in self._other_: del self._other_[key]
+            if not key in self._keys_: self._keys_.append(key)
+            val = np.asarray(val, dtype = np.float64).reshape(-1, 1)
+            self.buffer = np.hstack([self.buffer, val]) if len(self.names) > 0 else val.copy()
+            self.names.append(key)
+
+    def __delitem__(self, key):
+        if key in self._other_:
+            del self._other_[key]
+        elif key in self.names:
+            i = self.names.index(key)
+            self.buffer = np.delete(self.buffer, i, axis = 1)
+            del self.names[i]
+        else:
+            raise KeyError(key)
+        self._keys_.remove(key)
+
+    def _take_(self, key):
+        """Subset of colors (rows; copies) given an index, slice, or mask."""
+        res = _packedcoords_()
+        res._keys_   = list(self._keys_)
+        res._other_  = {k: None if v is None else np.array(np.asarray(v)[key])
+                        for k, v in self._other_.items()}
+        res.names    = list(self.names)
+        res.buffer   = np.array(self.buffer[key]) if len(self.names) > 0 else self.buffer.copy()
+        return res
+
+    def __iter__(self):
+        return iter(list(self._keys_))
+
+    def __len__(self):
+        return len(self._keys_)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
 
 
 # -------------------------------------------------------------------
@@ -1723,29 +1779,59 @@ class colorobject:
         return self.colors(fixup = fixup, rev = rev)
 
     def __iter__(self):
-        self.n = -1
-        return self
-
-    def __next__(self):
-        if self.n < (self.length() - 1):
-            self.n += 1
-            res = self[self.n]
-            return res
-        else:
-            raise StopIteration
+        # One color object (of length 1) per color
+        for i in range(self.length()):
+            yield self[i]
 
     def __getitem__(self, key):
-        if not isinstance(key, int):
-            raise TypeError("argument `key` must be int (index)")
+        """Subsetting Colors
+
+        Returns a new color object of the same class containing the
+        selected colors only. The coordinates of the new object are
+        (cheap) copies, modifying them does not affect the original object.
+
+        Args:
+            key (int, slice, list, numpy.ndarray): Index of a single color (the
+                result is an object with one color), a slice, an array of
+                int (index), or a boolean array (mask) of length `N`.
+
+        Returns:
+            colorobject: Object of the same class as the original object.
+
+        Example:
+
+            >>> from colorspace import hexcols
+            >>> cols = hexcols(["#000000", "#ff0000", "#00ff00", "#0000ff"])
+            >>> cols[1]
+            >>> #:
+            >>> cols[1:3]
+            >>> #:
+            >>> cols[[3, 0]]
+            >>> #:
+            >>> cols[[True, False, False, True]]
 
-        from copy import deepcopy
-        from numpy import array, newaxis
-        res = deepcopy(self)
-        for n in list(res._data_.keys()):
-            # If None: keep it as it is, else subset
-            if res._data_[n] is None: continue
-            res._data_[n] = res._data_[n][newaxis, key]
+        Raises:
+            TypeError: If `key` is not of one of the allowed types.
+            IndexError: If the index is out of range or the mask is of wrong length.
+        """
+        from copy import copy
 
+        if isinstance(key, (int, np.integer)) and not isinstance(key, bool):
+            key = [key]
+        elif isinstance(key, (list, np.ndarray)):
+            key = np.asarray(key)
+            if len(key) == 0:
+                key = key.astype(int)
+            elif key.dtype == bool and not (key.ndim == 1 and len(key) == self.length()):
+                raise IndexError("boolean index (mask) must be of length " + \
+                                 f"{self.length()} (number of colors)")
+            elif not key.ndim == 1 or not key.dtype.kind in "biu":
+                raise TypeError("argument `key` must be int, slice, or an array of int or bool")
+        elif not isinstance(key, slice):
+            raise TypeError("argument `key` must be int, slice, or an array of int or bool")
+
+        res = copy(self)
+        res._data_ = self._data_._take_(key)
         return res
 
 
@@ -1820,25 +1906,243 @@ class colorobject:
         return
 
 
-    def _transform_via_path_(self, via, fixup):
-        """Transform Colors along Path
+    def _transform_(self, to, fixup):
+        """Transform Colors along the Shortest Path
 
         Helper function to transform a colorobject into a new color
-        space. Calls the :py:func:`to` method one or multiple times along 'a path'
-        as specified by `via`.
+        space. Looks up the (cached) compiled shortest path through the
+        conversion graph (see :py:func:`_compile_conversion_`) and applies
+        all steps directly on the coordinates. The coordinates and the class
+        of the object are only replaced once, at the very end.
 
         Returns:
             No return, converts the current color space object (see method :py:func:`to`).
 
         Args:
-            via (list of str): The path via which the current color object
-                should be transformed. For example: A :py:class:`hexcols`
-                object can be transformed into CIEXYZ by specifying
-                `via = ["sRGB", "RGB", "CIEXYZ"]`.
+            to (str): Name of the target color space (see :py:func:`to`).
             fixup (bool): Whether or not to correct invalid rgb values outside
                 `[0., 1.]` if necessary
+
+        Raises:
+            Exception: If the conversion is ambiguous or not possible.
+        """
+        from_  = self.__class__.__name__
+        target = _SPACE_ALIASES_.get(to, to)
+
+        # Nothing to do (converted to itself)
+        if target == from_:
+            return
+        self._check_ambiguous_(target)
+
+        coords = self._convert_coords_(target, fixup)
+        if coords is None:
+            self._cannot(from_, to)
+
+        self._replace_coords_(target, coords)
+
+    def _check_ambiguous_(self, to):
+        """Check for Ambiguous Conversion
+
+        Helper function raising the same exception as :py:func:`to` if
+        converting the colors into `to` is ambiguous (see `_is_ambiguous_`).
+        Used wherever coordinates are converted via `_convert_coords_`
+        (which does not check for ambiguity).
+
+        Args:
+            to (str): Name of the target color space (class name).
+
+        Raises:
+            Exception: If the conversion is ambiguous.
+        """
+        from_ = self.__class__.__name__
+        if _is_ambiguous_(from_, to):
+            self._ambiguous(from_, to)
+
+    def _replace_coords_(self, to, coords):
+        """Replace Coordinates
+
+        Helper function replacing the coordinates of the object by new
+        coordinates in color space `to` (class name), keeping alpha. The
+        coordinates are stored in a new buffer, shallow copies of the
+        object (sharing the coordinates) are not affected.
+
+        Args:
+            to (str): Name of the color space of `coords` (class name).
+            coords (list): List of `numpy.ndarray`s with the coordinates in
+                the order given by `_SPACE_DIMS_`.
+        """
+        res   = dict(zip(_SPACE_DIMS_[to], coords))
+        alpha = self._data_.get("alpha")
+        if alpha is not None: res["alpha"] = alpha
+        self._data_ = _packedcoords_(res)
+        self.__class__ = _SPACE_CLASSES_[to]
+
+    def _convert_coords_(self, to, fixup = True, coords = None, from_ = None):
+        """Convert Coordinates
+
+        Helper function returning the coordinates of the colors converted
+        into another color space without modifying the object itself
+        (see :py:func:`_compile_conversion_`), using the white point and gamma
+        of the object. Does not check whether the conversion is ambiguous.
+
+        Args:
+            to (str): Name of the target color space (class name).
+            fixup (bool): Whether or not to correct invalid rgb values outside
+                `[0., 1.]` if necessary
+            coords (None, list): If `None` (default) the coordinates of the
+                object are converted, else a list of `numpy.ndarray`s with
+                coordinates in color space `from_`.
+            from_ (None, str): Name of the color space of `coords`.
+
+        Returns:
+            list, None: List of `numpy.ndarray`s with the coordinates in the
+            order given by `_SPACE_DIMS_`, `None` if there is no conversion.
+        """
+        if coords is None:
+            from_  = self.__class__.__name__
+            coords = [self._data_[x] for x in _SPACE_DIMS_[from_]]
+
+        # Views on the packed coordinates; the colorlib methods do not modify their inputs.
+        return _convert_coordinates_(coords, from_, to, fixup = fixup,
+                                     white = [self.WHITEX, self.WHITEY, self.WHITEZ],
+                                     gamma = self.GAMMA)
+
+    def in_gamut(self, atol = 1e-4, _all = False):
+        """Check if Colors are within the sRGB Gamut
+
+        Checks which colors lie within the sRGB gamut, i.e., can be
+        represented by red, green, and blue intensities within `[0., 1.]`.
+        The check is performed on the coordinates (converted to sRGB), no
+        hex colors are created. Colors with missing coordinates (e.g.,
+        invalid hex colors) are not within the gamut.
+        See also :py:method:`gamut_mask` and :py:method:`clip_to_gamut`.
+
+        Args:
+            atol (float): Absolute tolerance, values within `[-atol, 1. + atol]`
+                are considered to be valid. Defaults to `1e-4` (allows for
+                round-off errors of conversions, e.g., white in HCL).
+            _all (bool): If `False` (default) a boolean array is returned,
+                else a single bool (`True` if all colors are within the gamut).
+
+        Returns:
+            numpy.ndarray, bool: Boolean array of length `N` (number of colors),
+            or a single bool if `_all = True`.
+
+        Examples:
+
+            >>> from colorspace import HCL
+            >>> cols = HCL(H = [0, 0, 120], C = [50, 150, 80], L = [50, 50, 90])
+            >>> cols.in_gamut()
+            >>> #:
+            >>> cols.in_gamut(_all = True)
+
+        Raises:
+            TypeError: If `atol` is not float or int.
+            ValueError: If `atol` is negative.
+            TypeError: If `_all` is not bool.
         """
-        for v in via:   self.to(v, fixup = fixup)
+        if not isinstance(atol, (float, int)) or isinstance(atol, bool):
+            raise TypeError("argument `atol` must be float or int")
+        elif atol < 0:
+            raise ValueError("argument `atol` must be positive or zero")
+        if not isinstance(_all, bool):
+            raise TypeError("argument `_all` must be bool")
+
+        res = self._gamut_mask_(self._convert_coords_("sRGB", fixup = False), atol)
+        return bool(np.all(res)) if _all else res
+
+    @staticmethod
+    def _gamut_mask_(rgb, atol):
+        """Boolean array, `True` where the sRGB coordinates `rgb` (list or
+        array `(3, N)`) are within `[-atol, 1. + atol]` (see :py:method:`in_gamut`)."""
+        rgb = np.asarray(rgb, dtype = float)
+        with np.errstate(invalid = "ignore"):
+            return np.all((rgb >= -atol) & (rgb <= 1. + atol), axis = 0)
+
+    def gamut_mask(self, atol = 1e-4):
+        """Gamut Mask
+
+        Boolean array indicating which colors lie within the sRGB gamut,
+        shorthand for `in_gamut(atol, _all = False)` (see :py:method:`in_gamut`).
+
+        Args:
+            atol (float): Absolute tolerance, defaults to `1e-4`.
+
+        Returns:
+            numpy.ndarray: Boolean array of length `N` (number of colors).
+
+        Examples:
+
+            >>> from colorspace import HCL
+            >>> cols = HCL(H = [0, 0, 120], C = [50, 150, 80], L = [50, 50, 90])
+            >>> cols.gamut_mask()
+        """
+        return self.in_gamut(atol = atol, _all = False)
+
+    def clip_to_gamut(self, method = "exact"):
+        """Clip Colors to the sRGB Gamut
+
+        Maps all colors outside the sRGB gamut (see :py:method:`in_gamut`)
+        into the gamut, colors within the gamut remain unchanged.
+        Modifies the coordinates of the current object, the color space
+        (class) of the object does not change.
+
+        Methods:
+
+        * `"exact"`: reduces the chroma (HCL) to the maximum chroma possible
+          while keeping hue and luminance (see :py:func:`max_chroma`, `mode = "exact"`).
+          Luminance outside `[0., 100.]` is limited to `[0., 100.]`.
+        * `"rgb"`: clips the red, green, and blue intensities to `[0., 1.]`
+          (as done when converting colors with `fixup = True`); does not
+          preserve hue and luminance.
+
+        Args:
+            method (str): One of `"exact"` (default) or `"rgb"`.
+
+        Examples:
+
+            >>> from colorspace import HCL
+            >>> cols = HCL(H = [0, 0, 120], C = [50, 150, 80], L = [50, 50, 90])
+            >>> cols.clip_to_gamut()
+            >>> cols
+            >>> #:
+            >>> cols.in_gamut()
+
+        Raises:
+            ValueError: If `method` is not one of the allowed methods.
+            Exception: If `method = "exact"` and the conversion into HCL is
+                ambiguous (e.g., `HSV`, `HLS`; see :py:func:`to`).
+        """
+        if not isinstance(method, str) or method not in ["exact", "rgb"]:
+            raise ValueError("argument `method` must be \"exact\" or \"rgb\"")
+
+        from_ = self.__class__.__name__
+        if method == "exact":
+            self._check_ambiguous_("polarLUV")
+
+        # Colors outside the gamut (ignoring missing values)
+        rgb = np.asarray(self._convert_coords_("sRGB", fixup = False), dtype = float)
+        idx = np.where(~self._gamut_mask_(rgb, 1e-4) & np.all(np.isfinite(rgb), axis = 0))[0]
+        if len(idx) == 0:
+            return
+
+        # Clipping red, green, and blue
+        rgb = np.clip(rgb[:, idx], 0., 1.)
+        res = self._convert_coords_(from_, coords = list(rgb), from_ = "sRGB")
+
+        # Reducing chroma; colors which are still outside the gamut
+        # (round-off errors) keep the clipped rgb values.
+        if method == "exact":
+            from .utils import max_chroma
+            [L, C, H] = [np.asarray(x)[idx] for x in self._convert_coords_("polarLUV")]
+            L   = np.clip(L, 0., 100.)
+            C   = np.fmin(C, max_chroma(H, L, mode = "exact"))
+            ok  = self._gamut_mask_(self._convert_coords_("sRGB", coords = [L, C, H], from_ = "polarLUV"), 1e-4)
+            hcl = self._convert_coords_(from_, coords = [L, C, H], from_ = "polarLUV")
+            res = [np.where(ok, x, y) for x, y in zip(hcl, res)]
+
+        for k, v in zip(_SPACE_DIMS_[from_], res):
+            self._data_[k][idx] = v
 
     def _colorobject_check_input_arrays_(self, **kwargs):
         """Colorobject Check User Input
@@ -2100,7 +2404,7 @@ class colorobject:
         from .hclplot import hclplot
         return hclplot(x = self.colors(), **kwargs)
 
-    def colors(self, fixup = True, rev = False):
+    def colors(self, fixup = True, rev = False, format = "hex"):
         """Extract Hex Colors
 
         Convers the current object into an object of class :py:class:`hexcols`
@@ -2109,13 +2413,32 @@ class colorobject:
         If the object contains alpha values, the alpha level is added to the
         hex string if and only if alpha is not equal to `1.0`.
 
+        Alternatively, the colors can be returned as numeric arrays (one row
+        per color) without creating hex colors, using `format`:
+
+        * `"rgb"`: sRGB coordinates (float, `[0., 1.]`), shape `(n, 3)`.
+        * `"rgba"`: sRGB coordinates plus alpha (float, `[0., 1.]`; `1.` if
+          the object has no alpha), shape `(n, 4)`.
+        * `"rgba8"`: as `"rgba"` but unsigned 8 bit integers (`[0, 255]`),
+          identical to the values encoded in the hex colors.
+        * `"hcl"`: hue, chroma, and luminance (float), shape `(n, 3)`.
+
         Args:
             fixup (bool): Whether or not to correct rgb values outside the
                 defined range of `[0., 1.]`, defaults to `True`.
             rev (bool): Should the color palette be reversed? Defaults to `False`.
+            format (str): Output format, one of `"hex"` (default), `"rgb"`,
+                `"rgba"`, `"rgba8"`, or `"hcl"`.
 
         Returns:
-            list: Returns a list of hex color strings.
+            list, numpy.ndarray: Returns a list of hex color strings (`format = "hex"`),
+            else a (C-contiguous) numpy.ndarray. If `fixup = False`, colors outside the
+            sRGB color space are `None` (`"hex"`) or `nan` (`"rgb"`, `"rgba"`).
+
+        Raises:
+            ValueError: If `format` is invalid.
+            ValueError: If `format = "rgba8"`, `fixup = False`, and some colors lie
+                outside the sRGB color space.
 
         Example:
 
@@ -2137,12 +2460,23 @@ class colorobject:
             >>>            [1, 0, 1],
             >>>            [0.65, 0.89, 0.56])
             >>> cols.colors()
+            >>>
+            >>> #: Numeric output formats
+            >>> cols.colors(format = "rgba8")
+            >>> #:
+            >>> cols.colors(format = "hcl")
 
         """
 
         from copy import copy
         from numpy import ndarray, round
 
+        if not format in ["hex", "rgb", "rgba", "rgba8", "hcl"]:
+            raise ValueError("argument `format` must be one of \"hex\", \"rgb\", \"rgba\", \"rgba8\", \"hcl\"")
+        elif not format == "hex":
+            res = self._colors_numeric_(format, fixup)
+            return np.ascontiguousarray(res[::-1]) if rev else res
+
         x = copy(self)
         x.to("hex", fixup = fixup)
         if x.hasalpha():
@@ -2163,8 +2497,42 @@ class colorobject:
 
         return colors.tolist() if isinstance(colors, ndarray) else colors
 
+    def _colors_numeric_(self, format, fixup):
+        """Helper function for the numeric output formats of :py:func:`colors`."""
+
+        from_ = self.__class__.__name__
+        if format == "hcl" and not _is_ambiguous_(from_, "polarLUV"):
+            return np.stack(self._convert_coords_("polarLUV")[::-1], axis = 1)
+
+        # sRGB coordinates; invalid colors (see colorlib.sRGB_to_hex) are
+        # set to 0 (fixup = True) or nan.
+        rgb = np.asarray(self._convert_coords_("sRGB", fixup = fixup), dtype = float)
+        with np.errstate(invalid = "ignore"):
+            if fixup:
+                valid = np.all(np.isfinite(rgb), axis = 0)
+            else:
+                tol   = 1. / (2 * 255.)
+                valid = np.all((rgb >= -tol) & (rgb <= 1. + tol), axis = 0)
+
+        if format == "hcl":
+            return np.stack(self._convert_coords_("polarLUV", coords = list(rgb),
+                                                  from_ = "sRGB")[::-1], axis = 1)
+        elif format == "rgba8" and not np.all(valid):
+            raise ValueError("colors outside the sRGB color space cannot be " + \
+                             "returned as \"rgba8\" if `fixup = False`")
 
-    def get(self, dimname = None):
+        rgb = np.clip(np.where(valid, rgb, 0.), 0., 1.)
+        rgb[:, ~valid] = np.nan
+        if format == "rgb":
+            return np.ascontiguousarray(rgb.T)
+
+        alpha = self._data_["alpha"] if self.hasalpha() else np.ones(rgb.shape[1])
+        res   = np.vstack([rgb, np.where(np.isnan(alpha), 1., alpha)]).T
+        return np.ascontiguousarray(res) if format == "rgba" else \
+               np.floor(res * 255. + .5).astype(np.uint8, order = "C")
+
+
+    def get(self, dimname = None, copy = True):
         """Extracting Color Coordinates
 
         Allows to extract the current values of one or multiple dimensions
@@ -2175,6 +2543,9 @@ class colorobject:
             dimname (None, str): If `None` (default) values of all coordinates
                 of the current color object are returned. A specific coordinate
                 can be specified if needed.
+            copy (bool): If `True` (default) copies of the coordinates are returned.
+                If `False`, views on the (packed) coordinates of the object are
+                returned; modifying them modifies the colors of the object.
 
         Returns:
             Returns a `numpy.ndarray` if coordinates of one specific dimension are
@@ -2200,16 +2571,27 @@ class colorobject:
             >>> #: Convert to hexcols
             >>> cols.to("hex")
             >>> cols.get("hex_")
+            >>>
+            >>> #: View on the coordinates (no copy)
+            >>> cols = HCL([260, 80, 30], [80, 0, 80], [30, 90, 30])
+            >>> H = cols.get("H", copy = False)
+            >>> H[:] = 120
+            >>> cols
 
         Raises:
             TypeError: If argument `dimname` is neither None or str.
+            TypeError: If argument `copy` is not bool.
             ValueError: If the dimension specified on `dimnames` does not exist.
         """
 
+        if not isinstance(copy, bool):
+            raise TypeError("argument `copy` must be bool")
+        def fn(x):
+            return x.copy() if copy and x is not None else x
+
         # Return all coordinates
-        from copy import copy
         if dimname is None:
-            return copy(self._data_)
+            return {k: fn(v) for k, v in self._data_.items()}
         # No string?
         elif not isinstance(dimname, str):
             raise TypeError("argument `dimname` must be None or str")
@@ -2222,7 +2604,7 @@ class colorobject:
             else:
                 raise ValueError(f"{self.__class__.__name__} has no dimension {dimname}")
 
-        return copy(self._data_[dimname])
+        return fn(self._data_[dimname])
 
 
     def set(self, **kwargs):
@@ -2273,7 +2655,7 @@ class colorobject:
             # dtype as the existing dimension (loaded via self.get(key)).
             if isinstance(vals, (list, int, float)):
                 if isinstance(vals, (int, float)): vals = [vals]
-                t = type(self.get(key)[0]) # Current type (get current dimension)
+                t = type(self.get(key, copy = False)[0]) # Current type (get current dimension)
                 try:
                     vals = np.asarray(vals, dtype = t)
                 except Exception as e:
@@ -2281,8 +2663,8 @@ class colorobject:
                                      f" in {self.__class__.__name__}: {str(e)}")
 
             # New values do have to have the same length as the old ones,
-            n = len(self.get(key))
-            t = type(self.get(key)[0])
+            n = len(self.get(key, copy = False))
+            t = type(self.get(key, copy = False)[0])
             try:
                 vals = np.asarray(vals, dtype = t)
             except Exception as e:
@@ -2399,9 +2781,8 @@ class polarLUV(colorobject):
     def __init__(self, H, C, L, alpha = None):
 
         # Checking inputs, save inputs on object
-        self._data_ = {} # Dict to store the colors/color dimensions
         tmp = self._colorobject_check_input_arrays_(H = H, C = C, L = L, alpha = alpha)
-        for key,val in tmp.items(): self._data_[key] = val
+        self._data_ = _packedcoords_(tmp) # Packed colors/color dimensions
         # White spot definition (the default)
         self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
 
@@ -2446,49 +2827,7 @@ class polarLUV(colorobject):
 
         """
         self._check_if_allowed_(to)
-        from . import colorlib
-        clib = colorlib()
-
-        # Nothing to do (converted to itself)
-        if to in ["HCL", self.__class__.__name__]:
-            return
-
-        # This is the only transformation from polarLUV -> LUV
-        elif to == "CIELUV":
-            [L, U, V] = clib.polarLUV_to_LUV(self.get("L"), self.get("C"), self.get("H"))
-            self._data_ = {"L" : L, "U" : U, "V" : V, "alpha" : self.get("alpha")}
-            self.__class__ = CIELUV
-
-        # The rest are transformations along a path
-        elif to == "CIEXYZ":
-            via = ["CIELUV", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "CIELAB":
-            via = ["CIELUV", "CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "RGB":
-            via = ["CIELUV", "CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "sRGB":
-            via = ["CIELUV", "CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "polarLAB":
-            via = ["CIELUV", "CIEXYZ", "CIELAB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "hex":
-            via = ["CIELUV", "CIEXYZ", "sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["HLS", "HSV"]:
-            self._ambiguous(self.__class__.__name__, to)
-
-        # Currently not used but implemented as fallback for the future
-        else: self._cannot(self.__class__.__name__, to)
+        self._transform_(to, fixup = fixup)
 
 # polarLUV is HCL, make copy
 HCL = polarLUV
@@ -2532,9 +2871,8 @@ class CIELUV(colorobject):
     def __init__(self, L, U, V, alpha = None):
 
         # checking inputs, save inputs on object
-        self._data_ = {} # Dict to store the colors/color dimensions
         tmp = self._colorobject_check_input_arrays_(L = L, U = U, V = V, alpha = alpha)
-        for key,val in tmp.items(): self._data_[key] = val
+        self._data_ = _packedcoords_(tmp) # Packed colors/color dimensions
         # White spot definition (the default)
         self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
 
@@ -2579,50 +2917,7 @@ class CIELUV(colorobject):
 
         """
         self._check_if_allowed_(to)
-        from . import colorlib
-        clib = colorlib()
-
-        # Nothing to do (converted to itself)
-        if to == self.__class__.__name__:
-            return
-        # Transformation from CIELUV -> CIEXYZ
-        elif to == "CIEXYZ":
-            [X, Y, Z] = clib.LUV_to_XYZ(self.get("L"), self.get("U"), self.get("V"),
-                                        self.WHITEX, self.WHITEY, self.WHITEZ)
-            self._data_ = {"X" : X, "Y" : Y, "Z" : Z, "alpha" : self.get("alpha")}
-            self.__class__ = CIEXYZ
-
-        # Transformation from CIELUV -> polarLUV (HCL)
-        elif to in ["HCL","polarLUV"]:
-            [L, C, H] = clib.LUV_to_polarLUV(self.get("L"), self.get("U"), self.get("V"))
-            self._data_ = {"L" : L, "C" : C, "H" : H, "alpha" : self.get("alpha")}
-            self.__class__ = polarLUV
-
-        # The rest are transformations along a path
-        elif to == "CIELAB":
-            via = ["CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "RGB":
-            via = ["CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "sRGB":
-            via = ["CIEXYZ", "RGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "polarLAB":
-            via = ["CIEXYZ", "CIELAB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "hex":
-            via = ["CIEXYZ", "RGB", "sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["HLS", "HSV"]:
-            self._ambiguous(self.__class__.__name__, to)
-
-        else: self._cannot(self.__class__.__name__, to)
+        self._transform_(to, fixup = fixup)
 
 # -------------------------------------------------------------------
 # CIEXYZ color object
@@ -2662,9 +2957,8 @@ class CIEXYZ(colorobject):
     def __init__(self, X, Y, Z, alpha = None):
 
         # checking inputs, save inputs on object
-        self._data_ = {} # Dict to store the colors/color dimensions
         tmp = self._colorobject_check_input_arrays_(X = X, Y = Y, Z = Z, alpha = alpha)
-        for key,val in tmp.items(): self._data_[key] = val
+        self._data_ = _packedcoords_(tmp) # Packed colors/color dimensions
         # White spot definition (the default)
         self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
 
@@ -2709,55 +3003,7 @@ class CIEXYZ(colorobject):
 
         """
         self._check_if_allowed_(to)
-        from . import colorlib
-        clib = colorlib()
-
-        # Nothing to do (converted to itself)
-        if to == self.__class__.__name__:
-            return
-
-        # Transformation from CIEXYZ -> CIELUV
-        elif to == "CIELUV":
-            [L, U, V] = clib.XYZ_to_LUV(self.get("X"), self.get("Y"), self.get("Z"),
-                                        self.WHITEX, self.WHITEY, self.WHITEZ) 
-            self._data_ = {"L" : L, "U" : U, "V" : V, "alpha" : self.get("alpha")}
-            self.__class__ = CIELUV
-
-        # Transformation from CIEXYZ -> CIELAB
-        elif to == "CIELAB":
-            [L, A, B] = clib.XYZ_to_LAB(self.get("X"), self.get("Y"), self.get("Z"),
-                                        self.WHITEX, self.WHITEY, self.WHITEZ) 
-            self._data_ = {"L" : L, "A" : A, "B" : B, "alpha" : self.get("alpha")}
-            self.__class__ = CIELAB
-
-        # Transformation from CIEXYZ -> RGB
-        elif to == "RGB":
-            [R, G, B] = clib.XYZ_to_RGB(self.get("X"), self.get("Y"), self.get("Z"),
-                                        self.WHITEX, self.WHITEY, self.WHITEZ) 
-            self._data_ = {"R" : R, "G" : G, "B" : B, "alpha" : self.get("alpha")}
-            self.__class__ = RGB
-
-        # The rest are transformations along a path
-        elif to == "polarLAB":
-            via = ["CIELAB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["HCL", "polarLUV"]:
-            via = ["CIELUV", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "sRGB":
-            via = ["RGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "hex":
-            via = ["RGB", "sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["HLS", "HSV"]:
-            self._ambiguous(self.__class__.__name__, to)
-
-        else: self._cannot(self.__class__.__name__, to)
+        self._transform_(to, fixup = fixup)
 
 
 class RGB(colorobject):
@@ -2794,10 +3040,8 @@ class RGB(colorobject):
     def __init__(self, R, G, B, alpha = None):
 
         # checking inputs, save inputs on object
-        self._data_ = {} # Dict to store the colors/color dimensions
-
         tmp = self._colorobject_check_input_arrays_(R = R, G = G, B = B, alpha = alpha)
-        for key,val in tmp.items(): self._data_[key] = val
+        self._data_ = _packedcoords_(tmp) # Packed colors/color dimensions
         # White spot definition (the default)
         self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
 
@@ -2841,57 +3085,7 @@ class RGB(colorobject):
 
         """
         self._check_if_allowed_(to)
-        from . import colorlib
-        clib = colorlib()
-
-        # Nothing to do (converted to itself)
-        if to == self.__class__.__name__:
-            return
-
-        # Transform from RGB -> sRGB
-        elif to == "sRGB":
-            [R, G, B] = clib.RGB_to_sRGB(self.get("R"), self.get("G"), self.get("B"),
-                                           self.GAMMA)
-            self._data_ = {"R" : R, "G" : G, "B" : B, "alpha" : self.get("alpha")}
-            self.__class__ = sRGB
-
-        # Transform from RGB -> CIEXYZ
-        elif to == "CIEXYZ":
-            [X, Y, Z] = clib.RGB_to_XYZ(self.get("R"), self.get("G"), self.get("B"),
-                                        self.WHITEX, self.WHITEY, self.WHITEZ)
-            self._data_ = {"X" : X, "Y" : Y, "Z" : Z, "alpha" : self.get("alpha")}
-            self.__class__ = CIEXYZ
-
-        # From RGB to HLS: take direct path (not via sRGB)
-        elif to in ["HLS"]:
-            [H, L, S] = clib.RGB_to_HLS(self.get("R"), self.get("G"), self.get("B"))
-            self._data_ = {"H" : H, "L" : L, "S" : S, "alpha" : self.get("alpha")}
-            self.__class__ = HLS
-
-        # From RGB to HSV: take direct path (not via sRGB)
-        elif to in ["HSV"]:
-            [H, S, V] = clib.RGB_to_HSV(self.get("R"), self.get("G"), self.get("B"))
-            self._data_ = {"H" : H, "S" : S, "V" : V, "alpha" : self.get("alpha")}
-            self.__class__ = HSV
-
-        # The rest are transformations along a path
-        elif to in ["hex"]:
-            via = ["sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["CIELUV", "CIELAB"]: 
-            via = ["CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["HCL","polarLUV"]:
-            via = ["CIEXYZ", "CIELUV", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "polarLAB":
-            via = ["CIEXYZ", "CIELAB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        else: self._cannot(self.__class__.__name__, to)
+        self._transform_(to, fixup = fixup)
 
 
 class sRGB(colorobject):
@@ -2930,9 +3124,8 @@ class sRGB(colorobject):
     def __init__(self, R, G, B, alpha = None, gamma = None):
 
         # checking inputs, save inputs on object
-        self._data_ = {} # Dict to store the colors/color dimensions
         tmp = self._colorobject_check_input_arrays_(R = R, G = G, B = B, alpha = alpha)
-        for key,val in tmp.items(): self._data_[key] = val
+        self._data_ = _packedcoords_(tmp) # Packed colors/color dimensions
 
         # White spot definition (the default)
         self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
@@ -2979,56 +3172,7 @@ class sRGB(colorobject):
 
         """
         self._check_if_allowed_(to)
-        from . import colorlib
-        clib = colorlib()
-
-        # Nothing to do (converted to itself)
-        if to == self.__class__.__name__:
-            return
-
-        # Transformation sRGB -> RGB
-        elif to == "RGB":
-            [R, G, B] = clib.sRGB_to_RGB(self.get("R"), self.get("G"), self.get("B"),
-                                         gamma = self.GAMMA)
-            self._data_ = {"R" : R, "G" : G, "B" : B, "alpha" : self.get("alpha")}
-            self.__class__ = RGB
-
-        # Transformation sRGB -> hex
-        elif to == "hex":
-            hex_ = clib.sRGB_to_hex(self.get("R"), self.get("G"), self.get("B"), fixup)
-            self._data_ = {"hex_" : hex_, "alpha" : self.get("alpha")}
-            self.__class__ = hexcols
-
-        # Transform from RGB -> HLS
-        elif to == "HLS":
-            [H, L, S] = clib.sRGB_to_HLS(self.get("R"), self.get("G"), self.get("B"))
-            self._data_ = {"H" : H, "L" : L, "S" : S, "alpha" : self.get("alpha")}
-            self.__class__ = HLS
-
-        # Transform from RGB -> HSV
-        elif to == "HSV":
-            [H, S, V] = clib.sRGB_to_HSV(self.get("R"), self.get("G"), self.get("B"))
-            self._data_ = {"H" : H, "S" : S, "V" : V, "alpha" : self.get("alpha")}
-            self.__class__ = HSV
-
-        # The rest are transformations along a path
-        elif to in ["CIEXYZ"]:
-            via = ["RGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["CIELUV", "CIELAB"]:
-            via = ["RGB", "CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["HCL","polarLUV"]:
-            via = ["RGB", "CIEXYZ", "CIELUV", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "polarLAB":
-            via = ["RGB", "CIEXYZ", "CIELAB", to] 
-            self._transform_via_path_(via, fixup = fixup)
-
-        else: self._cannot(self.__class__.__name__, to)
+        self._transform_(to, fixup = fixup)
 
 
 class CIELAB(colorobject):
@@ -3067,9 +3211,8 @@ class CIELAB(colorobject):
     def __init__(self, L, A, B, alpha = None):
 
         # checking inputs, save inputs on object
-        self._data_ = {} # Dict to store the colors/color dimensions
         tmp = self._colorobject_check_input_arrays_(L = L, A = A, B = B, alpha = alpha)
-        for key,val in tmp.items(): self._data_[key] = val
+        self._data_ = _packedcoords_(tmp) # Packed colors/color dimensions
         # White spot definition (the default)
         self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
 
@@ -3092,51 +3235,7 @@ class CIELAB(colorobject):
             be of a different class.
         """
         self._check_if_allowed_(to)
-        from . import colorlib
-        clib = colorlib()
-
-        # Nothing to do (converted to itself)
-        if to == self.__class__.__name__:
-            return
-
-        # Transformations CIELAB -> CIEXYZ
-        elif to == "CIEXYZ":
-            [X, Y, Z] = clib.LAB_to_XYZ(self.get("L"), self.get("A"), self.get("B"),
-                                        self.WHITEX, self.WHITEY, self.WHITEZ)
-            self._data_ = {"X" : X, "Y" : Y, "Z" : Z, "alpha" : self.get("alpha")}
-            self.__class__ = CIEXYZ
-
-        # Transformation CIELAB -> polarLAB
-        elif to == "polarLAB":
-            [L, A, B] = clib.LAB_to_polarLAB(self.get("L"), self.get("A"), self.get("B"))
-            self._data_ = {"L" : L, "A" : A, "B" : B, "alpha" : self.get("alpha")}
-            self.__class__ = polarLAB
-
-        # The rest are transformations along a path
-        elif to == "CIELUV":
-            via = ["CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["HCL","polarLUV"]:
-            via = ["CIEXYZ", "CIELUV", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "RGB":
-            via = ["CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "sRGB":
-            via = ["CIEXYZ", "RGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "hex":
-            via = ["CIEXYZ", "RGB", "sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["HLS", "HSV"]:
-            self._ambiguous(self.__class__.__name__, to)
-
-        else: self._cannot(self.__class__.__name__, to)
+        self._transform_(to, fixup = fixup)
 
 
 class polarLAB(colorobject):
@@ -3174,9 +3273,8 @@ class polarLAB(colorobject):
     def __init__(self, L, A, B, alpha = None):
 
         # checking inputs, save inputs on object
-        self._data_ = {} # Dict to store the colors/color dimensions
         tmp = self._colorobject_check_input_arrays_(L = L, A = A, B = B, alpha = alpha)
-        for key,val in tmp.items(): self._data_[key] = val
+        self._data_ = _packedcoords_(tmp) # Packed colors/color dimensions
         # White spot definition (the default)
         self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
 
@@ -3221,48 +3319,7 @@ class polarLAB(colorobject):
 
         """
         self._check_if_allowed_(to)
-        from . import colorlib
-        clib = colorlib()
-
-        # Nothing to do (converted to itself)
-        if to == self.__class__.__name__:
-            return
-
-        # The only transformation we need is from polarLAB -> LAB
-        elif to == "CIELAB":
-            [L, A, B] = clib.polarLAB_to_LAB(self.get("L"), self.get("A"), self.get("B"))
-            self._data_ = {"L" : L, "A" : A, "B" : B, "alpha" : self.get("alpha")}
-            self.__class__ = CIELAB
-
-        # The rest are transformationas along a path
-        elif to == "CIEXYZ":
-            via = ["CIELAB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "CIELUV":
-            via = ["CIELAB", "CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["HCL", "polarLUV"]:
-            via = ["CIELAB", "CIEXYZ", "CIELUV", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "RGB":
-            via = ["CIELAB", "CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "sRGB":
-            via = ["CIELAB", "CIEXYZ", "RGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "hex":
-            via = ["CIELAB", "CIEXYZ", "RGB", "sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["HLS", "HSV"]:
-            self._ambiguous(self.__class__.__name__, to)
-
-        else: self._cannot(self.__class__.__name__, to)
+        self._transform_(to, fixup = fixup)
 
 
 class HSV(colorobject):
@@ -3308,9 +3365,8 @@ class HSV(colorobject):
     def __init__(self, H, S, V, alpha = None):
 
         # checking inputs, save inputs on object
-        self._data_ = {} # Dict to store the colors/color dimensions
         tmp = self._colorobject_check_input_arrays_(H = H, S = S, V = V, alpha = alpha)
-        for key,val in tmp.items(): self._data_[key] = val
+        self._data_ = _packedcoords_(tmp) # Packed colors/color dimensions
         # White spot definition (the default)
         self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
 
@@ -3351,37 +3407,7 @@ class HSV(colorobject):
 
         """
         self._check_if_allowed_(to)
-        from . import colorlib
-        clib = colorlib()
-
-        # Nothing to do (converted to itself)
-        if to == self.__class__.__name__:
-            return
-
-        # The only transformation we need is back to RGB
-        elif to == "sRGB":
-            [R, G, B] = clib.HSV_to_sRGB(self.get("H"), self.get("S"), self.get("V"))
-            self._data_ = {"R" : R, "G" : G, "B" : B, "alpha" : self.get("alpha")}
-            self.__class__ = sRGB
-
-        # From HLS to RGB: take direct path (not via sRGB)
-        elif to in ["RGB"]:
-            [R, G, B] = clib.HSV_to_RGB(self.get("H"), self.get("S"), self.get("V"))
-            self._data_ = {"R" : R, "G" : G, "B" : B, "alpha" : self.get("alpha")}
-            self.__class__ = RGB
-
-        elif to == "hex":
-            via = ["sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "HLS":
-            via = ["sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["CIEXYZ", "CIELUV", "CIELAB", "polarLUV", "HCL", "polarLAB"]:
-            self._ambiguous(self.__class__.__name__, to)
-
-        else: self._cannot(self.__class__.__name__, to)
+        self._transform_(to, fixup = fixup)
 
 
 class HLS(colorobject):
@@ -3426,9 +3452,8 @@ class HLS(colorobject):
     def __init__(self, H, L, S, alpha = None):
 
         # checking inputs, save inputs on object
-        self._data_ = {} # Dict to store the colors/color dimensions
         tmp = self._colorobject_check_input_arrays_(H = H, L = L, S = S, alpha = None)
-        for key,val in tmp.items(): self._data_[key] = val
+        self._data_ = _packedcoords_(tmp) # Packed colors/color dimensions
         # White spot definition (the default)
         self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
 
@@ -3469,37 +3494,7 @@ class HLS(colorobject):
 
         """
         self._check_if_allowed_(to)
-        from . import colorlib
-        clib = colorlib()
-
-        # Nothing to do (converted to itself)
-        if to == self.__class__.__name__:
-            return
-
-        # The only transformation we need is back to RGB
-        elif to == "sRGB":
-            [R, G, B] = clib.HLS_to_sRGB(self.get("H"), self.get("L"), self.get("S"))
-            self._data_ = {"R" : R, "G" : G, "B" : B, "alpha" : self.get("alpha")}
-            self.__class__ = sRGB
-
-        # From HSV to RGB: take direct path (not via sRGB)
-        elif to in ["RGB"]:
-            [R, G, B] = clib.HLS_to_RGB(self.get("H"), self.get("L"), self.get("S"))
-            self._data_ = {"R" : R, "G" : G, "B" : B, "alpha" : self.get("alpha")}
-            self.__class__ = RGB
-
-        elif to == "hex":
-            via = ["sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to == "HSV":
-            via = ["sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["CIEXYZ", "CIELUV", "CIELAB", "polarLUV", "HCL", "polarLAB"]:
-            self._ambiguous(self.__class__.__name__, to)
-
-        else: self._cannot(self.__class__.__name__, to)
+        self._transform_(to, fixup = fixup)
 
 
 class hexcols(colorobject):
@@ -3545,33 +3540,21 @@ class hexcols(colorobject):
 
     def __init__(self, hex_):
 
-        from colorspace import check_hex_colors
+        from colorspace.utils import _check_hex_colors_
         import numpy as np
 
-        # If hex_ is str, convert to list
-        if isinstance(hex_, str): hex_ = [hex_]
-        hex_ = check_hex_colors(hex_)
-
-        self._data_ = {} # Dict to store the colors/color dimensions
-
-        # This is the one step where we extract transparency from
-        # hex colors once we enter the world of colorobjects.
-        def get_alpha(hex_):
-            # Trying to extract char 7:9, leave None if color is None
-            hex_ = [None if (x is None or len(x) < 9) else x[7:9] for x in hex_]
-            return [None if x is None else int(x, 16) / 255 for x in hex_]
-
-        # Remove apha if any
-        def remove_alpha(hex_):
-            return [None if x is None else x[:7] if len(x) > 7 else x for x in hex_]
-
-        # Forwarding input 'hex_' to check_hex_colors which will throw
-        # an error if we do not understand this input type.
-        tmp  = np.asarray(get_alpha(hex_), dtype = "float")
-        # Remove alpha from 9-digit hex if any, convert to ndarray
-        self._data_["hex_"] = np.asarray(remove_alpha(hex_), dtype = object)
+        # Checking and decoding the hex colors (throws an error if we do not
+        # understand this input type). This is the one step where we extract
+        # transparency from hex colors once we enter the world of colorobjects.
+        [rgb, alpha, isnone] = _check_hex_colors_(hex_)
+
+        # Store six digit hex colors (without alpha) as ndarray
+        tmp = {"hex_": colorlib()._hex_encode_(rgb).astype(object)}
+        tmp["hex_"][isnone] = None
         # Store alpha (if any)
-        if not np.all(np.isnan(tmp)): self._data_["alpha"] = tmp
+        if np.any(alpha >= 0): tmp["alpha"] = np.where(alpha >= 0, alpha / 255, np.nan)
+
+        self._data_ = _packedcoords_(tmp) # Packed colors/color dimensions
 
         # White spot definition (the default)
         self.set_whitepoint(X = 95.047, Y = 100.000, Z = 108.883)
@@ -3616,47 +3599,7 @@ class hexcols(colorobject):
 
         """
         self._check_if_allowed_(to)
-        from . import colorlib
-        clib = colorlib()
-
-        # Nothing to do (converted to itself)
-        if to in ["hex", self.__class__.__name__]:
-            return
-
-        # The only transformation we need is from hexcols -> sRGB
-        elif to == "sRGB":
-            [R, G, B] = clib.hex_to_sRGB([None if x is None else x[0:7] for x in self.get("hex_")])
-            alpha = self.get("alpha")
-            self._data_ = {"R": R, "G": G, "B": B}
-            if alpha is not None: self._data_["alpha"] = alpha
-            self.__class__ = sRGB
-
-        # The rest are transformations along a path
-        elif to == "RGB":
-            via = ["sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["HLS", "HSV"]:
-            via = ["sRGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["CIEXYZ"]:
-            via = ["sRGB", "RGB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["CIELUV", "CIELAB"]:
-            via = ["sRGB", "RGB", "CIEXYZ", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in ["HCL", "polarLUV"]:
-            via = ["sRGB", "RGB", "CIEXYZ", "CIELUV", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        elif to in "polarLAB":
-            via = ["sRGB", "RGB", "CIEXYZ", "CIELAB", to]
-            self._transform_via_path_(via, fixup = fixup)
-
-        else: self._cannot(self.__class__.__name__, to)
+        self._transform_(to, fixup = fixup)
 
     def _repr_html_(self):
         """_repr_html_()
@@ -3692,6 +3635,174 @@ class hexcols(colorobject):
         res += "</ul>\n"
         return res
 
+
+# -------------------------------------------------------------------
+# Conversion graph
+#
+# Direct conversions between two color spaces (the edges of the graph).
+# Each entry maps (from, to) to the name of the colorlib method doing the
+# conversion and the additional input it requires, if any ("white" point,
+# "gamma", or "fixup"). Insertion order
+# matters: if two shortest paths exist the one found first is used
+# (e.g., HSV -> sRGB -> HLS rather than HSV -> RGB -> HLS).
+# -------------------------------------------------------------------
+_CONVERSIONS_ = {
+    ("polarLUV", "CIELUV"):   ("polarLUV_to_LUV", None),
+    ("CIELUV",   "CIEXYZ"):   ("LUV_to_XYZ",      "white"),
+    ("CIELUV",   "polarLUV"): ("LUV_to_polarLUV", None),
+    ("CIEXYZ",   "CIELUV"):   ("XYZ_to_LUV",      "white"),
+    ("CIEXYZ",   "CIELAB"):   ("XYZ_to_LAB",      "white"),
+    ("CIEXYZ",   "RGB"):      ("XYZ_to_RGB",      "white"),
+    ("RGB",      "sRGB"):     ("RGB_to_sRGB",     "gamma"),
+    ("RGB",      "CIEXYZ"):   ("RGB_to_XYZ",      "white"),
+    ("RGB",      "HLS"):      ("RGB_to_HLS",      None),
+    ("RGB",      "HSV"):      ("RGB_to_HSV",      None),
+    ("sRGB",     "RGB"):      ("sRGB_to_RGB",     "gamma"),
+    ("sRGB",     "hexcols"):  ("sRGB_to_hex",     "fixup"),
+    ("sRGB",     "HLS"):      ("sRGB_to_HLS",     None),
+    ("sRGB",     "HSV"):      ("sRGB_to_HSV",     None),
+    ("CIELAB",   "CIEXYZ"):   ("LAB_to_XYZ",      "white"),
+    ("CIELAB",   "polarLAB"): ("LAB_to_polarLAB", None),
+    ("polarLAB", "CIELAB"):   ("polarLAB_to_LAB", None),
+    ("HSV",      "sRGB"):     ("HSV_to_sRGB",     None),
+    ("HSV",      "RGB"):      ("HSV_to_RGB",      None),
+    ("HLS",      "sRGB"):     ("HLS_to_sRGB",     None),
+    ("HLS",      "RGB"):      ("HLS_to_RGB",      None),
+    ("hexcols",  "sRGB"):     ("hex_to_sRGB",     None),
+}
+
+# Coordinates of each color space in the order expected (and
+# returned) by the colorlib methods.
+_SPACE_DIMS_ = {"polarLUV": ["L", "C", "H"], "CIELUV":   ["L", "U", "V"],
+                "CIEXYZ":   ["X", "Y", "Z"], "CIELAB":   ["L", "A", "B"],
+                "polarLAB": ["L", "A", "B"], "RGB":      ["R", "G", "B"],
+                "sRGB":     ["R", "G", "B"], "HSV":      ["H", "S", "V"],
+                "HLS":      ["H", "L", "S"], "hexcols":  ["hex_"]}
+
+_SPACE_ALIASES_ = {"HCL": "polarLUV", "hex": "hexcols"}
+
+_SPACE_CLASSES_ = {"polarLUV": polarLUV, "CIELUV": CIELUV, "CIEXYZ": CIEXYZ,
+                   "CIELAB": CIELAB, "polarLAB": polarLAB, "RGB": RGB,
+                   "sRGB": sRGB, "HSV": HSV, "HLS": HLS, "hexcols": hexcols}
+
+def _is_ambiguous_(from_, to):
+    """Check for Ambiguous Conversion
+
+    HSV and HLS are defined on (device dependent) RGB coordinates, thus
+    conversions between them and the CIE based color spaces are ambiguous
+    (even if a path through the conversion graph exists).
+
+    Args:
+        from_ (str): Name of the current color space.
+        to (str): Name of the target color space.
+
+    Returns:
+        bool: `True` if the conversion is ambiguous, else `False`.
+    """
+    dd = ["HSV", "HLS"]
+    di = ["CIEXYZ", "CIELUV", "CIELAB", "polarLUV", "polarLAB"]
+    return (from_ in dd and to in di) or (from_ in di and to in dd)
+
+@lru_cache(maxsize = None)
+def _conversion_path_(from_, to):
+    """Find Shortest Conversion Path
+
+    Breadth-first search through the conversion graph (`_CONVERSIONS_`).
+    The result is cached, each path is only searched once.
+
+    Args:
+        from_ (str): Name of the current color space (class name).
+        to (str): Name of the target color space (class name).
+
+    Returns:
+        tuple, None: Tuple of str with all color spaces along the path
+        (excluding `from_`, including `to`), `None` if there is no path.
+    """
+    queue   = [(from_,)]
+    visited = {from_}
+    while len(queue) > 0:
+        path = queue.pop(0)
+        for (a, b) in _CONVERSIONS_.keys():
+            if not a == path[-1] or b in visited: continue
+            if b == to: return path[1:] + (b,)
+            visited.add(b)
+            queue.append(path + (b,))
+    return None
+
+def _kernel_step_(method, extra):
+    """Conversion step calling one colorlib method (see `_CONVERSIONS_`)."""
+    def step(clib, coords, white, gamma, fixup):
+        fun = getattr(clib, method)
+        if   extra == "white": res = fun(*coords, *white)
+        elif extra == "gamma": res = fun(*coords, gamma = gamma)
+        elif extra == "fixup": return [fun(*coords, fixup = fixup)]
+        else:                  res = fun(*coords)
+        return list(res)
+    return step
+
+@lru_cache(maxsize = None)
+def _compile_conversion_(from_, to):
+    """Compile Conversion
+
+    Finds the shortest path from `from_` to `to` through the conversion graph
+    and compiles it into a list of steps (functions), one for each direct
+    conversion along the path. The result is cached, each conversion is only compiled once.
+    Each step is called as `step(clib, coords, white, gamma, fixup)` where
+    `coords` is a list of `numpy.ndarray`s (see `_SPACE_DIMS_`), `white` the
+    white point (`[XN, YN, ZN]`) and `gamma` the gamma used for the
+    conversions, and returns the converted coordinates.
+
+    Args:
+        from_ (str): Name of the current color space (class name).
+        to (str): Name of the target color space (class name).
+
+    Returns:
+        tuple, None: Tuple of steps, `None` if there is no path.
+    """
+    path = _conversion_path_(from_, to)
+    if path is None: return None
+
+    return tuple(_kernel_step_(*_CONVERSIONS_[edge]) for edge in zip((from_,) + path[:-1], path))
+
+def _convert_coordinates_(coords, from_, to, white = None, gamma = None, fixup = True):
+    """Convert Coordinates
+
+    Converts coordinates from one color space into another along the
+    (cached) compiled conversion path (see `_compile_conversion_`) without
+    creating a color object. Does not check whether the conversion is
+    ambiguous (see `_is_ambiguous_`).
+
+    Args:
+        coords (list): List of `numpy.ndarray`s with the coordinates in color
+            space `from_`, in the order given by `_SPACE_DIMS_`.
+        from_ (str): Name of the color space of `coords` (class name).
+        to (str): Name of the target color space (class name).
+        white (None, list): White point `[XN, YN, ZN]`. If `None` (default)
+            the default white point is used (see :py:func:`colorlib._get_white_`).
+        gamma (None, float): Gamma used for the conversion between RGB and sRGB.
+            If `None` (default) the default gamma (`colorobject.GAMMA`) is used.
+        fixup (bool): Whether or not to correct invalid rgb values outside
+            `[0., 1.]` if necessary.
+
+    Returns:
+        list, None: List of `numpy.ndarray`s with the coordinates in the
+        order given by `_SPACE_DIMS_`, `None` if there is no conversion.
+    """
+    if to == from_:
+        return coords
+
+    steps = _compile_conversion_(from_, to)
+    if steps is None:
+        return None
+
+    if white is None: white = [None, None, None]
+    if gamma is None: gamma = colorobject.GAMMA
+    clib = colorlib(validate = False)
+    for step in steps:
+        coords = step(clib, coords, white, gamma, fixup)
+    return coords
+
+
 def compare_colors(a, b, exact = False, _all = True, atol = None):
     """Compare Sets of Colors
 
@@ -3795,16 +3906,16 @@ def compare_colors(a, b, exact = False, _all = True, atol = None):
     if exact: atol = 1e-6
 
     def distance(a, b):
-        dist = 0. # Start with zero distance
+        dist = np.zeros(a.length()) # Start with zero distance
         for n in list(a._data_.keys()):
-            tmpa = a.get(n)
-            tmpb = b.get(n)
+            tmpa = a.get(n, copy = False)
+            tmpb = b.get(n, copy = False)
             # Both None and that is our alpha channel, no judgement
             if tmpa is None and tmpb is None and n == "alpha":
                 continue
             # Bot not none, calc Eudlidean distance
             elif not tmpa is None and not tmpb is None:
-                dist += (tmpa[0] - tmpb[0])**2.0
+                dist += (tmpa - tmpb)**2.0
             # One missing? Penalize by + 100
             else:
                 dist += 100.
@@ -3814,15 +3925,16 @@ def compare_colors(a, b, exact = False, _all = True, atol = None):
     # Compare hex colors; always on string level
     if isinstance(a, hexcols):
         # Getting coordinates
-        res = [a[i].get("hex_")[0].upper() == b[i].get("hex_")[0].upper() for i in range(0, a.length())]
+        tmpa = np.char.upper(np.asarray(a.get("hex_", copy = False), dtype = str))
+        tmpb = np.char.upper(np.asarray(b.get("hex_", copy = False), dtype = str))
+        res  = (tmpa == tmpb).tolist()
     # Calculate absolute difference between coordinates R/G/B[/alpha].
     # Threading alpha like another coordinates as all coordinates are scaled [0-1].
     elif isinstance(a, RGB) or isinstance(a, sRGB) or \
          isinstance(a, HLS) or isinstance(a, HSV):
         # HEX precision in RGB coordinates is about sqrt((1./255.)**2 * 3) / 2 = 0.003396178
         if not atol: atol = 0.005
-        res = [distance(a[i], b[i]) for i in range(0, a.length())]
-        res = isclose(res, 0, atol = atol)
+        res = isclose(distance(a, b), 0, atol = atol)
     # HCL or polarLUV (both return instance polarLUV)
     # TODO(enhancement): Calculating the Euclidean distance on HCL and (if
     #   available) alpha which itself is in [0, 1]. Should be weighted
@@ -3831,8 +3943,7 @@ def compare_colors(a, b, exact = False, _all = True, atol = None):
          isinstance(a, polarLAB) or isinstance(a, CIEXYZ):
 
         if not atol: atol = 1
-        res = [distance(a[i], b[i]) for i in range(0, a.length())]
-        res = isclose(res, 0, atol = atol)
+        res = isclose(distance(a, b), 0, atol = atol)
 
 
     # If _all is True: check if all elements are True
@@ -3844,3 +3955,161 @@ def compare_colors(a, b, exact = False, _all = True, atol = None):
 
 
 
+
+
+def _deltaE_(x, y, metric):
+    """Color Difference Kernel
+
+    Computes the color difference between CIELAB coordinates (or the
+    Euclidean distance between arbitrary coordinates) stored along the
+    last axis of `x` and `y` (broadcasted against each other).
+
+    Args:
+        x (numpy.ndarray): Array of shape `(..., 3)`.
+        y (numpy.ndarray): Array of shape `(..., 3)`.
+        metric (str): `"euclidean"`, `"deltaE76"`, or `"deltaE2000"`.
+
+    Returns:
+        numpy.ndarray: Distances, broadcasted shape of `x` and `y` without
+        the last axis.
+    """
+    if not metric == "deltaE2000":
+        return np.sqrt(np.sum((x - y)**2, axis = -1))
+
+    # CIEDE2000; Sharma, Wu, Dalal (2005), Color Research & Application 30(1).
+    [L1, a1, b1] = [x[..., i] for i in range(3)]
+    [L2, a2, b2] = [y[..., i] for i in range(3)]
+
+    Cbar = (np.hypot(a1, b1) + np.hypot(a2, b2)) / 2.
+    G    = 0.5 * (1. - np.sqrt(Cbar**7 / (Cbar**7 + 25.**7)))
+    a1p, a2p = (1. + G) * a1, (1. + G) * a2
+    C1p, C2p = np.hypot(a1p, b1), np.hypot(a2p, b2)
+    h1p = np.mod(np.degrees(np.arctan2(b1, a1p)), 360.)
+    h2p = np.mod(np.degrees(np.arctan2(b2, a2p)), 360.)
+
+    zero = (C1p * C2p) == 0.
+    dh   = h2p - h1p
+    dhp  = np.where(zero, 0., np.where(dh > 180., dh - 360., np.where(dh < -180., dh + 360., dh)))
+    dLp  = L2 - L1
+    dCp  = C2p - C1p
+    dHp  = 2. * np.sqrt(C1p * C2p) * np.sin(np.radians(dhp) / 2.)
+
+    Lbp  = (L1 + L2) / 2.
+    Cbp  = (C1p + C2p) / 2.
+    hs   = h1p + h2p
+    hbp  = np.where(zero, hs, np.where(np.abs(dh) <= 180., hs / 2.,
+                    np.where(hs < 360., (hs + 360.) / 2., (hs - 360.) / 2.)))
+
+    T  = 1. - 0.17 * np.cos(np.radians(hbp - 30.)) + 0.24 * np.cos(np.radians(2. * hbp)) \
+            + 0.32 * np.cos(np.radians(3. * hbp + 6.)) - 0.20 * np.cos(np.radians(4. * hbp - 63.))
+    dtheta = 30. * np.exp(-((hbp - 275.) / 25.)**2)
+    RC = 2. * np.sqrt(Cbp**7 / (Cbp**7 + 25.**7))
+    SL = 1. + 0.015 * (Lbp - 50.)**2 / np.sqrt(20. + (Lbp - 50.)**2)
+    SC = 1. + 0.045 * Cbp
+    SH = 1. + 0.015 * Cbp * T
+    RT = -np.sin(np.radians(2. * dtheta)) * RC
+
+    return np.sqrt((dLp / SL)**2 + (dCp / SC)**2 + (dHp / SH)**2 + RT * (dCp / SC) * (dHp / SH))
+
+
+def color_distance(a, b, metric = "euclidean", pairwise = False, chunksize = 2**20):
+    """Color Distance
+
+    Computes the distance (color difference) between the colors of
+    two color objects, either elementwise (colors in `a` and `b` pairwise,
+    both of length `N`) or between all colors in `a` and all colors in
+    `b` (`pairwise = True`; matrix of dimension `N x M`).
+
+    Metrics:
+
+    * `"euclidean"`: Euclidean distance between the coordinates of the
+      color space of the two objects (must be of the same class; sRGB
+      coordinates for hex colors), ignoring alpha.
+    * `"deltaE76"`: CIE76 color difference (Euclidean distance in CIELAB).
+    * `"deltaE2000"`: CIEDE2000 color difference.
+
+    The distances are computed in chunks of (at most) `chunksize` distances
+    at a time, limiting the memory needed for temporary objects when
+    computing large distance matrices.
+
+    Args:
+        a (colorobject, str, list): Object which inherits from `colorobject`,
+            or hex color(s) (str or list of str).
+        b (colorobject, str, list): See `a`. For elementwise distances
+            `a` and `b` must contain the same number of colors, or one color only.
+        metric (str): One of `"euclidean"` (default), `"deltaE76"`, or `"deltaE2000"`.
+        pairwise (bool): If `False` (default) the elementwise distances
+            are returned, else the distance matrix.
+        chunksize (int): Number of distances computed at once, defaults to `2**20`.
+
+    Returns:
+        numpy.ndarray: Array of length `N` (elementwise distances) or
+        `numpy.ndarray` of shape `(N, M)` (`pairwise = True`).
+
+    Example:
+
+        >>> from colorspace import hexcols, color_distance
+        >>> a = hexcols(["#ff00ff", "#003300", "#0000ff"])
+        >>> b = hexcols(["#ff00ee", "#003300", "#ff0000"])
+        >>> color_distance(a, b)
+        >>> #:
+        >>> color_distance(a, b, metric = "deltaE2000")
+        >>> #: Distance matrix
+        >>> color_distance(a, b, metric = "deltaE2000", pairwise = True)
+
+    Raises:
+        TypeError: If `a` or `b` are neither color objects nor hex colors.
+        ValueError: If `metric` is not one of the allowed metrics.
+        TypeError: If `metric = "euclidean"` and `a` and `b` are not of the same class.
+        TypeError: If `pairwise` is not bool.
+        TypeError: If `chunksize` is not int.
+        ValueError: If `chunksize` is not positive.
+        ValueError: If `a` and `b` do not contain the same number of colors
+            (only if `pairwise = False`).
+        Exception: If `metric` is `"deltaE76"` or `"deltaE2000"` and the conversion
+            of `a` or `b` into CIELAB is ambiguous (`HSV`, `HLS`; see :py:func:`to`).
+    """
+
+    if isinstance(a, (str, list)): a = hexcols(a)
+    if isinstance(b, (str, list)): b = hexcols(b)
+    if not isinstance(a, colorobject):
+        raise TypeError("argument `a` must be an object based on colorspace.colorlib.colorobject or hex colors")
+    if not isinstance(b, colorobject):
+        raise TypeError("argument `b` must be an object based on colorspace.colorlib.colorobject or hex colors")
+    if not isinstance(metric, str) or not metric in ["euclidean", "deltaE76", "deltaE2000"]:
+        raise ValueError("argument `metric` must be one of \"euclidean\", \"deltaE76\", or \"deltaE2000\"")
+    if metric == "euclidean" and not type(a) == type(b):
+        raise TypeError("for `metric = \"euclidean\"` input `a` and `b` must be of same type")
+    if not isinstance(pairwise, bool):
+        raise TypeError("argument `pairwise` must be bool")
+    if not isinstance(chunksize, int) or isinstance(chunksize, bool):
+        raise TypeError("argument `chunksize` must be int")
+    elif chunksize < 1:
+        raise ValueError("argument `chunksize` must be positive")
+    if not pairwise and not (a.length() == b.length() or 1 in [a.length(), b.length()]):
+        raise ValueError("objects do not contain the same number of colors")
+
+    # Coordinates as arrays of shape (N, 3)
+    def coords(x):
+        if metric == "euclidean" and isinstance(x, hexcols):
+            x = x._convert_coords_("sRGB")
+        elif metric == "euclidean":
+            x = x._convert_coords_(x.__class__.__name__)
+        else:
+            x._check_ambiguous_("CIELAB")
+            x = x._convert_coords_("CIELAB")
+        return np.transpose(np.asarray(x, dtype = float))
+    [x, y] = [coords(a), coords(b)]
+
+    if pairwise:
+        res  = np.empty((len(x), len(y)))
+        step = max(1, chunksize // max(1, len(y)))
+        for i in range(0, len(x), step):
+            res[i:i + step] = _deltaE_(x[i:i + step, np.newaxis, :], y[np.newaxis, :, :], metric)
+    else:
+        n    = max(len(x), len(y))
+        res  = np.empty(n if min(len(x), len(y)) > 0 else 0)
+        for i in range(0, len(res), chunksize):
+            res[i:i + chunksize] = _deltaE_(x[i:i + chunksize] if len(x) > 1 else x,
+                                            y[i:i + chunksize] if len(y) > 1 else y, metric)
+    return res
@@ -55,7 +55,6 @@ def cvd_image(image = "DEMO", cvd = "desaturate", severity = 1.0,
     """
 
     import os
-    import inspect
 
     # Conver to ..?
     allowed = ["protan", "tritan", "deutan", "desaturate", "original"]
@@ -95,28 +94,12 @@ def cvd_image(image = "DEMO", cvd = "desaturate", severity = 1.0,
         img = imageio.imread(image)
     except Exception as e:
         raise IOError(str(e))
-
-    # Extracting colors (scale from [0,255] to [0.,1.])
-    data = {}
-    if img.shape[2] == 3:
-        [data["R"], data["G"], data["B"]] = \
-                [img[:,:,i].flatten() / 255. for i in [0,1,2]]
-    elif img.shape[2] == 4:
-        [data["R"], data["G"], data["B"], data["alpha"]] = \
-                [img[:,:,i].flatten() / 255. for i in [0,1,2,3]]
-
-    # Create sRGB with or without
-    from .colorlib import sRGB
-    if not "alpha" in data.keys():
-        rgba = sRGB(data["R"], data["G"], data["B"])
-    else:
-        rgba = sRGB(data["R"], data["G"], data["B"], data["alpha"])
+    if img.dtype != "uint8":
+        raise IOError(f"only 8 bit images supported, got {img.dtype}")
 
     # Drop alpha
-    if dropalpha: rgba.dropalpha()
+    if img.ndim == 3 and img.shape[2] == 4 and dropalpha: img = img[:, :, :3]
 
-    # Apply color deficiency
-    from . import CVD
     try:
         import matplotlib.pyplot as plt
     except Exception as e:
@@ -136,32 +119,9 @@ def cvd_image(image = "DEMO", cvd = "desaturate", severity = 1.0,
         else:
             fig = plt.subplot(nrow, ncol, c + 1)
 
-        if cvd[c] == "original":
-            cols = rgba
-        else:
-            fun  = getattr(CVD, cvd[c])
-            cols = fun(rgba, severity)
-
-        # Convert RGB [0.-1.] to [0,255], uint8
-        def fun(x, shape):
-            from numpy import fmin, fmax
-            x = fmax(0, fmin(255, x*255))
-            return x.reshape(shape)
-
-        # Shape of the new figure
-        if cols.hasalpha():  shape = [img.shape[0],img.shape[1],4]
-        else:                shape = [img.shape[0],img.shape[1],3]
-
-        # Create new image matrix and fill in the data
-        from numpy import ndarray, uint8
-        imnew = ndarray(shape, dtype = uint8)
-        imnew[:,:,0] = fun(cols.get("R"), shape[0:2])
-        imnew[:,:,1] = fun(cols.get("G"), shape[0:2])
-        imnew[:,:,2] = fun(cols.get("B"), shape[0:2])
-        if cols.hasalpha():
-            imnew[:,:,3] = fun(cols.get("alpha"), shape[0:2])
+        # Apply color deficiency
+        imnew = simulate_cvd_image(img, cvd[c], severity)
 
-        import matplotlib.pyplot as plt
         plt.imshow(imnew)
         plt.axis("off")
 
@@ -182,3 +142,125 @@ def cvd_image(image = "DEMO", cvd = "desaturate", severity = 1.0,
 
     return output
 
+
+
+def simulate_cvd_image(img, cvd = "deutan", severity = 1.0, linear = True,
+        out = None, tilesize = 2**18, cores = 1):
+    """Simulate Color Vision Deficiencies on Image Data
+
+    Headless version of :py:func:`cvd_image` working on image data
+    (`numpy.ndarray`). The image is processed in blocks of rows (tiles) which
+    can be distributed across multiple threads. The conversions between
+    sRGB and linear RGB use lookup tables (256 entries for the 8 bit input,
+    65536 entries for the output) and the transformation matrices are
+    applied in single precision. The simulated
+    tiles are written directly into `out` (e.g., a `numpy.memmap`), thus the
+    memory required is a small multiple of the tile size.
+
+    The alpha channel (if any) is not modified.
+
+    Args:
+        img (numpy.ndarray): Image data of shape `(height, width, 3)` (RGB) or
+            `(height, width, 4)` (RGBA), unsigned 8 bit integers.
+        cvd (str): Color vision deficiency; one of `"deutan"`, `"protan"`,
+            `"tritan"`, `"desaturate"`, and `"original"` (unmodified).
+        severity (float): How severe the color vision deficiency is
+            (`[0.,1.]`). Also used as the amount of desaturation if
+            `cvd = "desaturate"`.
+        linear (bool): Should the color vision deficiency transformation be
+            applied to the linearised RGB coordinates (default)? See :py:func:`deutan`.
+        out (None, numpy.ndarray): Array (e.g., `numpy.memmap`) of the same shape
+            as `img` with dtype uint8 the result is written into. If `None` (default)
+            a new array is allocated.
+        tilesize (int): Approximate number of pixels processed at once
+            (whole rows), defaults to `2**18`.
+        cores (int): Number of threads used to process the tiles, defaults to `1`.
+
+    Returns:
+        numpy.ndarray: Simulated image data (unsigned 8 bit integers) of the
+        same shape as `img`; `out` if provided.
+
+    Example:
+
+        >>> from colorspace import simulate_cvd_image
+        >>> import numpy as np
+        >>> img = np.random.default_rng(1).integers(0, 256, (200, 300, 3), dtype = np.uint8)
+        >>> res = simulate_cvd_image(img, "deutan", 0.8)
+        >>> res.shape
+
+    Raises:
+        TypeError: If `img` is not a uint8 numpy.ndarray of shape `(height, width, 3 or 4)`.
+        ValueError: If `cvd` is not among the allowed types.
+        ValueError: If `severity` is not a float in `[0., 1.]`.
+        TypeError: If `linear` is not bool.
+        ValueError: If `out` is of wrong shape or dtype.
+        TypeError: If `tilesize` or `cores` are not int.
+        ValueError: If `tilesize` or `cores` are not positive.
+    """
+
+    import numpy as np
+    from concurrent.futures import ThreadPoolExecutor
+
+    allowed = ["protan", "tritan", "deutan", "desaturate", "original"]
+    if not isinstance(img, np.ndarray) or not img.dtype == np.uint8 or \
+       not img.ndim == 3 or not img.shape[2] in [3, 4]:
+        raise TypeError("argument `img` must be a uint8 numpy.ndarray of shape (height, width, 3 or 4)")
+    if not isinstance(cvd, str) or not cvd in allowed:
+        raise ValueError(f"argument `cvd` must be one of {', '.join(allowed)}")
+    if not isinstance(severity, (int, float)) or isinstance(severity, bool) or \
+       not 0. <= severity <= 1.:
+        raise ValueError("argument `severity` must be float in `[0., 1.]`")
+    if not isinstance(linear, bool):
+        raise TypeError("argument `linear` must be bool")
+    if out is None:
+        out = np.empty_like(img)
+    elif not isinstance(out, np.ndarray) or not out.shape == img.shape or not out.dtype == np.uint8:
+        raise ValueError("argument `out` must be a uint8 numpy.ndarray of the same shape as `img`")
+    for name, val in {"tilesize": tilesize, "cores": cores}.items():
+        if not isinstance(val, int) or isinstance(val, bool):
+            raise TypeError(f"argument `{name}` must be int")
+        elif val < 1:
+            raise ValueError(f"argument `{name}` must be positive")
+
+    # Transformation matrix and lookup tables. sRGB (8 bit) to linear RGB,
+    # and linear RGB (quantized to 16 bit) back to the nearest 8 bit sRGB
+    # value (using the linear RGB values half way between two sRGB values).
+    if cvd in ["protan", "tritan", "deutan"]:
+        from .CVD import _cvd_transform_
+        from .colorlib import colorlib, colorobject
+        M = _cvd_transform_([cvd], [float(severity)])[0, 0].astype(np.float32)
+        if linear:
+            clib   = colorlib(validate = False)
+            to_lin = lambda x: clib.sRGB_to_RGB(x, x, x, colorobject.GAMMA)[0]
+        else:
+            to_lin = lambda x: x
+        lut_in  = to_lin(np.arange(256) / 255.).astype(np.float32)
+        lut_out = np.searchsorted(to_lin((np.arange(255) + .5) / 255.),
+                                  np.arange(65536) / 65535., side = "right").astype(np.uint8)
+
+    def fn(i):
+        block = img[i:i + rows, :, :3]
+        if cvd == "original":
+            res = block
+        elif cvd == "desaturate":
+            from .CVD import desaturate
+            from .colorlib import sRGB
+            x   = block.reshape((-1, 3)) / 255.
+            x   = desaturate(sRGB(x[:, 0], x[:, 1], x[:, 2]), float(severity))
+            res = np.stack([x.get(k, copy = False) for k in ["R", "G", "B"]], axis = 1)
+            res = np.floor(np.clip(res, 0., 1.) * 255. + .5).astype(np.uint8)
+        else:
+            res = np.clip(lut_in[block] @ M, 0., 1.)
+            res = lut_out[(res * np.float32(65535.) + np.float32(.5)).astype(np.int32)]
+        out[i:i + rows, :, :3] = res.reshape(block.shape)
+        if img.shape[2] == 4: out[i:i + rows, :, 3] = img[i:i + rows, :, 3]
+
+    # Process blocks of rows
+    rows = max(1, tilesize // max(1, img.shape[1]))
+    if cores == 1:
+        for i in range(0, img.shape[0], rows): fn(i)
+    else:
+        with ThreadPoolExecutor(max_workers = cores) as pool:
+            list(pool.map(fn, range(0, img.shape[0], rows)))
+
+    return out
@@ -335,20 +335,16 @@ def hclplot(x, _type = None, h = None, c = None, l = None, axes = True,
     # ---------------------------------------------------------------
     def conv_colors(nd):
         from .colorlib import polarLUV
-        hexcols = polarLUV(H = nd[0], C = np.abs(nd[1]), L = nd[2])
-        hexcols.to("hex", fixup = False)
+        cols = polarLUV(H = nd[0], C = np.abs(nd[1]), L = nd[2])
 
-        # Find colors where |C| > 0 and L < 1
-        kill_lum = np.where(np.logical_and(np.abs(nd[1]) > 0, nd[2] < 1))[0]
-
-        # Find 'nan' colors (due to fixup)
-        kill_nan = np.where([x is None for x in hexcols.colors()])[0]
-        kill = np.unique(np.concatenate((kill_lum, kill_nan), 0))
+        # Keep colors within the gamut (same tolerance as used when
+        # converting to hex) except colors where |C| > 0 and L < 1
+        keep = cols.in_gamut(atol = 1. / (2 * 255.))
+        keep = np.logical_and(keep, ~np.logical_and(np.abs(nd[1]) > 0, nd[2] < 1))
 
         # Deleting coordinates and colors we do not need
-        nd      = np.delete(nd, kill, axis = 1)
-        nd_cols = hexcols.colors()
-        nd_cols = np.delete(nd_cols, kill)
+        nd      = nd[:, keep]
+        nd_cols = np.asarray(cols[keep].colors())
 
         return nd, nd_cols
 
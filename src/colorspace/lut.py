@@ -0,0 +1,303 @@
+
+# Three-dimensional lookup tables (3D LUTs) for per-pixel color transformations.
+#
+# Any transformation of sRGB colors (e.g., simulating color vision deficiencies,
+# desaturation, lightening/darkening) is evaluated once on a regular grid
+# spanning the sRGB cube. Images are then transformed by interpolating the
+# table (trilinear or tetrahedral) instead of converting each pixel.
+
+import numpy as np
+
+
+class lut3d:
+    """Three-Dimensional Color Lookup Table
+
+    Lookup table (LUT) of a color transformation evaluated on a regular grid
+    of `size x size x size` nodes spanning the sRGB cube (`[0., 1.]`).
+    Usually created via :py:func:`bake_lut` or loaded from disc via
+    :py:func:`load_lut`.
+
+    Args:
+        table (numpy.ndarray): Array of shape `(size, size, size, 3)` with the
+            transformed sRGB coordinates, indexed `[red, green, blue]`.
+        name (None, str): Optional name of the lookup table.
+
+    Examples:
+
+        >>> from colorspace import bake_lut, deutan
+        >>> lut = bake_lut(deutan, size = 17, name = "deutan")
+        >>> lut
+        >>> #: Apply lookup table on image data
+        >>> import numpy as np
+        >>> img = np.random.default_rng(1).integers(0, 256, (20, 30, 3), dtype = np.uint8)
+        >>> lut.apply(img).shape
+
+    Raises:
+        TypeError: If `table` is not a numpy.ndarray.
+        ValueError: If `table` is not of shape `(size, size, size, 3)` with `size >= 2`.
+        TypeError: If `name` is neither None nor str.
+    """
+
+    def __init__(self, table, name = None):
+        if not isinstance(table, np.ndarray):
+            raise TypeError("argument `table` must be a numpy.ndarray")
+        elif not table.ndim == 4 or not table.shape[3] == 3 or table.shape[0] < 2 or \
+             not table.shape[0] == table.shape[1] == table.shape[2]:
+            raise ValueError("argument `table` must be of shape (size, size, size, 3), size >= 2")
+        if not isinstance(name, (type(None), str)):
+            raise TypeError("argument `name` must be None or str")
+
+        self.table = np.ascontiguousarray(table, dtype = float)
+        """`numpy.ndarray` of shape `(size, size, size, 3)`."""
+        self.name  = name
+        """Name of the lookup table (None or str)."""
+
+    def __repr__(self):
+        return f"3D LUT \"{self.name}\" ({self.size()}^3 nodes)" if self.name else \
+               f"3D LUT ({self.size()}^3 nodes)"
+
+    def size(self):
+        """Number of Nodes
+
+        Returns:
+            int: Number of nodes along each dimension of the lookup table.
+        """
+        return self.table.shape[0]
+
+    def apply(self, x, method = "trilinear", chunksize = 2**18):
+        """Apply Lookup Table
+
+        Transforms colors by interpolating the lookup table.
+
+        Args:
+            x (numpy.ndarray, colorobject, str, list): Image data or colors; an array
+                of shape `(..., 3)` (RGB) or `(..., 4)` (RGBA) with sRGB coordinates,
+                either unsigned 8 bit integers (`[0, 255]`) or float (`[0., 1.]`), a
+                colorobject (e.g., `hexcols`, `HCL`), or hex colors.
+            method (str): Interpolation method, either `"trilinear"` (default)
+                or `"tetrahedral"`.
+            chunksize (int): Number of colors (pixels) processed at once,
+                defaults to `2**18`.
+
+        Returns:
+            numpy.ndarray, sRGB: Transformed colors. If `x` is an array, an array of
+            the same shape and dtype (alpha not modified), else an `sRGB` colorobject.
+
+        Raises:
+            TypeError: If `x` is not among the allowed types.
+            ValueError: If `x` is not of shape `(..., 3)` or `(..., 4)`.
+            ValueError: If `method` is not valid.
+            TypeError: If `chunksize` is not int.
+            ValueError: If `chunksize` is not positive.
+        """
+        from .colorlib import colorobject, hexcols, sRGB
+
+        if not method in ["trilinear", "tetrahedral"]:
+            raise ValueError("argument `method` must be \"trilinear\" or \"tetrahedral\"")
+        if not isinstance(chunksize, int) or isinstance(chunksize, bool):
+            raise TypeError("argument `chunksize` must be int")
+        elif chunksize < 1:
+            raise ValueError("argument `chunksize` must be positive")
+
+        # Hex colors and color objects; returns sRGB
+        if isinstance(x, (str, list)):
+            x = hexcols(x)
+        if isinstance(x, colorobject):
+            rgb = np.stack(x._convert_coords_("sRGB"), axis = 1)
+            res = self._interpolate_(np.clip(rgb, 0., 1.), method)
+            alpha = x.get("alpha")
+            return sRGB(res[:, 0], res[:, 1], res[:, 2], alpha)
+        elif not isinstance(x, np.ndarray) or not x.dtype.kind in "uf":
+            raise TypeError("argument `x` must be a numpy.ndarray (uint8 or float) or colorobject")
+        elif x.ndim < 1 or not x.shape[-1] in [3, 4]:
+            raise ValueError("argument `x` must be of shape (..., 3) or (..., 4)")
+        elif x.dtype.kind == "u" and not x.dtype == np.uint8:
+            raise TypeError("argument `x` must be a numpy.ndarray (uint8 or float) or colorobject")
+
+        flat = x.reshape((-1, x.shape[-1]))
+        res  = np.empty_like(flat)
+        for i in range(0, len(flat), chunksize):
+            tmp = flat[i:i + chunksize, :3]
+            tmp = tmp / 255. if x.dtype == np.uint8 else np.clip(tmp, 0., 1.)
+            tmp = self._interpolate_(tmp, method)
+            res[i:i + chunksize, :3] = np.floor(tmp * 255. + .5) if x.dtype == np.uint8 else tmp
+        if x.shape[-1] == 4: res[:, 3] = flat[:, 3]
+        return res.reshape(x.shape)
+
+    def _interpolate_(self, x, method):
+        """Interpolates the table at the sRGB coordinates `x` (array `(N, 3)`, `[0., 1.]`)."""
+        n   = self.size()
+        pos = x * (n - 1)
+        idx = np.clip(np.floor(pos).astype(np.intp), 0, n - 2)
+        f   = pos - idx
+        tab = self.table.reshape((-1, 3))
+        stride = np.asarray([n * n, n, 1])
+        base   = idx @ stride
+
+        if method == "trilinear":
+            # Interpolating along blue, then green, then red
+            fr, fg, fb = f[:, [0]], f[:, [1]], f[:, [2]]
+            res = None
+            for r in range(2):
+                tmp = None
+                for g in range(2):
+                    node = base + r * stride[0] + g * stride[1]
+                    lo   = tab[node]
+                    val  = lo + fb * (tab[node + 1] - lo)
+                    tmp  = val if tmp is None else tmp + fg * (val - tmp)
+                res = tmp if res is None else res + fr * (tmp - res)
+            return res
+
+        # Tetrahedral; walking from the lower to the upper corner of the cell
+        # along the axes ordered by decreasing fractional part.
+        order = np.argsort(-f, axis = 1, kind = "stable")
+        fs    = np.take_along_axis(f, order, axis = 1)
+        steps = stride[order]
+        w     = np.column_stack([1. - fs[:, 0], fs[:, 0] - fs[:, 1], fs[:, 1] - fs[:, 2], fs[:, 2]])
+        node  = base
+        res   = w[:, [0]] * tab[node]
+        for i in range(3):
+            node = node + steps[:, i]
+            res += w[:, [i + 1]] * tab[node]
+        return res
+
+    def save(self, file):
+        """Save Lookup Table
+
+        Writes the lookup table to disc, either as a numpy binary file
+        (`.npy`) or as an Adobe/Resolve `.cube` file (text). Load it again
+        via :py:func:`load_lut`.
+
+        Args:
+            file (str): Name of the file, must end on `.npy` or `.cube`.
+
+        Raises:
+            TypeError: If `file` is not str.
+            ValueError: If the file extension is not `.npy` or `.cube`.
+        """
+        if not isinstance(file, str):
+            raise TypeError("argument `file` must be str")
+        elif file.lower().endswith(".npy"):
+            np.save(file, self.table)
+        elif file.lower().endswith(".cube"):
+            with open(file, "w") as fid:
+                if self.name: fid.write(f"TITLE \"{self.name}\"\n")
+                fid.write(f"LUT_3D_SIZE {self.size()}\n")
+                # Red changes fastest
+                np.savetxt(fid, self.table.transpose((2, 1, 0, 3)).reshape((-1, 3)), fmt = "%.8f")
+        else:
+            raise ValueError("argument `file` must end on \".npy\" or \".cube\"")
+
+
+def bake_lut(fun, size = 33, name = None):
+    """Create 3D Lookup Table
+
+    Evaluates a color transformation on a regular grid of `size^3` colors
+    spanning the sRGB cube and stores the result as a :py:class:`lut3d`, which
+    can be applied to (large) images or sets of colors at a fraction of
+    the cost of the transformation itself.
+
+    Args:
+        fun (callable): Function taking one argument, an `sRGB` colorobject,
+            and returning the transformed colors as a colorobject (any color
+            space), list of hex colors, or an array of shape `(N, 3)` with sRGB
+            coordinates. E.g., :py:func:`deutan <colorspace.CVD.deutan>` or
+            :py:func:`desaturate <colorspace.CVD.desaturate>`.
+        size (int): Number of nodes along each dimension, defaults to `33`.
+        name (None, str): Optional name of the lookup table.
+
+    Returns:
+        lut3d: Lookup table; the transformed sRGB coordinates are limited to `[0., 1.]`.
+
+    Examples:
+
+        >>> from colorspace import bake_lut, desaturate, protan
+        >>> lut = bake_lut(lambda x: desaturate(x, 0.5), size = 17)
+        >>> lut
+        >>> #:
+        >>> lut = bake_lut(lambda x: protan(x, 0.8), name = "protan 0.8")
+        >>> lut.apply(["#ff0000", "#00ff00"])
+
+    Raises:
+        TypeError: If `fun` is not callable.
+        TypeError: If `size` is not int.
+        ValueError: If `size` is smaller than `2`.
+        ValueError: If `fun` does not return the expected number of colors.
+    """
+    from .colorlib import colorobject, hexcols, sRGB
+
+    if not callable(fun):
+        raise TypeError("argument `fun` must be callable")
+    if not isinstance(size, int) or isinstance(size, bool):
+        raise TypeError("argument `size` must be int")
+    elif size < 2:
+        raise ValueError("argument `size` must be >= 2")
+
+    grid = np.meshgrid(*[np.linspace(0., 1., size)] * 3, indexing = "ij")
+    res  = fun(sRGB(*[x.ravel() for x in grid]))
+
+    if isinstance(res, (str, list)):
+        res = hexcols(res)
+    if isinstance(res, colorobject):
+        res = np.stack(res._convert_coords_("sRGB"), axis = 1)
+    res = np.asarray(res, dtype = float)
+    if not res.shape == (size**3, 3):
+        raise ValueError("`fun` must return one color for each color provided")
+
+    return lut3d(np.clip(res, 0., 1.).reshape((size, size, size, 3)), name = name)
+
+
+def load_lut(file):
+    """Load 3D Lookup Table
+
+    Loads a lookup table from a numpy binary file (`.npy`) or an
+    Adobe/Resolve `.cube` file (see :py:func:`lut3d.save`).
+
+    Args:
+        file (str): Name of the file, must end on `.npy` or `.cube`.
+
+    Returns:
+        lut3d: The lookup table.
+
+    Raises:
+        TypeError: If `file` is not str.
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file extension is not `.npy` or `.cube`.
+        ValueError: If the file does not contain a valid 3D lookup table.
+    """
+    import os
+    import re
+
+    if not isinstance(file, str):
+        raise TypeError("argument `file` must be str")
+    elif not os.path.isfile(file):
+        raise FileNotFoundError(f"file \"{file}\" does not exist")
+
+    if file.lower().endswith(".npy"):
+        return lut3d(np.load(file))
+    elif not file.lower().endswith(".cube"):
+        raise ValueError("argument `file` must end on \".npy\" or \".cube\"")
+
+    name, size, data = None, None, []
+    with open(file, "r") as fid:
+        for line in fid:
+            line = line.strip()
+            if len(line) == 0 or line.startswith("#"):
+                continue
+            elif line.startswith("TITLE"):
+                name = re.sub("^TITLE\\s+\"?(.*?)\"?$", "\\1", line)
+            elif line.startswith("LUT_3D_SIZE"):
+                size = int(line.split()[1])
+            elif line.startswith("DOMAIN_MIN") or line.startswith("DOMAIN_MAX"):
+                if not [float(x) for x in line.split()[1:]] == \
+                       ([0.] * 3 if line.startswith("DOMAIN_MIN") else [1.] * 3):
+                    raise ValueError("only `.cube` files with domain [0, 1] are supported")
+            elif re.match("^[A-Z_0-9]+\\s", line):
+                raise ValueError(f"unsupported keyword in \"{file}\": {line.split()[0]}")
+            else:
+                data.append([float(x) for x in line.split()])
+
+    if size is None or not len(data) == size**3:
+        raise ValueError(f"file \"{file}\" does not contain a valid 3D lookup table")
+    table = np.asarray(data, dtype = float).reshape((size, size, size, 3)).transpose((2, 1, 0, 3))
+    return lut3d(table, name = name)
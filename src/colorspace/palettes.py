@@ -186,7 +186,7 @@ class palette:
         """
         return self._name
 
-    def colors(self, *args, **kwargs):
+    def colors(self, *args, format = "hex", **kwargs):
         """Get Palette Colors
 
         Returns the colors of the current palette as a list
@@ -194,18 +194,28 @@ class palette:
 
         Args:
             *args: Ignored.
+            format (str): Output format. `"hex"` (default) returns a list of hex
+                colors, `"rgb"`, `"rgba"`, `"rgba8"`, or `"hcl"` a numpy.ndarray
+                (see :py:func:`colorobject.colors <colorspace.colorlib.colorobject.colors>`).
             **kwargs: Ignored.
 
         Returns:
-            list: List of all colors of the palette.
+            list, numpy.ndarray: List of all colors of the palette, or a
+            numpy.ndarray if `format` is not `"hex"`.
 
         Examples:
             >>> from colorspace import palette
             >>> pal = palette(["#11C638", "#E2E2E2", "#EF9708"],
             >>>               name = "My Custom Palette")
             >>> pal.colors()
+            >>> #: Colors as unsigned 8 bit integers (RGBA)
+            >>> pal.colors(format = "rgba8")
         """
-        return self._colors
+        if format == "hex":
+            return self._colors
+
+        from .colorlib import hexcols
+        return hexcols(self._colors).colors(format = format)
 
     def swatchplot(self, **kwargs):
         """Palette Swatch Plot
@@ -285,6 +295,157 @@ class palette:
         return hclplot(x = self.colors(), **kwargs)
 
 
+    def nearest(self, colors, space = "CIELAB", chunksize = 2**20, cores = 1):
+        """Nearest Palette Color
+
+        Finds the nearest color of the palette for each color in `colors`
+        (e.g., to quantize images), using the Euclidean distance in the
+        color space `space` (the CIE76 color difference for `"CIELAB"`).
+        Alpha is ignored.
+
+        The colors are processed in chunks of `chunksize` colors, optionally
+        in parallel (threads). For large `numpy.uint8` arrays (more than
+        `256**3` colors) a precomputed grid with the nearest palette
+        color for all `256**3` sRGB colors is used (computed once per
+        palette and `space`), avoiding the conversion of the individual colors.
+        Distances from the grid are stored in single precision.
+
+        Args:
+            colors (colorobject, str, list, numpy.ndarray): Colors to look up;
+                an object which inherits from `colorobject`, hex colors (str
+                or list of str), or an array of shape `(..., 3)` with sRGB
+                coordinates (float in `[0., 1.]` or `numpy.uint8` in `[0, 255]`).
+            space (str): Color space in which the distances are calculated, one of
+                `"CIELAB"` (default), `"CIELUV"`, `"CIEXYZ"`, `"RGB"`, or `"sRGB"`.
+            chunksize (int): Number of colors processed at once, defaults to `2**20`.
+            cores (int): Number of threads used to process the chunks, defaults to `1`.
+
+        Returns:
+            tuple: Two `numpy.ndarray`s with the index of the nearest palette
+            color and the distance to it. Both are of length `N` (number of
+            colors) or of shape `colors.shape[:-1]` if `colors` is an array.
+
+        Example:
+
+            >>> from colorspace import palette, qualitative_hcl, hexcols
+            >>> pal = palette(qualitative_hcl("Dark 3"), n = 5)
+            >>> [idx, dist] = pal.nearest(["#ff0000", "#00ff00", "#0000ff"])
+            >>> idx
+            >>> #:
+            >>> dist
+            >>> #: Quantize an image (array of shape (height, width, 3))
+            >>> import numpy as np
+            >>> img = np.random.default_rng(1).integers(0, 256, (4, 6, 3), dtype = np.uint8)
+            >>> [idx, dist] = pal.nearest(img)
+            >>> hexcols(pal.colors())[idx.ravel()]
+
+        Raises:
+            TypeError: If `colors` is not of one of the allowed types.
+            ValueError: If `colors` is an array whose last dimension is not of length 3.
+            ValueError: If `space` is not one of the allowed color spaces.
+            TypeError: If `chunksize` or `cores` are not int.
+            ValueError: If `chunksize` or `cores` are not positive.
+        """
+        import numpy as np
+        from concurrent.futures import ThreadPoolExecutor
+        from .colorlib import colorobject, hexcols
+
+        if not isinstance(space, str) or not space in ["CIELAB", "CIELUV", "CIEXYZ", "RGB", "sRGB"]:
+            raise ValueError("argument `space` must be one of \"CIELAB\", \"CIELUV\", " + \
+                             "\"CIEXYZ\", \"RGB\", or \"sRGB\"")
+        for name, val in {"chunksize": chunksize, "cores": cores}.items():
+            if not isinstance(val, int) or isinstance(val, bool):
+                raise TypeError(f"argument `{name}` must be int")
+            elif val < 1:
+                raise ValueError(f"argument `{name}` must be positive")
+
+        if isinstance(colors, (str, list)):
+            colors = hexcols(colors)
+        if isinstance(colors, colorobject):
+            shape = (colors.length(),)
+            x = np.transpose(np.asarray(colors._convert_coords_(space), dtype = float))
+            convert = lambda x: x
+        elif isinstance(colors, np.ndarray):
+            if colors.ndim < 1 or not colors.shape[-1] == 3:
+                raise ValueError("argument `colors` must be an array of shape (..., 3)")
+            shape = colors.shape[:-1]
+            x = colors.reshape((-1, 3))
+            convert = lambda x: self._nearest_convert_(x, space)
+        else:
+            raise TypeError("argument `colors` must be a colorobject, hex colors, or numpy.ndarray")
+
+        idx  = np.empty(len(x), dtype = np.intp)
+        dist = np.empty(len(x), dtype = float)
+
+        # Large uint8 arrays: look up the precomputed grid
+        if x.dtype == np.uint8 and len(x) > 256**3:
+            [gidx, gdist] = self._nearest_grid_(space, cores)
+            def fn(i):
+                k = (x[i:i + chunksize, 0].astype(np.int32) << 16) | \
+                    (x[i:i + chunksize, 1].astype(np.int32) << 8) | x[i:i + chunksize, 2]
+                idx[i:i + chunksize]  = gidx[k]
+                dist[i:i + chunksize] = gdist[k]
+        else:
+            pal = self._nearest_coords_(space)
+            def fn(i):
+                [idx[i:i + chunksize], dist[i:i + chunksize]] = \
+                        self._nearest_kernel_(convert(x[i:i + chunksize]), pal)
+
+        if cores == 1:
+            for i in range(0, len(x), chunksize): fn(i)
+        else:
+            with ThreadPoolExecutor(max_workers = cores) as pool:
+                list(pool.map(fn, range(0, len(x), chunksize)))
+
+        return (idx.reshape(shape), dist.reshape(shape))
+
+    def _nearest_coords_(self, space):
+        """Coordinates of the palette colors (array `(K, 3)`) in `space`, cached."""
+        import numpy as np
+        from .colorlib import hexcols
+        if not hasattr(self, "_nearest_cache_"): self._nearest_cache_ = {}
+        if not ("coords", space) in self._nearest_cache_:
+            res = hexcols(self.colors())._convert_coords_(space)
+            self._nearest_cache_[("coords", space)] = np.transpose(np.asarray(res, dtype = float))
+        return self._nearest_cache_[("coords", space)]
+
+    @staticmethod
+    def _nearest_convert_(x, space):
+        """Converts sRGB coordinates (array `(N, 3)`, float or uint8) into `space`
+        using the default white point and gamma (as for the palette colors)."""
+        import numpy as np
+        from .colorlib import _convert_coordinates_
+        x = x / 255. if x.dtype == np.uint8 else np.asarray(x, dtype = float)
+        return np.transpose(np.asarray(_convert_coordinates_(list(x.T), "sRGB", space)))
+
+    @staticmethod
+    def _nearest_kernel_(x, pal):
+        """Index of and distance to the nearest row of `pal` for all rows of `x`."""
+        import numpy as np
+        # Squared distances up to a constant (|x|^2), via one matrix product
+        d2  = np.sum(pal**2, axis = 1) - 2. * (x @ pal.T)
+        idx = np.argmin(d2, axis = 1)
+        return [idx, np.sqrt(np.sum((x - pal[idx])**2, axis = 1))]
+
+    def _nearest_grid_(self, space, cores = 1):
+        """Nearest palette color for all `256**3` sRGB colors (uint8), cached."""
+        import numpy as np
+        from concurrent.futures import ThreadPoolExecutor
+        if not hasattr(self, "_nearest_cache_"): self._nearest_cache_ = {}
+        if not ("grid", space) in self._nearest_cache_:
+            pal  = self._nearest_coords_(space)
+            gidx = np.empty(256**3, dtype = np.uint16 if len(pal) < 2**16 else np.intp)
+            gdst = np.empty(256**3, dtype = np.float32)
+            def fn(i):
+                k   = np.arange(i, i + 2**18, dtype = np.int32)
+                rgb = np.stack([k >> 16, (k >> 8) & 255, k & 255], axis = 1).astype(np.uint8)
+                [gidx[i:i + 2**18], gdst[i:i + 2**18]] = \
+                        self._nearest_kernel_(self._nearest_convert_(rgb, space), pal)
+            with ThreadPoolExecutor(max_workers = cores) as pool:
+                list(pool.map(fn, range(0, 256**3, 2**18)))
+            self._nearest_cache_[("grid", space)] = [gidx, gdst]
+        return self._nearest_cache_[("grid", space)]
+
     def cmap(self, continuous = True):
         """Create Matplotlib Compatible Color Map
 
@@ -517,6 +678,10 @@ class defaultpalette:
                 raise Exception(f"whoops, some code needed here in {self.__class__.__name__}.set")
 
 
+    def _copy_(self):
+        """Copy of the palette (with its own copy of the settings)."""
+        return defaultpalette(self._type_, self._method_, self._name_, dict(self._settings_))
+
     def get_settings(self):
         """Get All Palette Settings
 
@@ -601,19 +766,10 @@ class hclpalettes:
                     raise TypeError("not all elements in `files` are of type str")
 
         if files is None:
-            import glob
-            resource_package = dirname(__file__)
-            tmp = glob.glob(join(resource_package, "palconfig", "*.conf"))
             # Ensure files_regex is of appropriate type
             if not isinstance(files_regex, (str, type(None))):
                 raise TypeError("argument `filex_regex` must be None or str")
-            if files_regex:
-                from re import match
-                files = []
-                for f in tmp:
-                    if match(files_regex, f): files.append(f)
-            else:
-                files = tmp
+            files = _palette_config_files_(files_regex)
 
         # Input 'files' specified:
         if not len(files) > 0:
@@ -623,19 +779,14 @@ class hclpalettes:
                 raise FileNotFoundError(f"file \"{file}\" does not exist")
 
 
-        # Else trying to load palettes and append thenm to _palettes_
+        # Loading palettes from the (process-wide) palette registry. Each object
+        # gets its own copies of the palettes as they can be modified.
         self._palettes_ = {}
-        for file in files:
-            [palette_type, pals] = self._load_palette_config_(file)
-            if pals: self._palettes_[palette_type] = pals  # append
-
-        # A poor attempt to order the palettes somehow
-        x = list(self._palettes_.keys())
-        x.sort(reverse = True)
-        tmp = {}
-
-        for rec in x: tmp[rec] = self._palettes_[rec]
-        self._palettes_ = tmp
+        self._index_    = {} # Normalized name -> first palette with this name
+        for t, pals in _palette_registry_(files)[0].items():
+            self._palettes_[t] = [pal._copy_() for pal in pals]
+            for pal in self._palettes_[t]:
+                self._index_.setdefault(_normalize_palette_name_(pal.name()), pal)
 
 
     def __repr__(self):
@@ -765,6 +916,13 @@ class hclpalettes:
             the name as specified can be found.  Else an error will be dropped.
         """
 
+        # Index lookup. Palettes (types) can be removed or added on the object,
+        # thus checking if the palette is still part of it; else searching.
+        take_pal = self._index_.get(_normalize_palette_name_(name))
+        if take_pal is not None and \
+           any([x is take_pal for x in self._palettes_.get(take_pal.type(), [])]):
+            return take_pal
+
         # Try to find the palette with the name 'name'
         take_pal = None
         for type_,pals in self._palettes_.items():
@@ -783,9 +941,102 @@ class hclpalettes:
         # Else return list with palettes
         return take_pal
 
+    def colors_batch(self, n = 11, type_ = None, fixup = True):
+        """Get Colors of Multiple Palettes
+
+        Returns the colors of many palettes (and/or many different numbers
+        of colors) at once. Yields the same colors as calling
+        :py:func:`defaultpalette.colors` on each palette, but the H/C/L
+        trajectories of all palettes are stacked and converted to hex colors
+        in one single pass which is considerably faster, e.g., when creating
+        palette catalogs.
+
+        Args:
+            n (int, list): Number of colors (positive int), or a list of
+                positive int to get the palettes with different numbers of colors.
+            type_ (None, str, list): If `None` (default) all palettes are
+                processed. Else (partial) name of the palette type, or a list
+                of types (see :py:func:`get_palettes`).
+            fixup (bool): Should sRGB colors be corrected if they lie outside
+                the defined color space? Defaults to `True`.
+
+        Returns:
+            dict: Dictionary with one entry per palette (the name of the palette
+            as key; the first one is used if the name is not unique). If `n` is
+            int, the value is a list of str (hex colors), else a dictionary with
+            one list of hex colors for each element in `n`.
+
+        Examples:
+
+            >>> from colorspace import hclpalettes
+            >>> hclpals = hclpalettes()
+            >>> res = hclpals.colors_batch(5)
+            >>> res["Blues 2"]
+            >>> #: Different number of colors, selected types only
+            >>> res = hclpals.colors_batch([3, 5], type_ = ["Basic: Diverging", "Basic: Qualitative"])
+            >>> res["Blue-Red"]
+
+        Raises:
+            TypeError: If `n` is not int or list of int.
+            ValueError: If any `n` is not positive.
+            TypeError: If `type_` is not None, str, or list of str.
+            TypeError: If `fixup` is not bool.
+        """
+
+        import numpy as np
+        from .colorlib import HCL
+
+        single = isinstance(n, int)
+        nlist  = [n] if single else n
+        if not isinstance(nlist, list) or len(nlist) == 0 or \
+           not all([isinstance(x, int) and not isinstance(x, bool) for x in nlist]):
+            raise TypeError("argument `n` must be int or a non-empty list of int")
+        elif not all([x > 0 for x in nlist]):
+            raise ValueError("argument `n` must be positive")
+        if not isinstance(type_, (type(None), str, list)) or \
+           (isinstance(type_, list) and not all([isinstance(x, str) for x in type_])):
+            raise TypeError("argument `type_` must be None, str, or list of str")
+        if not isinstance(fixup, bool):
+            raise TypeError("argument `fixup` must be bool")
+
+        # Palettes to be processed; the first palette wins if names are not unique
+        if isinstance(type_, list):
+            pals = [pal for t in type_ for pal in self.get_palettes(t)]
+        else:
+            pals = self.get_palettes(type_)
+        tmp  = {}
+        for pal in pals: tmp.setdefault(pal.name(), pal)
+        pals = list(tmp.values())
+
+        # Calculate the H/C/L coordinates of all palettes (and all n)
+        mod    = __import__("colorspace")
+        coords = []
+        for pal in pals:
+            obj = getattr(mod, pal.method())(**dict(pal.get_settings()))
+            coords += [obj._hcl_coords_(k) for k in nlist]
+
+        # Convert all colors at once and split the result
+        coords = [np.concatenate([x[i] for x in coords]) for i in range(3)]
+        cols   = HCL(*coords).colors(fixup = fixup)
+        split  = np.cumsum([0] + nlist * len(pals))
+
+        res = {}
+        for i,pal in enumerate(pals):
+            tmp = [cols[split[j]:split[j + 1]] for j in range(i * len(nlist), (i + 1) * len(nlist))]
+            res[pal.name()] = tmp[0] if single else dict(zip(nlist, tmp))
+        return res
+
 
     # Helper method to load the palette config files.
-    def _load_palette_config_(self, file):
+    @staticmethod
+    def _load_palette_config_(file):
+        return hclpalettes._palettes_from_spec_(hclpalettes._read_palette_config_(file))
+
+    # Helper method to read (parse) a palette config file. Returns the
+    # specification as dict (JSON serializable; lambda functions are kept
+    # as str, stored as {"lambda": "<str>"}).
+    @staticmethod
+    def _read_palette_config_(file):
 
         import re
         import sys
@@ -802,7 +1053,7 @@ class hclpalettes:
             raise Exception(f"misspecification in palconfig file = \"{file}\": {str(e)}")
 
         # The dictionary which will be returned.
-        pals = []
+        spec = {"type": palette_type, "method": palette_method, "palettes": []}
 
         # Looping over all sections looking for palette specifications.
         for sec in CNF.sections():
@@ -832,23 +1083,34 @@ class hclpalettes:
                     else:
                         # Try to evaluate this as a lambda function.
                         try:
-                            val = eval(val)
-                            if not callable(val): raise Exception
+                            if not callable(eval(val)): raise Exception
                         except:
                             raise ValueError(f"element '{key}' for palette '{sec}' neither an int nor proper lambda function")
-                        # Append lambda function to the settings
-                        settings[key] = val
+                        # Append lambda function (str) to the settings
+                        settings[key] = {"lambda": val}
 
                 else:
                     settings[key] = int(val)
 
-            pals.append(defaultpalette(palette_type, palette_method, name, settings))
+            spec["palettes"].append([name, settings])
+
+        return spec
+
+    # Helper method to create the defaultpalette objects from a
+    # specification (see _read_palette_config_).
+    @staticmethod
+    def _palettes_from_spec_(spec):
+
+        pals = []
+        for name, settings in spec["palettes"]:
+            settings = {k: eval(v["lambda"]) if isinstance(v, dict) else v for k, v in settings.items()}
+            pals.append(defaultpalette(spec["type"], spec["method"], name, settings))
 
         # Return dictionary with palettes
         if len(pals) == 0:
             return [None, None]
         else:
-            return [palette_type, pals]
+            return [spec["type"], pals]
 
 
     def length(self):
@@ -883,6 +1145,367 @@ class hclpalettes:
         swatchplot(self, n = n)
 
 
+# -------------------------------------------------------------------
+# Process-wide palette registry. Palette config files are only parsed
+# once (and again if modified), the palettes are indexed by their
+# normalized name.
+# -------------------------------------------------------------------
+from threading import RLock
+_PALETTE_REGISTRY_      = {"dir": None, "artifact": None, "files": {}, "sets": {}}
+_PALETTE_REGISTRY_LOCK_ = RLock()
+
+def _normalize_palette_name_(name):
+    """Normalized palette name (upper case, blanks removed) used for matching."""
+    return name.upper().replace(" ", "")
+
+def _palette_config_files_(files_regex = None):
+    """Palette Config Files Shipped With the Package
+
+    Args:
+        files_regex (None, str): Additional regular expression to filter files.
+
+    Returns:
+        list: List of str, paths to the palette config files.
+    """
+    from os.path import dirname, join, getmtime
+    import glob
+
+    # Listing files again if the directory has been modified
+    path  = join(dirname(__file__), "palconfig")
+    mtime = getmtime(path)
+    with _PALETTE_REGISTRY_LOCK_:
+        rec = _PALETTE_REGISTRY_.get("dir")
+        if rec is None or not rec[0] == mtime:
+            rec = [mtime, glob.glob(join(path, "*.conf"))]
+            _PALETTE_REGISTRY_["dir"] = rec
+    files = list(rec[1])
+    if files_regex:
+        from re import match
+        files = [f for f in files if match(files_regex, f)]
+    return files
+
+def _palette_registry_(files):
+    """Palette Registry
+
+    Thread-safe, process-wide cache of the palettes defined in the palette
+    config files (see `hclpalettes._load_palette_config_`). Each file is only
+    parsed once; files are parsed again if modified (modification time),
+    new (custom) files are parsed on first use.
+
+    Args:
+        files (list of str): Paths to the palette config files.
+
+    Returns:
+        list: List of two dicts. The palettes by palette type (ordered as
+        used by :py:class:`hclpalettes`) and the index, a dict with normalized
+        palette names (see `_normalize_palette_name_`) and a list of all
+        palettes with this name. The `defaultpalette` objects are shared,
+        they must not be modified.
+    """
+    from os.path import getmtime, abspath
+
+    files  = [abspath(f) for f in files]
+    mtimes = tuple([getmtime(f) for f in files])
+    key    = tuple(files)
+
+    with _PALETTE_REGISTRY_LOCK_:
+        rec = _PALETTE_REGISTRY_["sets"].get(key)
+        if rec is not None and rec[0] == mtimes: return rec[1]
+
+        palettes = {}
+        for file, mtime in zip(files, mtimes):
+            tmp = _PALETTE_REGISTRY_["files"].get(file)
+            if tmp is None or not tmp[0] == mtime:
+                # Precompiled specification if available, else parse the file
+                spec = _palette_artifact_spec_(file)
+                if spec is None:
+                    spec = hclpalettes._read_palette_config_(file)
+                tmp = [mtime, hclpalettes._palettes_from_spec_(spec)]
+                _PALETTE_REGISTRY_["files"][file] = tmp
+            [palette_type, pals] = tmp[1]
+            if pals: palettes[palette_type] = pals  # append
+
+        # A poor attempt to order the palettes somehow
+        palettes = {t: palettes[t] for t in sorted(palettes.keys(), reverse = True)}
+
+        index = {}
+        for pals in palettes.values():
+            for pal in pals:
+                index.setdefault(_normalize_palette_name_(pal.name()), []).append(pal)
+
+        _PALETTE_REGISTRY_["sets"][key] = [mtimes, [palettes, index]]
+        return [palettes, index]
+
+# Precompiled palette config: JSON file in palconfig containing the
+# specification of all palette config files shipped with the package.
+# Created at build time (`make palconfig`), never written at runtime.
+_PALETTE_ARTIFACT_FORMAT_ = 2
+
+def _palette_artifact_file_():
+    """Path to the precompiled palette config (palconfig/palconfig.json)."""
+    from os.path import dirname, join
+    return join(dirname(__file__), "palconfig", "palconfig.json")
+
+def _compile_palette_config_(outfile = None):
+    """Compile Palette Config
+
+    Parses all palette config files shipped with the package and writes the
+    specifications into one JSON file, used to load the pre-defined palettes
+    without parsing the config files (see `_palette_artifact_spec_`).
+    Used at build time (`make palconfig`). Writes to a temporary file first
+    which is renamed, the file is never incomplete.
+
+    Args:
+        outfile (None, str): Path of the output file. If `None` (default)
+            `palconfig/palconfig.json` within the package is written.
+
+    Returns:
+        str: Path of the file written.
+    """
+    import json
+    from os import replace, getpid
+    from os.path import basename
+
+    if outfile is None: outfile = _palette_artifact_file_()
+
+    res = {"format": _PALETTE_ARTIFACT_FORMAT_, "files": {}}
+    for file in sorted(_palette_config_files_()):
+        with open(file, "r") as fid: source = fid.read()
+        res["files"][basename(file)] = {"source": source,
+                                        "spec": hclpalettes._read_palette_config_(file)}
+
+    tmp = f"{outfile}.{getpid()}.tmp"
+    with open(tmp, "w") as fid: json.dump(res, fid, separators = (",", ":"))
+    replace(tmp, outfile)
+
+    # Force reload on next use
+    with _PALETTE_REGISTRY_LOCK_: _PALETTE_REGISTRY_["artifact"] = None
+    return outfile
+
+def _palette_artifact_spec_(file):
+    """Get Precompiled Palette Specification
+
+    Returns the specification of a palette config file from the precompiled
+    palette config (see `_compile_palette_config_`, loaded once) if available
+    and up to date. The config file is up to date if its content is identical
+    to the content stored when compiling (independent of modification times,
+    which are not preserved when installing the package). Nothing is written;
+    if the precompiled config is missing, of another format, or outdated,
+    the config file has to be parsed.
+
+    Args:
+        file (str): Path to the palette config file.
+
+    Returns:
+        None, dict: `None` if `file` is not one of the files shipped
+        with the package or no (up to date) specification is available.
+    """
+    import json
+    from os.path import basename, dirname, samefile
+
+    artifact = _palette_artifact_file_()
+    if not samefile(dirname(file), dirname(artifact)): return None
+
+    with _PALETTE_REGISTRY_LOCK_:
+        if _PALETTE_REGISTRY_.get("artifact") is None:
+            try:
+                with open(artifact, "r") as fid: tmp = json.load(fid)
+                if not tmp.get("format") == _PALETTE_ARTIFACT_FORMAT_: raise ValueError
+            except (OSError, ValueError):
+                tmp = {"files": {}}
+            _PALETTE_REGISTRY_["artifact"] = tmp
+        rec = _PALETTE_REGISTRY_["artifact"]["files"].get(basename(file))
+
+    if rec is None: return None
+    with open(file, "r") as fid:
+        return rec["spec"] if fid.read() == rec["source"] else None
+
+def _named_palette_(name, type_):
+    """Get Named Pre-defined Palette
+
+    Used by the named constructors (e.g., `sequential_hcl("Blues")`) to look
+    up one of the pre-defined palettes via the palette registry.
+
+    Args:
+        name (str): Name of the palette, not case sensitive, blanks are ignored.
+        type_ (str): Palette type, partial match, not case sensitive (see
+            :py:func:`hclpalettes.get_palettes`).
+
+    Returns:
+        list: List of length two. A copy of the first palette matching `name`
+        and `type_` (`defaultpalette`) or `None`, and a list of str with the
+        names of all palettes of type `type_`.
+    """
+    [palettes, index] = _palette_registry_(_palette_config_files_())
+    for pal in index.get(_normalize_palette_name_(name), []):
+        if type_.upper() in pal.type().upper():
+            return [pal._copy_(), None]
+
+    names = []
+    for t, pals in palettes.items():
+        if type_.upper() in t.upper(): names += [x.name() for x in pals]
+    return [None, names]
+
+
+# -------------------------------------------------------------------
+# Opt-in, size-bounded LRU cache for the colors of the HCL palettes
+# (disabled by default, see set_palette_cache). Keyed on the class, the
+# settings of the palette, and the (normalized) arguments; changing the
+# settings of a palette therefore never returns outdated colors.
+# -------------------------------------------------------------------
+from collections import OrderedDict
+from threading import Lock
+_PALETTE_CACHE_      = {"maxsize": 0, "hits": 0, "misses": 0, "data": OrderedDict()}
+_PALETTE_CACHE_LOCK_ = Lock()
+
+class _Uncacheable_(Exception):
+    """Raised by `_cache_key_` if a value cannot be used as part of a cache key."""
+
+def _cache_key_(x):
+    """Hashable key for (nested) settings and arguments.
+
+    Functions (e.g., lambdas in the settings) are keyed on their code, default
+    arguments, and closure, thus a new but identical lambda gives the same key.
+    Raises `_Uncacheable_` for functions referring to global names and other
+    callables, their results depend on more than the key.
+    """
+    import numpy as np
+    from types import FunctionType
+    if isinstance(x, np.ndarray):
+        return ("ndarray", x.dtype.str, x.shape, x.tobytes())
+    elif isinstance(x, (list, tuple)):
+        return (type(x).__name__,) + tuple(_cache_key_(v) for v in x)
+    elif isinstance(x, dict):
+        return ("dict",) + tuple(sorted((str(k), _cache_key_(v)) for k, v in x.items()))
+    elif isinstance(x, FunctionType) and len(x.__code__.co_names) == 0:
+        closure = [c.cell_contents for c in x.__closure__] if x.__closure__ else []
+        return ("function", x.__code__, _cache_key_(x.__defaults__), _cache_key_(closure))
+    elif callable(x):
+        raise _Uncacheable_
+    return (type(x).__name__, repr(x))
+
+def _cached_colors_(fun):
+    """Decorator adding the palette cache to the `colors()` methods."""
+    from functools import wraps
+    from inspect import signature
+
+    from numpy import ndarray
+
+    sig = signature(fun)
+
+    @wraps(fun)
+    def colors(self, *args, **kwargs):
+        if _PALETTE_CACHE_["maxsize"] == 0:
+            return fun(self, *args, **kwargs)
+
+        # Normalized arguments (positional or named, defaults filled in).
+        # Invalid arguments or uncacheable settings/arguments bypass the cache.
+        try:
+            bound = sig.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = {k: v for k, v in bound.arguments.items() if not k == "self"}
+            key = (type(self), _cache_key_(self.settings), getattr(self, "_rev", None),
+                   _cache_key_(arguments))
+        except (TypeError, _Uncacheable_):
+            return fun(self, *args, **kwargs)
+
+        cache = _PALETTE_CACHE_["data"]
+        with _PALETTE_CACHE_LOCK_:
+            if key in cache:
+                cache.move_to_end(key)
+                _PALETTE_CACHE_["hits"] += 1
+                res = cache[key]
+                return res.copy() if isinstance(res, ndarray) else list(res)
+            _PALETTE_CACHE_["misses"] += 1
+
+        res = fun(self, *args, **kwargs)
+        with _PALETTE_CACHE_LOCK_:
+            cache[key] = res.copy() if isinstance(res, ndarray) else tuple(res)
+            while len(cache) > _PALETTE_CACHE_["maxsize"]:
+                cache.popitem(last = False)
+        return res
+
+    return colors
+
+def set_palette_cache(maxsize):
+    """Enable, Resize, or Disable the Palette Cache
+
+    The colors of the HCL palettes (e.g., :py:class:`sequential_hcl`,
+    :py:class:`diverging_hcl`, :py:class:`qualitative_hcl`) are computed
+    whenever the `colors()` method is called. If the same colors are requested
+    frequently, a (process-wide) least recently used (LRU) cache can be enabled
+    which stores up to `maxsize` results. The cache is keyed on the class,
+    the settings of the palette, and the arguments of the call; changing
+    the settings of a palette results in new colors. Disabled by default.
+    See also :py:func:`palette_cache_info` and :py:func:`clear_palette_cache`.
+
+    Args:
+        maxsize (int): Maximum number of results stored in the cache. `0`
+            disables (and clears) the cache. If the cache currently contains
+            more results, the least recently used ones are dropped.
+
+    Examples:
+
+        >>> from colorspace import set_palette_cache, palette_cache_info, sequential_hcl
+        >>> set_palette_cache(128)
+        >>> pal = sequential_hcl("Blues")
+        >>> pal.colors(5)
+        >>> pal.colors(5)
+        >>> palette_cache_info()
+        >>> #: Disable the cache
+        >>> set_palette_cache(0)
+
+    Raises:
+        TypeError: If `maxsize` is not int.
+        ValueError: If `maxsize` is negative.
+    """
+    if not isinstance(maxsize, int) or isinstance(maxsize, bool):
+        raise TypeError("argument `maxsize` must be int")
+    elif maxsize < 0:
+        raise ValueError("argument `maxsize` must be >= 0")
+
+    with _PALETTE_CACHE_LOCK_:
+        _PALETTE_CACHE_["maxsize"] = maxsize
+        cache = _PALETTE_CACHE_["data"]
+        while len(cache) > maxsize:
+            cache.popitem(last = False)
+
+def palette_cache_info():
+    """Palette Cache Statistics
+
+    See :py:func:`set_palette_cache`.
+
+    Returns:
+        dict: Dictionary with the number of `hits` and `misses` (since the cache
+        has last been cleared), the `maxsize` of the cache (`0` if disabled), and
+        the number of results currently stored (`currsize`).
+
+    Examples:
+
+        >>> from colorspace import palette_cache_info
+        >>> palette_cache_info()
+    """
+    with _PALETTE_CACHE_LOCK_:
+        return {"hits": _PALETTE_CACHE_["hits"], "misses": _PALETTE_CACHE_["misses"],
+                "maxsize": _PALETTE_CACHE_["maxsize"], "currsize": len(_PALETTE_CACHE_["data"])}
+
+def clear_palette_cache():
+    """Clear Palette Cache
+
+    Removes all results from the palette cache and resets the statistics,
+    the size of the cache does not change. See :py:func:`set_palette_cache`.
+
+    Examples:
+
+        >>> from colorspace import clear_palette_cache
+        >>> clear_palette_cache()
+    """
+    with _PALETTE_CACHE_LOCK_:
+        _PALETTE_CACHE_["data"].clear()
+        _PALETTE_CACHE_["hits"]   = 0
+        _PALETTE_CACHE_["misses"] = 0
+
+
 # -------------------------------------------------------------------
 # -------------------------------------------------------------------
 class hclpalette:
@@ -1259,6 +1882,140 @@ class hclpalette:
         return LinearSegmentedColormap.from_list(name, cols, n)
 
 
+    def map(self, values, vmin = None, vmax = None, breaks = None, n = 256, out = "rgba8",
+            under = None, over = None, nan = "#00000000"):
+        """Map Values to Colors
+
+        Maps numeric values (array of any shape) to colors of the palette.
+        Uses a lookup table with the colors of the palette (`n` colors,
+        or one color per class if `breaks` are specified) which is computed
+        once and cached on the object (as long as the settings of the palette
+        do not change). The values are then mapped by one vectorized lookup.
+
+        Without `breaks` the interval `[vmin, vmax]` is divided into `n` intervals
+        of equal width, values below `vmin` (above `vmax`) get the color
+        `under` (`over`). With `breaks` (increasing values, `k + 1` breaks
+        for `k` classes) the values are classified using
+        `numpy.searchsorted`; values in `[breaks[i], breaks[i + 1])` belong
+        to class `i` (the last class includes `breaks[-1]`). Missing values
+        (`numpy.nan`) get the color `nan`.
+
+        Args:
+            values (int, float, list, numpy.ndarray): Numeric values to be mapped.
+            vmin (None, int, float): Lower limit, defaults to the minimum of `values`
+                (ignoring missing values). Ignored if `breaks` are specified.
+            vmax (None, int, float): Upper limit, defaults to the maximum of `values`.
+                Ignored if `breaks` are specified.
+            breaks (None, list, numpy.ndarray): Optional class breaks, see description.
+            n (int): Number of colors used if no `breaks` are specified, defaults to `256`.
+            out (str): Output format, one of `"rgba8"` (default; `numpy.uint8`
+                in `[0, 255]`), `"rgb8"`, `"rgba"` (float in `[0., 1.]`), or `"rgb"`.
+            under (None, str): Color for values below `vmin` (or `breaks[0]`),
+                defaults to the first color of the palette.
+            over (None, str): Color for values above `vmax` (or `breaks[-1]`),
+                defaults to the last color of the palette.
+            nan (str): Color for missing values, defaults to `"#00000000"` (transparent).
+
+        Returns:
+            numpy.ndarray: Array of shape `values.shape + (4,)` (or `(3,)` for
+            `"rgb"` and `"rgb8"`).
+
+        Example:
+
+            >>> from colorspace import sequential_hcl
+            >>> import numpy as np
+            >>> pal = sequential_hcl("Blues 3")
+            >>> pal.map([0., 0.5, 1., np.nan])
+            >>> #: Float output, user defined limits
+            >>> pal.map([[0, 5], [10, 15]], vmin = 0, vmax = 10, out = "rgb", over = "#ff0000")
+            >>> #: Irregular class breaks (three classes)
+            >>> pal.map([0.5, 2, 50], breaks = [0, 1, 10, 100])
+
+        Raises:
+            ValueError: If `values` cannot be converted to float.
+            TypeError: If `vmin` or `vmax` are neither None nor numeric.
+            ValueError: If `vmax` is smaller than `vmin`.
+            ValueError: If `breaks` are not strictly increasing or less than two breaks are given.
+            TypeError: If `n` is not int.
+            ValueError: If `n` is smaller than `1`.
+            ValueError: If `out` is not one of the allowed formats.
+            ValueError: If `under`, `over`, or `nan` are no valid colors.
+        """
+        import numpy as np
+
+        try:
+            values = np.asarray(values, dtype = float)
+        except Exception as e:
+            raise ValueError(f"argument `values` must be numeric: {str(e)}")
+        for key, val in {"vmin": vmin, "vmax": vmax}.items():
+            if not isinstance(val, (type(None), int, float)) or isinstance(val, bool):
+                raise TypeError(f"argument `{key}` must be None, int, or float")
+        if not isinstance(n, int) or isinstance(n, bool):
+            raise TypeError("argument `n` must be int")
+        elif n < 1:
+            raise ValueError("argument `n` must be >= 1")
+        if not isinstance(out, str) or not out in ["rgba8", "rgb8", "rgba", "rgb"]:
+            raise ValueError("argument `out` must be one of \"rgba8\", \"rgb8\", \"rgba\", or \"rgb\"")
+
+        # Classes (index); n = under, n + 1 = over, n + 2 = missing values
+        if breaks is not None:
+            breaks = np.asarray(breaks, dtype = float).flatten()
+            if len(breaks) < 2 or not np.all(np.diff(breaks) > 0):
+                raise ValueError("argument `breaks` must be strictly increasing (at least two values)")
+            n   = len(breaks) - 1
+            idx = np.array(np.searchsorted(breaks, values, side = "right") - 1)
+            idx[values == breaks[-1]] = n - 1
+            idx[values > breaks[-1]]  = n + 1
+            idx[values < breaks[0]]   = n
+        else:
+            with np.errstate(all = "ignore"):
+                if vmin is None: vmin = float(np.nanmin(values)) if np.any(np.isfinite(values)) else 0.
+                if vmax is None: vmax = float(np.nanmax(values)) if np.any(np.isfinite(values)) else 1.
+                if vmax < vmin:
+                    raise ValueError("argument `vmax` must be larger or equal to `vmin`")
+                scale = n / (vmax - vmin) if vmax > vmin else 0.
+                # Truncation (instead of floor) is fine, values < vmin are replaced below
+                idx = np.array(values - vmin)
+                idx *= scale
+                idx = np.minimum(idx, n - 1, out = idx).astype(np.int32)
+            idx[values > vmax] = n + 1
+            idx[values < vmin] = n
+        idx[np.isnan(values)] = n + 2
+
+        lut = self._map_lut_(n, under, over, nan, out.endswith("8"))
+        res = np.take(lut, idx, axis = 0)
+        return res if out.startswith("rgba") else res[..., :3]
+
+    def _map_lut_(self, n, under, over, nan, uint8):
+        """Lookup table for :py:meth:`map` (`n` colors followed by `under`,
+        `over`, `nan`; array of shape `(n + 3, 4)`), cached on the object."""
+        import numpy as np
+        from .utils import _check_hex_colors_
+
+        key = (n, under, over, nan, uint8,
+               tuple((k, repr(v)) for k, v in sorted(getattr(self, "settings", {}).items())))
+        if not hasattr(self, "_map_cache_") or not self._map_cache_[0] == key[5]:
+            self._map_cache_ = [key[5], {}]
+        if key in self._map_cache_[1]:
+            return self._map_cache_[1][key]
+
+        cols = list(self.colors(n))
+        for k, c in {"under": under, "over": over, "nan": nan}.items():
+            if not isinstance(c, (type(None), str)):
+                raise ValueError(f"argument `{k}` must be None or a valid color (str)")
+        cols += [cols[0] if under is None else under, cols[-1] if over is None else over, nan]
+        [rgb, alpha, isnone] = _check_hex_colors_(cols)
+
+        res = np.empty((n + 3, 4), dtype = np.uint8)
+        res[:, :3] = rgb.T
+        res[:, 3]  = np.where(alpha < 0, 255, alpha)
+        res[isnone] = res[n + 2]
+        if not uint8: res = res / 255.
+        res.setflags(write = False)
+
+        self._map_cache_[1][key] = res
+        return res
+
     def _set_rev(self, rev):
         """Helper function: Store 'rev' argument
 
@@ -1554,13 +2311,10 @@ class qualitative_hcl(hclpalette):
 
         # If user selected a named palette: load palette settings
         if isinstance(palette, str):
-            from numpy import where
-            pals = hclpalettes().get_palettes("Qualitative")
-            idx  = where([x.name().upper().replace(" ", "") == palette.upper().replace(" ", "") for x in pals])[0]
-            if len(idx) == 0:
+            [pal, names] = _named_palette_(palette, "Qualitative")
+            if pal is None:
                 raise ValueError(f"palette {palette} is not a valid qualitative palette. " + \
-                                 f"Choose one of: {', '.join([x.name() for x in pals])}")
-            pal = pals[idx[0]]
+                                 f"Choose one of: {', '.join(names)}")
 
             # Allow to overrule few things
             for key,value in kwargs.items():
@@ -1601,7 +2355,8 @@ class qualitative_hcl(hclpalette):
         self.settings = settings
 
 
-    def colors(self, n = 11, fixup = None, alpha = None, **kwargs):
+    @_cached_colors_
+    def colors(self, n = 11, fixup = None, alpha = None, format = "hex", **kwargs):
         """Get Colors
 
         Returns the colors of the current color palette.
@@ -1617,11 +2372,14 @@ class qualitative_hcl(hclpalette):
                 numpy array. If a list or array is provided it must be of length 1 or
                 of length `n` and be convertible to float, providing values
                 between `0.0` (full opacity) and `1.0` (full transparency)
+            format (str): Output format. `"hex"` (default) returns a list of hex
+                colors, `"rgb"`, `"rgba"`, `"rgba8"`, or `"hcl"` a numpy.ndarray
+                (see :py:func:`colorobject.colors <colorspace.colorlib.colorobject.colors>`).
             **kwargs: Currently allows for `rev = True` to reverse the colors.
 
         Returns:
-            list: Returns a list of str with `n` colors from the
-            color palette.
+            list, numpy.ndarray: Returns a list of str with `n` colors from the
+            color palette, or a numpy.ndarray if `format` is not `"hex"`.
 
         Examples:
             >>> from colorspace import qualitative_hcl, rainbow_hcl
@@ -1637,19 +2395,31 @@ class qualitative_hcl(hclpalette):
 
         """
 
-        from numpy import repeat, linspace, asarray
-        from numpy import vstack, transpose
         from .colorlib import HCL
 
         alpha = self._get_alpha_array(alpha, n)
         fixup = fixup if isinstance(fixup, bool) else self.settings["fixup"]
 
+        # Create new HCL color object
+        HCL = HCL(*self._hcl_coords_(n), alpha)
+
+        # Reversing colors
+        rev = self._rev
+        if "rev" in kwargs.keys(): rev = kwargs["rev"]
+
+        # Return hex colors
+        return HCL.colors(fixup = fixup, rev = rev, format = format)
+
+    def _hcl_coords_(self, n):
+        """Returns the H, C, and L coordinates (list of numpy.ndarray) of `n` colors."""
+
+        from numpy import repeat, linspace
+
         # If either h1 or h2 is a lambda function: evaluate now.
         h1 = self.get("h1")(n) if callable(self.get("h1")) else self.get("h1")
         if callable(self.get("h2")):
             fn = self.get("h2")
             # Distinguish between lambda functions with one argument (n) or two (n + h1)
-            h1 = self.get("h1")(n) if callable(self.get("h1")) else self.get("h1")
             h2 = fn(n) if fn.__code__.co_argcount == 1 else fn(n, h1)
         else:
             h2 = self.get("h2")
@@ -1659,15 +2429,7 @@ class qualitative_hcl(hclpalette):
         C = repeat(self.get("c1"), n)
         H = linspace(h1, h2, n)
 
-        # Create new HCL color object
-        HCL = HCL(H, C, L, alpha)
-
-        # Reversing colors
-        rev = self._rev
-        if "rev" in kwargs.keys(): rev = kwargs["rev"]
-
-        # Return hex colors
-        return HCL.colors(fixup = fixup, rev = rev)
+        return [H, C, L]
 
 
 # -------------------------------------------------------------------
@@ -1899,14 +2661,10 @@ class diverging_hcl(hclpalette):
 
         # If user selected a named palette: load palette settings
         if isinstance(palette, str):
-            from numpy import where
-            pals = hclpalettes().get_palettes("Diverging")
-            idx  = where([x.name().upper().replace(" ", "") == \
-                    palette.upper().replace(" ", "") for x in pals])[0]
-            if len(idx) == 0:
+            [pal, names] = _named_palette_(palette, "Diverging")
+            if pal is None:
                 raise ValueError(f"palette {palette} is not a valid diverging palette. " + \
-                                 f"Choose one of: {', '.join([x.name() for x in pals])}")
-            pal = pals[idx[0]]
+                                 f"Choose one of: {', '.join(names)}")
 
             # Allow to overule few things
             for key,value in kwargs.items():
@@ -1953,7 +2711,8 @@ class diverging_hcl(hclpalette):
 
 
     # Return hex colors
-    def colors(self, n = 11, fixup = None, alpha = None, **kwargs):
+    @_cached_colors_
+    def colors(self, n = 11, fixup = None, alpha = None, format = "hex", **kwargs):
         """Get Colors
 
         Returns the colors of the current color palette.
@@ -1969,11 +2728,14 @@ class diverging_hcl(hclpalette):
                 numpy array. If a list or array is provided it must be of length 1 or
                 of length `n` and be convertible to float, providing values
                 between `0.0` (full opacity) and `1.0` (full transparency)
+            format (str): Output format. `"hex"` (default) returns a list of hex
+                colors, `"rgb"`, `"rgba"`, `"rgba8"`, or `"hcl"` a numpy.ndarray
+                (see :py:func:`colorobject.colors <colorspace.colorlib.colorobject.colors>`).
             **kwargs: Currently allows for `rev = True` to reverse the colors.
 
         Returns:
-            list: Returns a list of str with `n` colors from the
-            color palette.
+            list, numpy.ndarray: Returns a list of str with `n` colors from the
+            color palette, or a numpy.ndarray if `format` is not `"hex"`.
 
 
         Examples:
@@ -1991,14 +2753,27 @@ class diverging_hcl(hclpalette):
 
         """
 
-        from numpy import abs, ceil, linspace, power, repeat, arange, fmax, delete
-        from numpy import asarray, ndarray, ndenumerate, concatenate, flip
-        from numpy import vstack, transpose, repeat
         from .colorlib import HCL
 
         alpha = self._get_alpha_array(alpha, n)
         fixup = fixup if isinstance(fixup, bool) else self.settings["fixup"]
 
+        # Create new HCL color object
+        HCL = HCL(*self._hcl_coords_(n), alpha)
+
+        # Reversing colors
+        rev = self._rev
+        if "rev" in kwargs.keys(): rev = kwargs["rev"]
+
+        # Return hex colors
+        return HCL.colors(fixup = fixup, rev = rev, format = format)
+
+    def _hcl_coords_(self, n):
+        """Returns the H, C, and L coordinates (list of numpy.ndarray) of `n` colors."""
+
+        from numpy import abs, ceil, linspace, power, arange, fmax, delete
+        from numpy import ndarray, ndenumerate, concatenate, flip
+
         # Calculate H/C/L
         p1   = self.get("p1")
         p2   = p1 if self.get("p2") is None else self.get("p2")
@@ -2028,16 +2803,8 @@ class diverging_hcl(hclpalette):
         # Non-even number of colors? We need to remove one.
         if tmp_n % 2 == 1: C = delete(C, int(ceil(tmp_n / 2.)))
 
-        # Create new HCL color object
-        HCL = HCL(H, C, L, alpha)
-
-        # Reversing colors
-        rev = self._rev
-        if "rev" in kwargs.keys(): rev = kwargs["rev"]
-
-        # Return hex colors
-        cols = HCL.colors(fixup = fixup, rev = rev)
-        return [cols[1]] if n == 1 else cols
+        # If n == 1 only the middle one is used
+        return [H[1:2], C[1:2], L[1:2]] if n == 1 else [H, C, L]
 
 
 
@@ -2242,15 +3009,10 @@ class divergingx_hcl(hclpalette):
 
         # If user selected a named palette: load palette settings
         if isinstance(palette, str):
-            from .hcl_palettes import divergingx_palettes
-            from numpy import where
-            pals = divergingx_palettes().get_palettes("Divergingx")
-            idx  = where([x.name().upper().replace(" ", "") == palette.upper().replace(" ", "") for x in pals])[0]
-            if len(idx) == 0:
+            [pal, names] = _named_palette_(palette, "Divergingx")
+            if pal is None:
                 raise ValueError(f"palette {palette} is not a valid divergingx palette. " + \
-                                 f"Choose one of: {', '.join([x.name() for x in pals])}")
-            pal = pals[idx[0]]
-            del pals, idx
+                                 f"Choose one of: {', '.join(names)}")
 
             # Allow to overule few things
             for key,value in kwargs.items():
@@ -2302,7 +3064,8 @@ class divergingx_hcl(hclpalette):
 
 
     # Return hex colors
-    def colors(self, n = 11, fixup = None, alpha = None, **kwargs):
+    @_cached_colors_
+    def colors(self, n = 11, fixup = None, alpha = None, format = "hex", **kwargs):
         """Get Colors
 
         Returns the colors of the current color palette.
@@ -2318,21 +3081,38 @@ class divergingx_hcl(hclpalette):
                 numpy array. If a list or array is provided it must be of length 1 or
                 of length `n` and be convertible to float, providing values
                 between `0.0` (full opacity) and `1.0` (full transparency)
+            format (str): Output format. `"hex"` (default) returns a list of hex
+                colors, `"rgb"`, `"rgba"`, `"rgba8"`, or `"hcl"` a numpy.ndarray
+                (see :py:func:`colorobject.colors <colorspace.colorlib.colorobject.colors>`).
             **kwargs: Currently allows for `rev = True` to reverse the colors.
 
 
         Returns:
-            list: Returns a list of str with `n` colors from the
-            color palette.
+            list, numpy.ndarray: Returns a list of str with `n` colors from the
+            color palette, or a numpy.ndarray if `format` is not `"hex"`.
 
         """
 
-        import numpy as np
         from .colorlib import HCL
 
         alpha = self._get_alpha_array(alpha, n)
         fixup = fixup if isinstance(fixup, bool) else self.settings["fixup"]
 
+        # Create new HCL color object
+        HCL = HCL(*self._hcl_coords_(n), alpha)
+
+        # Reversing colors
+        rev = self._rev
+        if "rev" in kwargs.keys(): rev = kwargs["rev"]
+
+        # Return hex colors
+        return HCL.colors(fixup = fixup, rev = rev, format = format)
+
+    def _hcl_coords_(self, n):
+        """Returns the H, C, and L coordinates (list of numpy.ndarray) of `n` colors."""
+
+        import numpy as np
+
         # If n == 1 we do as we have 3 colors, but then only return the middle one
         tmp_n = n if n > 1 else 3
 
@@ -2366,16 +3146,8 @@ class divergingx_hcl(hclpalette):
         C = np.concatenate((Ca, Cb[::-1]))
         L = np.concatenate((La, Lb[::-1]))
 
-        # Create new HCL color object
-        HCL = HCL(H, C, L, alpha)
-
-        # Reversing colors
-        rev = self._rev
-        if "rev" in kwargs.keys(): rev = kwargs["rev"]
-
-        # Return hex colors
-        cols = HCL.colors(fixup = fixup, rev = rev)
-        return [cols[1]] if n == 1 else cols
+        # If n == 1 only the middle one is used
+        return [H[1:2], C[1:2], L[1:2]] if n == 1 else [H, C, L]
 
 
 
@@ -2503,13 +3275,10 @@ class sequential_hcl(hclpalette):
 
         # If user selected a named palette: load palette settings
         if isinstance(palette, str):
-            from numpy import where
-            pals = hclpalettes().get_palettes("Sequential")
-            idx  = where([x.name().upper().replace(" ", "") == palette.upper().replace(" ", "") for x in pals])[0]
-            if len(idx) == 0:
+            [pal, names] = _named_palette_(palette, "Sequential")
+            if pal is None:
                 raise ValueError(f"palette {palette} is not a valid sequential palette. " + \
-                                 f"Choose one of: {', '.join([x.name() for x in pals])}")
-            pal = pals[idx[0]]
+                                 f"Choose one of: {', '.join(names)}")
 
             def isNone(x): return isinstance(x, type(None))
 
@@ -2558,7 +3327,8 @@ class sequential_hcl(hclpalette):
 
 
     # Return hex colors
-    def colors(self, n = 11, fixup = None, alpha = None, **kwargs):
+    @_cached_colors_
+    def colors(self, n = 11, fixup = None, alpha = None, format = "hex", **kwargs):
         """Get Colors
 
         Returns the colors of the current color palette.
@@ -2574,11 +3344,14 @@ class sequential_hcl(hclpalette):
                 numpy array. If a list or array is provided it must be of length 1 or
                 of length `n` and be convertible to float, providing values
                 between `0.0` (full opacity) and `1.0` (full transparency)
+            format (str): Output format. `"hex"` (default) returns a list of hex
+                colors, `"rgb"`, `"rgba"`, `"rgba8"`, or `"hcl"` a numpy.ndarray
+                (see :py:func:`colorobject.colors <colorspace.colorlib.colorobject.colors>`).
             **kwargs: Currently allows for `rev = True` to reverse the colors.
 
         Returns:
-            list: Returns a list of str with `n` colors from the
-            color palette.
+            list, numpy.ndarray: Returns a list of str with `n` colors from the
+            color palette, or a numpy.ndarray if `format` is not `"hex"`.
 
         Examples:
             >>> from colorspace import sequential_hcl, hexcols
@@ -2595,12 +3368,26 @@ class sequential_hcl(hclpalette):
 
         """
 
-        from numpy import linspace
         from .colorlib import HCL
 
         alpha = self._get_alpha_array(alpha, n)
         fixup = fixup if isinstance(fixup, bool) else self.settings["fixup"]
 
+        # Create new HCL color object
+        HCL = HCL(*self._hcl_coords_(n), alpha)
+
+        # Reversing colors
+        rev = self._rev
+        if "rev" in kwargs.keys(): rev = kwargs["rev"]
+
+        # Return hex colors
+        return HCL.colors(fixup = fixup, rev = rev, format = format)
+
+    def _hcl_coords_(self, n):
+        """Returns the H, C, and L coordinates (list of numpy.ndarray) of `n` colors."""
+
+        from numpy import linspace
+
         # Calculate H/C/L
         p1   = self.get("p1")
         p2   = p1 if self.get("p2") is None else self.get("p2")
@@ -2612,16 +3399,7 @@ class sequential_hcl(hclpalette):
         h1   = self.get("h1")
         h2   = h1 if self.get("h2") is None else self.get("h2")
 
-        # Get colors and create new HCL color object
-        [H, C, L] = self._get_seqhcl(linspace(1., 0., n), h1, h2, c1, c2, l1, l2, p1, p2, cmax)
-        HCL = HCL(H, C, L, alpha)
-
-        # Reversing colors
-        rev = self._rev
-        if "rev" in kwargs.keys(): rev = kwargs["rev"]
-
-        # Return hex colors
-        return HCL.colors(fixup = fixup, rev = rev)
+        return self._get_seqhcl(linspace(1., 0., n), h1, h2, c1, c2, l1, l2, p1, p2, cmax)
 
 
 # -------------------------------------------------------------------
@@ -2889,7 +3667,8 @@ class diverging_hsv(hclpalette):
 
 
     # Return hex colors
-    def colors(self, n = 11, fixup = None, alpha = None, **kwargs):
+    @_cached_colors_
+    def colors(self, n = 11, fixup = None, alpha = None, format = "hex", **kwargs):
         """Get Colors
 
         Returns the colors of the current color palette.
@@ -2905,11 +3684,14 @@ class diverging_hsv(hclpalette):
                 numpy array. If a list or array is provided it must be of length 1 or
                 of length `n` and be convertible to float, providing values
                 between `0.0` (full opacity) and `1.0` (full transparency)
+            format (str): Output format. `"hex"` (default) returns a list of hex
+                colors, `"rgb"`, `"rgba"`, `"rgba8"`, or `"hcl"` a numpy.ndarray
+                (see :py:func:`colorobject.colors <colorspace.colorlib.colorobject.colors>`).
             **kwargs: Currently allows for `rev = True` to reverse the colors.
 
         Returns:
-            list: Returns a list of str with `n` colors from the
-            color palette.
+            list, numpy.ndarray: Returns a list of str with `n` colors from the
+            color palette, or a numpy.ndarray if `format` is not `"hex"`.
 
         """
 
@@ -2938,7 +3720,7 @@ class diverging_hsv(hclpalette):
         if "rev" in kwargs.keys(): rev = kwargs["rev"]
 
         # Return hex colors
-        return HSV.colors(fixup = fixup, rev = rev)
+        return HSV.colors(fixup = fixup, rev = rev, format = format)
 
 
 
@@ -3046,7 +3828,8 @@ class rainbow(hclpalette):
 
 
     # Return hex colors
-    def colors(self, n = 11, alpha = None, **kwargs):
+    @_cached_colors_
+    def colors(self, n = 11, alpha = None, format = "hex", **kwargs):
         """Get Colors
 
         Returns the colors of the current color palette.
@@ -3058,11 +3841,14 @@ class rainbow(hclpalette):
                 numpy array. If a list or array is provided it must be of length 1 or
                 of length `n` and be convertible to float, providing values
                 between `0.0` (full opacity) and `1.0` (full transparency)
+            format (str): Output format. `"hex"` (default) returns a list of hex
+                colors, `"rgb"`, `"rgba"`, `"rgba8"`, or `"hcl"` a numpy.ndarray
+                (see :py:func:`colorobject.colors <colorspace.colorlib.colorobject.colors>`).
             **kwargs: Currently allows for `rev = True` to reverse the colors.
 
         Returns:
-            list: Returns a list of str with `n` colors from the
-            color palette.
+            list, numpy.ndarray: Returns a list of str with `n` colors from the
+            color palette, or a numpy.ndarray if `format` is not `"hex"`.
 
         Examples:
             >>> from colorspace import rainbow
@@ -3102,6 +3888,6 @@ class rainbow(hclpalette):
         if "rev" in kwargs.keys(): rev = kwargs["rev"]
 
         # Return hex colors
-        return HSV.colors(fixup = False, rev = rev)
+        return HSV.colors(fixup = False, rev = rev, format = format)
 
 
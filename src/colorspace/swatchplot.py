@@ -283,9 +283,12 @@ def swatchplot(pals, show_names = True, nrow = 20, n = 5, cvd = None, **kwargs):
 
     # If input is an object of class hclpalettes we will first
     # convert it into a dictionary which is then further processed.
+    # Colors of all palettes are computed in one batch.
     if isinstance(pals, hclpalettes):
-        tmp = {}
-        for type_ in pals.get_palette_types(): tmp[type_] = pals.get_palettes(type_)
+        tmp   = {}
+        batch = pals.colors_batch(n)
+        for type_ in pals.get_palette_types():
+            tmp[type_] = [palette(batch[x.name()], name = x.name()) for x in pals.get_palettes(type_)]
         # Overwrite input object
         pals = tmp
 
@@ -482,3 +482,40 @@ def test_desaturate_cmap_input():
     assert isinstance(x2, LinearSegmentedColormap)
 
 
+
+
+# ------------------------------------------
+# Transformation matrices and batched simulation
+# ------------------------------------------
+def test_CVD_matrices():
+    from colorspace.CVD import _CVD_MATRICES_
+    assert _CVD_MATRICES_.shape == (3, 11, 3, 3)
+    assert not _CVD_MATRICES_.flags.writeable
+    assert np.array_equal(_CVD_MATRICES_[:, 0], np.broadcast_to(np.eye(3), (3, 3, 3)))
+    x = CVD(["#ff0000"], "deutan")
+    assert np.array_equal(x.deutan_cvd_matrizes(10)[:, 0], [0.367322, 0.860646, -0.227968])
+
+def test_simulate_cvd():
+    from colorspace import simulate_cvd
+    cols = diverging_hcl()(7)
+
+    raises(TypeError,  simulate_cvd, 1)
+    raises(TypeError,  simulate_cvd, cols, types = 1)
+    raises(ValueError, simulate_cvd, cols, types = ["deutan", "foo"])
+    raises(ValueError, simulate_cvd, cols, severities = [0.5, 1.1])
+    raises(ValueError, simulate_cvd, cols, severities = "foo")
+    raises(TypeError,  simulate_cvd, cols, linear = None)
+
+    sev = [0., 0.3, 0.55, 1.]
+    for linear in [True, False]:
+        res = simulate_cvd(cols, severities = sev, linear = linear)
+        assert res.shape == (3, 4, 7, 3)
+        for i, fun in enumerate([protan, deutan, tritan]):
+            for j, s in enumerate(sev):
+                assert hexcols(fun(cols, s, linear = linear)).colors(format = "rgb").tolist() == \
+                       (np.floor(res[i, j] * 255. + .5) / 255.).tolist()
+
+    # Single type, color objects
+    res = simulate_cvd(hexcols(cols), "Tritan", 0.55)
+    assert res.shape == (1, 1, 7, 3)
+    assert np.allclose(res[0, 0], simulate_cvd(palette(cols), severities = 0.55)[2, 0])
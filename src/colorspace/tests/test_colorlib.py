@@ -170,6 +170,64 @@ def test_compare_colors_polarLUV():
     assert compare_colors(HCL([0, 180, 270], [80, 60, 40], [30, 50, 70]),
                           HCL([0, 180, 270], [80, 60, 40], [30, 50, 70]))
 
+def test_compare_colors_elementwise():
+    a = HCL([0, 180, 270], [80, 60, 40], [30, 50, 70], alpha = [1, .5, .5])
+    b = HCL([0, 182, 270], [80, 60, 40], [30, 50, 70], alpha = [1, .5, .5])
+    assert np.array_equal(compare_colors(a, b, _all = False), [True, False, True])
+    b.dropalpha() # Missing alpha is penalized
+    assert not np.any(compare_colors(a, b, _all = False))
+    assert compare_colors(hexcols(["#ff0000", "#00FF00"]), hexcols(["#FF0000", "#00ff01"]),
+                          _all = False) == [True, False]
+
+# --------------------------------------------
+# Color distances
+# --------------------------------------------
+def test_color_distance():
+    # Test data for CIEDE2000 from Sharma, Wu, Dalal (2005)
+    a = CIELAB([50., 50., 50., 50., 50., 60.2574],
+               [2.6772, 3.1571, 2.8361, 0., 2.5, -34.0099],
+               [-79.7751, -77.2803, -74.0200, 0., 0., 36.2677])
+    b = CIELAB([50., 50., 50., 50., 73., 60.4626],
+               [0., 0., 0., -1., 25., -34.1751],
+               [-82.7485, -82.7485, -82.7485, 2., -18., 39.4387])
+    dE = [2.0425, 2.8615, 3.4412, 2.3669, 27.1492, 1.2644]
+    assert np.allclose(color_distance(a, b, metric = "deltaE2000"), dE, atol = 1e-4)
+    assert np.allclose(color_distance(b, a, metric = "deltaE2000"), dE, atol = 1e-4)
+
+    d76 = np.sqrt(np.sum([(a.get(k) - b.get(k))**2 for k in "LAB"], axis = 0))
+    assert np.allclose(color_distance(a, b, metric = "deltaE76"), d76)
+    assert np.allclose(color_distance(a, b), d76)
+
+    # Distance matrix, computed in chunks
+    for metric in ["euclidean", "deltaE76", "deltaE2000"]:
+        D = color_distance(a, b, metric = metric, pairwise = True, chunksize = 5)
+        assert D.shape == (6, 6)
+        assert np.allclose(np.diag(D), color_distance(a, b, metric = metric))
+        assert np.allclose(D[1:3, 4], [color_distance(a[i], b[4], metric = metric)[0] for i in [1, 2]])
+
+    # Hex colors, recycling single colors
+    x = color_distance("#ff0000", ["#ff0000", "#fe0000", "#00ff00"])
+    assert x[0] == 0. and np.isclose(x[1], 1. / 255.)
+    assert color_distance(hexcols("#ff0000"), HCL(0, 0, 50), metric = "deltaE76").shape == (1,)
+
+    raises(TypeError,  color_distance, a, 3)
+    raises(ValueError, color_distance, a, b, metric = "foo")
+    raises(TypeError,  color_distance, a, hexcols("#ff0000"), metric = "euclidean")
+    raises(TypeError,  color_distance, a, b, pairwise = 1)
+    raises(TypeError,  color_distance, a, b, chunksize = 1.5)
+    raises(ValueError, color_distance, a, b, chunksize = 0)
+    raises(ValueError, color_distance, a, b[:2])
+
+    # HSV/HLS: conversion into CIELAB is ambiguous (as for `to()`)
+    for x in [HSV([0, 120], [0.5, 1.], [0.5, 0.8]), HLS([0, 120], [0.5, 0.2], [0.5, 1.])]:
+        for metric in ["deltaE76", "deltaE2000"]:
+            with raises(Exception, match = "ambiguous"):
+                color_distance(x, hexcols(["#ff0000", "#00ff00"]), metric = metric)
+            with raises(Exception, match = "ambiguous"):
+                color_distance(a[:2], x, metric = metric, pairwise = True)
+        # Euclidean distance within HSV/HLS is fine
+        assert np.allclose(color_distance(x, x), [0, 0])
+
 # --------------------------------------------
 # Testing conversion chain. the following chains
 # should check all conversions
@@ -325,6 +383,26 @@ def test_convert_hex_to_HLS_to_hex():
     # Compare resulting hex colors
     assert compare_colors(colors_to_test, x)
 
+## CIELUV <-> CIEXYZ; black (L <= 0 and U == V == 0) stays black
+def test_LUV_to_XYZ_black():
+    clib = colorlib()
+    L = np.asarray([0.,  0., -1., 50.,  5.])
+    U = np.asarray([0., 10.,  0., 20., -5.])
+    V = np.asarray([0.,  0.,  0., 30.,  5.])
+    [X, Y, Z] = clib.LUV_to_XYZ(L, U, V)
+    assert np.all([isinstance(x, np.ndarray) and len(x) == 5 for x in [X, Y, Z]])
+    assert np.all(np.asarray([X[0], Y[0], Z[0]]) == 0.)
+    assert np.all(np.asarray([X[2], Y[2], Z[2]]) == 0.)
+    assert Y[1] == 0.
+
+    # Round trip for the non-black colors
+    [L2, U2, V2] = clib.XYZ_to_LUV(X[3:], Y[3:], Z[3:])
+    assert np.allclose(L2, L[3:]) and np.allclose(U2, U[3:]) and np.allclose(V2, V[3:])
+
+    # All black
+    res = clib.LUV_to_XYZ(np.zeros(3), np.zeros(3), np.zeros(3))
+    assert np.all(np.asarray(res) == 0.)
+
 ## Additionally
 def test_convert_color_spaces():
     x = deepcopy(colors_to_test); x.to("sRGB"); x.to("CIEXYZ")
@@ -380,6 +458,57 @@ def test_long_route_RGB_HSV():
     x.to("RGB")
     assert compare_colors(x, orig)
 
+## Conversion graph (shortest paths, cached)
+def test_conversion_path():
+    from colorspace.colorlib import _conversion_path_, _compile_conversion_
+    assert _conversion_path_("hexcols", "polarLUV") == \
+            ("sRGB", "RGB", "CIEXYZ", "CIELUV", "polarLUV")
+    assert _conversion_path_("polarLUV", "hexcols") == \
+            ("CIELUV", "CIEXYZ", "RGB", "sRGB", "hexcols")
+    assert _conversion_path_("HSV", "HLS") == ("sRGB", "HLS")
+    assert _conversion_path_("hexcols", "foo") is None
+
+    # Cached; one step for each direct conversion along the path
+    assert _compile_conversion_("RGB", "HLS") is _compile_conversion_("RGB", "HLS")
+    assert len(_compile_conversion_("polarLUV", "hexcols")) == 5
+
+def test_conversion_path_ambiguous():
+    for (a, b) in [("HSV", "polarLUV"), ("HLS", "CIELAB"), ("CIEXYZ", "HSV")]:
+        x = deepcopy(colors_to_test)
+        x.to(a)
+        with raises(Exception, match = "ambiguous"):
+            x.to(b)
+
+def test_conversion_single_pass():
+    # Single-pass HCL -> hex identical to converting step by step
+    x = polarLUV(H = np.linspace(0, 360, 51), C = np.linspace(0, 80, 51),
+                 L = np.linspace(10, 95, 51))
+    stepwise = deepcopy(x)
+    for to in ["CIELUV", "CIEXYZ", "RGB", "sRGB", "hex"]: stepwise.to(to)
+    assert x.colors() == stepwise.colors()
+    x.to("hex")
+    assert isinstance(x, hexcols)
+    assert np.array_equal(x.get("hex_"), stepwise.get("hex_"))
+
+def test_sRGB_to_hex():
+    clib = colorlib()
+    tol  = 1. / (2 * 255.)
+    r = np.asarray([0., 1., 0.5, -tol, 1. + tol, -0.1, 1.1, np.nan, np.inf])
+    g = np.asarray([0., 1., 0.5, 0.,   0.,       0.,   0.,  0.,     0.])
+    b = np.asarray([0., 1., 0.2, 0.,   0.,       0.,   0.,  0.,     0.])
+    res = clib.sRGB_to_hex(r, g, b)
+    assert res.tolist() == ["#000000", "#FFFFFF", "#808033", "#000000", "#FF0000",
+                            "#000000", "#FF0000", None, None]
+    # Without fixup; input not modified
+    rorig = r.copy()
+    res = clib.sRGB_to_hex(r, g, b, fixup = False)
+    assert res.tolist() == ["#000000", "#FFFFFF", "#808033", "#000000", "#FF0000",
+                            None, None, None, None]
+    assert np.array_equal(r, rorig, equal_nan = True)
+    # All valid: array of str
+    res = clib.sRGB_to_hex(r[:3], g[:3], b[:3])
+    assert res.dtype == np.dtype("<U7")
+
 def test_colorlib_gtrans():
 
     from numpy import asarray, ndarray
@@ -431,6 +560,28 @@ def test_colorlib_ftrans():
     gamma2 = asarray([0.1, 0.1])
     with pytest.raises(ValueError): clib.ftrans(u3, gamma2)
 
+
+def test_colorlib_validate():
+
+    from colorspace import colorlib
+
+    with pytest.raises(TypeError): colorlib(validate = 1)
+    with pytest.raises(TypeError): colorlib(validate = None)
+
+    # Input checks are performed by default
+    clib = colorlib()
+    x2, x3 = np.asarray([10., 20.]), np.asarray([10., 20., 30.])
+    with pytest.raises(ValueError, match = "Arguments of different lengths"):
+        clib.RGB_to_XYZ(x3, x2, x3)
+    with pytest.raises(ValueError, match = "XN/YN/ZN to `XYZ_to_LUV"):
+        clib.XYZ_to_LUV(x3, x3, x3, XN = x2)
+
+    # Skipped if validate = False (used by the color objects) ...
+    fast = colorlib(validate = False)
+    assert fast._check_input_arrays_("foo", a = x2, b = x3)
+    # ... with identical results
+    assert np.array_equal(clib.XYZ_to_LUV(x3, x3, x3), fast.XYZ_to_LUV(x3, x3, x3))
+
 # --------------------------------------------
 # --------------------------------------------
 # Testing standard representation (only that we get a string)
@@ -458,6 +609,36 @@ def test_getitem():
     with pytest.raises(TypeError): colors_to_test["foo"]
     with pytest.raises(TypeError): colors_to_test[(1, 2, 3)]
 
+def test_getitem_slices_and_arrays():
+    cols = HCL([0, 10, 20, 30], [10, 20, 30, 40], [50, 60, 70, 80], alpha = [.1, .2, .3, .4])
+    assert np.array_equal(cols[1:3].get("H"), [10, 20])
+    assert np.array_equal(cols[-1].get("H"), [30])
+    assert np.array_equal(cols[[3, 0]].get("alpha"), [.4, .1])
+    assert np.array_equal(cols[np.asarray([3, 0])].get("C"), [40, 10])
+    assert np.array_equal(cols[[True, False, False, True]].get("L"), [50, 80])
+    assert cols[[]].length() == 0
+    assert isinstance(cols[::2], polarLUV)
+
+    # Subset is independent of the original object
+    tmp = cols[1:3]
+    tmp.set(H = [99, 99])
+    assert np.array_equal(cols.get("H"), [0, 10, 20, 30])
+
+    x = hexcols(["#000000", "#FF0000", "#00FF00"])
+    assert x[[2, 0]].colors() == ["#00FF00", "#000000"]
+    assert x[::-1].colors() == ["#00FF00", "#FF0000", "#000000"]
+
+    with pytest.raises(TypeError):  cols[[1.5]]
+    with pytest.raises(TypeError):  cols[np.ones((2, 2), dtype = int)]
+    with pytest.raises(IndexError): cols[10]
+    with pytest.raises(IndexError): cols[[True, False]]
+
+def test_iterate_nested():
+    x = hexcols(["#000000", "#FF0000", "#00FF00"])
+    res = [a.colors()[0] + b.colors()[0] for a in x for b in x]
+    assert len(res) == 9 and res[5] == "#FF0000#00FF00"
+    assert not hasattr(x, "n")
+
 # Testing that sRGB and RGB must be within [0, 1]
 def test_sRGB_RGB_value_limits():
     assert isinstance(sRGB(0, 0, 0), sRGB)
@@ -660,6 +841,34 @@ def test_set_coords():
     cols.set(hex_ = x)
     assert np.array_equal(x, cols.get("hex_"))
 
+def test_packed_coords():
+    cols = HCL([260, 80, 30], [80, 0, 80], [30, 90, 30], [1, 0.6, 0.2])
+    buf  = cols._data_.buffer
+    assert buf.shape == (3, 4) and buf.flags["C_CONTIGUOUS"]
+    assert cols._data_.names == ["H", "C", "L", "alpha"]
+
+    # Views vs. copies
+    assert np.shares_memory(cols.get("H", copy = False), buf)
+    assert not np.shares_memory(cols.get("H"), buf)
+    assert not any(np.shares_memory(v, buf) for v in cols.get().values())
+    raises(TypeError, cols.get, "H", copy = 1)
+
+    # set() writes into the buffer
+    cols.set(C = [10, 20, 30])
+    assert np.array_equal(buf[:, 1], [10, 20, 30])
+
+    # Dropping/adding alpha
+    cols.dropalpha()
+    assert cols._data_.buffer.shape == (3, 3) and not cols.hasalpha()
+    cols._data_["alpha"] = np.asarray([0.1, 0.2, 0.3])
+    assert cols._data_.buffer.shape == (3, 4) and cols.hasalpha()
+    raises(ValueError, cols._data_.__setitem__, "alpha", np.ones(2))
+
+    # Conversion keeps packed storage, hex colors stored separately
+    cols.to("hex")
+    assert cols._data_.names == ["alpha"]
+    assert cols._data_.buffer.shape == (3, 1)
+
     
 # --------------------------------------------
 # Testing whitepoint
@@ -715,6 +924,105 @@ def test_misuse_whitepoint():
     x = RGB(1, 0.5, 0); x.WHITEX = [1, 2]; x.WHITEZ = ["a", "b", "c"]
     raises(ValueError, x.to, to = "CIEXYZ")
 
+# --------------------------------------------
+# Gamut membership and clipping
+# --------------------------------------------
+def test_in_gamut():
+    x = HCL(H = [0, 0, 120, 250, 0], C = [50, 150, 80, 200, 0], L = [50, 50, 90, 105, 100])
+    raises(TypeError,  x.in_gamut, atol = "1")
+    raises(ValueError, x.in_gamut, atol = -1.)
+    raises(TypeError,  x.in_gamut, _all = 1)
+
+    expected = np.asarray([True, False, True, False, True])
+    assert np.array_equal(x.in_gamut(), expected)
+    assert np.array_equal(x.gamut_mask(), expected)
+    assert x.in_gamut(_all = True) is False
+    assert HCL(H = [0, 120], C = [50, 80], L = [50, 90]).in_gamut(_all = True) is True
+
+    # Consistent with colors converted to hex without fixup (None)
+    rng  = np.random.default_rng(6)
+    cols = HCL(H = rng.random(500) * 360, C = rng.random(500) * 150, L = rng.random(500) * 100)
+    mask = cols.gamut_mask(atol = 1. / (2 * 255.))
+    assert np.array_equal(mask, [c is not None for c in cols.colors(fixup = False)])
+    for model in ["sRGB", "CIELAB", "hex"]:
+        tmp = deepcopy(cols)
+        tmp.to(model, fixup = False if model != "hex" else True)
+        if model != "hex":
+            assert np.array_equal(tmp.gamut_mask(atol = 1. / (2 * 255.)), mask)
+        else:
+            assert tmp.in_gamut(_all = True)
+
+    # Missing values are never within the gamut
+    assert np.array_equal(hexcols(["#ff0000", None]).in_gamut(), [True, False])
+
+def test_clip_to_gamut():
+    x = HCL(H = [0, 0, 120, 250], C = [50, 150, 80, 200], L = [50, 50, 90, 105])
+    raises(ValueError, x.clip_to_gamut, method = "foo")
+
+    # Reduces chroma, keeps hue and luminance (limited to [0, 100])
+    y = deepcopy(x)
+    assert y.clip_to_gamut() is None
+    assert isinstance(y, polarLUV)
+    assert y.in_gamut(_all = True)
+    assert np.array_equal(y.get("H"), x.get("H"))
+    assert np.array_equal(y.get("L"), [50, 50, 90, 100])
+    assert np.array_equal(y.get("C")[[0, 2, 3]], [50, 80, 0])
+    assert np.isclose(y.get("C")[1], 137.62, atol = 0.01)
+
+    # Clipping rgb
+    y = deepcopy(x)
+    y.clip_to_gamut(method = "rgb")
+    assert y.in_gamut(_all = True)
+    z = deepcopy(x)
+    z.to("hex")
+    y.to("hex")
+    assert y.colors() == z.colors()
+
+    # Other color spaces; class does not change
+    y = CIELAB([50, 50], [100, 10], [-120, 0])
+    y.clip_to_gamut()
+    assert isinstance(y, CIELAB) and y.in_gamut(_all = True)
+    assert np.array_equal(y.get("L"), [50, 50])
+    assert np.array_equal(y.get("A")[1], 10)
+
+    # HSV/HLS: conversion into HCL is ambiguous (as for `to()`), clipping rgb is fine
+    y = HSV([0, 120], [0.5, 1.5], [0.5, 0.5])
+    with raises(Exception, match = "ambiguous"):
+        y.clip_to_gamut()
+    y.clip_to_gamut(method = "rgb")
+    assert isinstance(y, HSV) and y.in_gamut(_all = True)
+
+def test_colors_format():
+    x = HCL(H = [0, 120, 250], C = [50, 150, 30], L = [50, 50, 70], alpha = [1, 0.5, 0.25])
+    raises(ValueError, x.colors, format = "foo")
+
+    # rgba8 identical to the hex colors
+    hex_  = x.colors()
+    res   = x.colors(format = "rgba8")
+    assert res.dtype == np.uint8 and res.shape == (3, 4) and res.flags.c_contiguous
+    assert [f"#{r:02X}{g:02X}{b:02X}" for r, g, b in res[:, :3]] == [h[:7] for h in hex_]
+    assert np.array_equal(res[:, 3], [255, 128, 64])
+    assert np.array_equal(x.colors(format = "rgba8", rev = True), res[::-1])
+
+    res = x.colors(format = "rgba")
+    assert res.shape == (3, 4) and np.all((res >= 0) & (res <= 1))
+    assert np.array_equal(res[:, :3], x.colors(format = "rgb"))
+    assert np.allclose(x.colors(format = "hcl"), np.transpose([x.get("H"), x.get("C"), x.get("L")]))
+
+    # Colors outside the gamut without fixup
+    res = x.colors(format = "rgb", fixup = False)
+    assert np.all(np.isnan(res[1])) and not np.any(np.isnan(res[[0, 2]]))
+    raises(ValueError, x.colors, format = "rgba8", fixup = False)
+
+    # Other color spaces
+    y = hexcols(["#FF0000", "#00FF0080"])
+    assert np.array_equal(y.colors(format = "rgba8"), [[255, 0, 0, 255], [0, 255, 0, 128]])
+    for model in ["sRGB", "CIELAB", "HSV"]:
+        tmp = deepcopy(y)
+        tmp.to(model)
+        assert np.allclose(tmp.colors(format = "rgb"), [[1, 0, 0], [0, 1, 0]], atol = 1e-4)
+        assert np.allclose(tmp.colors(format = "hcl"), y.colors(format = "hcl"), atol = 1e-3)
+
 # --------------------------------------------
 # Plotting ..
 # --------------------------------------------
@@ -0,0 +1,119 @@
+
+
+import pytest
+import numpy as np
+from colorspace import colorlib
+
+# -------------------------------------------------------------------
+# The HSV/HLS conversion kernels are vectorized. The scalar reference
+# implementations below are the former per-color support functions
+# and are used to ensure the vectorized kernels return identical results,
+# including the special cases (grays with min == max, s == 0, ties).
+# -------------------------------------------------------------------
+
+def _qtrans(q1, q2, hue):
+    if hue > 360.:   hue = hue - 360.
+    if hue < 0:      hue = hue + 360.
+    if hue < 60.:    return q1 + (q2 - q1) * hue / 60.
+    elif hue < 180.: return q2
+    elif hue < 240.: return q1 + (q2 - q1) * (240. - hue) / 60.
+    else:            return q1
+
+def ref_sRGB_to_HSV(r, g, b):
+    x = min([r, g, b]); y = max([r, g, b])
+    if y == x: return [0., 0., y]
+    f = g - b if r == x else b - r if g == x else r - g
+    i = 3. if r == x else 5. if g == x else 1.
+    return [60. * (i - f /(y - x)), (y - x)/y, y]
+
+def ref_HSV_to_sRGB(h, s, v):
+    h = h / 60.
+    i = np.floor(h)
+    f = h - i
+    if (i % 2) == 0: f = 1 - f
+    m = v * (1 - s)
+    n = v * (1 - s * f)
+    if i in [0, 6]:    return [v, n, m]
+    elif i == 1:       return [n, v, m]
+    elif i == 2:       return [m, v, n]
+    elif i == 3:       return [m, n, v]
+    elif i == 4:       return [n, m, v]
+    elif i == 5:       return [v, m, n]
+
+def ref_sRGB_to_HLS(r, g, b):
+    mn = min([r, g, b]); mx = max([r, g, b])
+    l = (mx + mn) / 2.
+    if mx == mn: return [0., l, 0.]
+    s = (mx - mn) / (mx + mn) if l < 0.5 else (mx - mn) / (2. - mx - mn)
+    if r == mx:  h = (g - b) / (mx - mn)
+    if g == mx:  h = 2. + (b - r) / (mx - mn)
+    if b == mx:  h = 4. + (r - g) / (mx - mn)
+    h = h * 60.
+    if h < 0.:   h = h + 360.
+    if h > 360.: h = h - 360.
+    return [h, l, s]
+
+def ref_RGB_to_HLS(r, g, b):
+    mn = min([r, g, b]); mx = max([r, g, b])
+    if mn == mx: return [0., mn, 0.]
+    l = (mn + mx) / 2.
+    s = (mx - mn) / (mx + mn) if l < 0.5 else (mx - mn) / (2. - mx - mn)
+    if r == mx:      h = 60. * (g - b) / (mx - mn)
+    elif g == mx:    h = 60. * (2. + (b - r) / (mx - mn))
+    else:            h = 60. * (4. + (r - g) / (mx - mn))
+    if h < 0.:       h = h + 360.
+    elif h > 360.:   h = h - 360.
+    return [h, l, s]
+
+def ref_HLS_to_sRGB(h, l, s):
+    if s == 0: return [l, l, l]
+    p2 = l * (1. + s) if l <= 0.5 else l + s - (l * s)
+    p1 = 2 * l - p2
+    return [_qtrans(p1, p2, h + 120.), _qtrans(p1, p2, h), _qtrans(p1, p2, h - 120.)]
+
+
+def _reference(fun, x, y, z):
+    return np.transpose([fun(x[i], y[i], z[i]) for i in range(len(x))])
+
+@pytest.fixture
+def rgb_coords():
+    rng = np.random.default_rng(42)
+    rnd = rng.random((3, 500))
+    # Quantized coordinates produce many grays and ties (r == g, ...)
+    qnt = rng.integers(0, 4, (3, 500)) / 3.
+    return np.hstack([rnd, qnt, [[0., 1., 0.5], [0., 1., 0.5], [0., 1., 0.5]]])
+
+@pytest.fixture
+def hue_coords():
+    rng = np.random.default_rng(42)
+    h = np.concatenate([rng.random(500) * 360.,
+                        [0., 60., 120., 180., 240., 300., 360., 0.001, 359.999]])
+    s = rng.random(len(h)); s[::5] = 0. # Add saturation == 0
+    v = rng.random(len(h)); v[::7] = 0.5
+    return [h, s, v]
+
+@pytest.mark.parametrize("fun,ref", [("sRGB_to_HSV", ref_sRGB_to_HSV),
+                                     ("RGB_to_HSV",  ref_sRGB_to_HSV),
+                                     ("sRGB_to_HLS", ref_sRGB_to_HLS),
+                                     ("RGB_to_HLS",  ref_RGB_to_HLS)])
+def test_rgb_to_hsv_hls_parity(fun, ref, rgb_coords):
+    res = getattr(colorlib(), fun)(*rgb_coords)
+    assert isinstance(res, list) and len(res) == 3
+    assert np.array_equal(np.asarray(res), _reference(ref, *rgb_coords))
+
+@pytest.mark.parametrize("fun,ref", [("HSV_to_sRGB", ref_HSV_to_sRGB),
+                                     ("HSV_to_RGB",  ref_HSV_to_sRGB),
+                                     ("HLS_to_sRGB", ref_HLS_to_sRGB),
+                                     ("HLS_to_RGB",  ref_HLS_to_sRGB)])
+def test_hsv_hls_to_rgb_parity(fun, ref, hue_coords):
+    res = getattr(colorlib(), fun)(*hue_coords)
+    assert isinstance(res, list) and len(res) == 3
+    assert np.allclose(np.asarray(res), _reference(ref, *hue_coords), rtol = 0., atol = 1e-15)
+
+def test_hsv_to_rgb_invalid_hue():
+    clib = colorlib()
+    with pytest.raises(Exception, match = "non-defined ifelse"):
+        clib.HSV_to_sRGB(np.asarray([420.]), np.asarray([1.]), np.asarray([1.]))
+    with pytest.raises(Exception, match = "non-defined ifelse"):
+        clib.HSV_to_RGB(np.asarray([-10.]), np.asarray([1.]), np.asarray([1.]))
+
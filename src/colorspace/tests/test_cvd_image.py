@@ -0,0 +1,49 @@
+
+import pytest
+from pytest import raises
+import numpy as np
+from colorspace import simulate_cvd_image, simulate_cvd, sRGB
+
+@pytest.fixture
+def img():
+    return np.random.default_rng(1).integers(0, 256, (60, 50, 4), dtype = np.uint8)
+
+# ------------------------------------------
+# Wrong usage
+# ------------------------------------------
+def test_simulate_cvd_image_wrong_usage(img):
+    raises(TypeError,  simulate_cvd_image, img.astype(float))
+    raises(TypeError,  simulate_cvd_image, img[:, :, 0])
+    raises(ValueError, simulate_cvd_image, img, cvd = "foo")
+    raises(ValueError, simulate_cvd_image, img, severity = 1.1)
+    raises(TypeError,  simulate_cvd_image, img, linear = 1)
+    raises(ValueError, simulate_cvd_image, img, out = np.empty((60, 50, 3), dtype = np.uint8))
+    raises(TypeError,  simulate_cvd_image, img, tilesize = 1.)
+    raises(ValueError, simulate_cvd_image, img, cores = 0)
+
+# ------------------------------------------
+# Simulated colors
+# ------------------------------------------
+@pytest.mark.parametrize("linear", [True, False])
+def test_simulate_cvd_image(img, linear):
+    x = img[:, :, :3].reshape((-1, 3)) / 255.
+    x = sRGB(x[:, 0], x[:, 1], x[:, 2])
+    for cvd in ["deutan", "protan", "tritan"]:
+        res = simulate_cvd_image(img, cvd, 0.6, linear = linear, tilesize = 120)
+        assert res.dtype == np.uint8 and res.shape == img.shape
+        assert np.array_equal(res[:, :, 3], img[:, :, 3])
+
+        # Single precision and lookup tables; may differ by one
+        ref = np.floor(simulate_cvd(x, cvd, 0.6, linear = linear)[0, 0] * 255. + .5)
+        assert np.max(np.abs(res[:, :, :3].reshape((-1, 3)) - ref)) <= 1
+
+        # Tiles processed in parallel, written into `out`
+        out = np.zeros_like(img)
+        assert simulate_cvd_image(img, cvd, 0.6, linear = linear, out = out, cores = 3, tilesize = 100) is out
+        assert np.array_equal(out, res)
+
+def test_simulate_cvd_image_other(img):
+    assert np.array_equal(simulate_cvd_image(img, "original"), img)
+    res = simulate_cvd_image(img[:, :, :3], "desaturate", 1.)
+    assert res.shape == (60, 50, 3)
+    assert np.all(np.ptp(res.astype(int), axis = 2) <= 1)
@@ -159,3 +159,86 @@ def test_divergingx_palettes():
 
 
 
+
+
+# ------------------------------------------
+# Palette registry (config files parsed once)
+# ------------------------------------------
+def test_palette_registry():
+    from colorspace.palettes import _palette_registry_, _palette_config_files_
+    from colorspace import sequential_hcl
+
+    files = _palette_config_files_()
+    [pals1, index1] = _palette_registry_(files)
+    [pals2, index2] = _palette_registry_(files)
+    assert pals1 is pals2 and index1 is index2
+    assert index1["BLUES"][0].name() == "Blues"
+
+    # hclpalettes objects get their own copies
+    a = hclpalettes(); b = hclpalettes()
+    a.get_palette("Blues").set(h1 = 10)
+    assert b.get_palette("Blues").get("h1") == 260
+    assert a.get_palette("blues").get("h1") == 10
+    assert sequential_hcl("Blues").settings["h1"] == 260
+
+    # Palettes removed from the object can no longer be found
+    t = a.get_palette("Blues").type()
+    del a._palettes_[t]
+    raises(ValueError, a.get_palette, "Blues")
+
+def test_palette_registry_custom_file(tmp_path):
+    import os
+    file = tmp_path / "custom.conf"
+    conf = "[main]\ntype = Custom\nmethod = sequential_hcl\n\n" + \
+           "[palette Foo]\nh1 = {:d}\nc1 = 50\nl1 = 30\nl2 = 90\np1 = 1.0\n"
+    file.write_text(conf.format(100))
+    assert hclpalettes(files = str(file)).get_palette("foo").get("h1") == 100
+
+    # Modified file (modification time) is parsed again
+    file.write_text(conf.format(200))
+    mtime = os.path.getmtime(file) + 10
+    os.utime(file, (mtime, mtime))
+    assert hclpalettes(files = str(file)).get_palette("foo").get("h1") == 200
+
+def test_palette_artifact(tmp_path):
+    import json
+    from os.path import basename
+    from colorspace.palettes import _compile_palette_config_, _palette_config_files_, \
+                                    _palette_artifact_spec_
+
+    outfile = _compile_palette_config_(str(tmp_path / "palconfig.json"))
+    with open(outfile, "r") as fid: res = json.load(fid)
+    assert isinstance(res["format"], int)
+
+    # Specifications identical to parsing the config files
+    files = _palette_config_files_()
+    assert len(res["files"]) == len(files)
+    for file in files:
+        spec = hclpalettes._read_palette_config_(file)
+        assert res["files"][basename(file)]["spec"] == spec
+        assert _palette_artifact_spec_(file) == spec
+
+    # Only used for the files shipped with the package
+    assert _palette_artifact_spec_(outfile) is None
+
+    # Lambda functions stored as str, evaluated when creating the palettes
+    [t, pals] = hclpalettes._load_palette_config_([f for f in files if "qualitative" in f][0])
+    assert t == "Basic: Qualitative" and callable(pals[0].get("h2"))
+
+def test_palette_artifact_no_write(monkeypatch):
+    import os
+    import colorspace.palettes as palettes
+    from colorspace.palettes import _palette_artifact_file_, _palette_config_files_, \
+                                    _palette_artifact_spec_, _PALETTE_REGISTRY_
+
+    # Missing artifact: the config files are parsed, nothing is written
+    missing = os.path.join(os.path.dirname(_palette_artifact_file_()), "__missing__.json")
+    monkeypatch.setattr(palettes, "_palette_artifact_file_", lambda: missing)
+    monkeypatch.setitem(_PALETTE_REGISTRY_, "artifact", None)
+    assert _palette_artifact_spec_(_palette_config_files_()[0]) is None
+    assert not os.path.exists(missing)
+
+    # Outdated entry (content changed)
+    monkeypatch.setitem(_PALETTE_REGISTRY_, "artifact",
+                        {"files": {os.path.basename(f): {"source": "", "spec": {}} for f in _palette_config_files_()}})
+    assert _palette_artifact_spec_(_palette_config_files_()[0]) is None
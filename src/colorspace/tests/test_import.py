@@ -0,0 +1,50 @@
+
+import os
+import sys
+import subprocess
+import pytest
+import colorspace
+
+# Runs python code in a fresh interpreter, returns stdout
+def _run(code):
+    res = subprocess.run([sys.executable, "-c", code], capture_output = True, text = True,
+                         env = dict(os.environ, PYTHONPATH = os.pathsep.join(sys.path)))
+    assert res.returncode == 0, res.stderr
+    return res.stdout.strip()
+
+# ------------------------------------------
+# Lazy imports
+# ------------------------------------------
+def test_lazy_import():
+    code = "import sys, colorspace; print(','.join(sorted(m for m in sys.modules if m.startswith(('colorspace', 'tkinter', 'matplotlib')))))"
+    assert _run(code) == "colorspace,colorspace.version"
+
+    # Only what is needed is imported
+    code = "import sys; from colorspace import sequential_hcl; sequential_hcl().colors(3); " + \
+           "print(any(m in sys.modules for m in ['tkinter', 'colorspace.choose_palette', " + \
+           "'colorspace.swatchplot', 'colorspace.demos', 'colorspace.cvd_image']))"
+    assert _run(code) == "False"
+
+def test_public_names():
+    from colorspace import colorlib, swatchplot, hcl_palettes, HCL
+    assert isinstance(colorlib, type) and isinstance(HCL, type)
+    assert callable(swatchplot) and callable(hcl_palettes)
+
+    # All public names available; submodules named like the function they
+    # provide do not replace the function.
+    import colorspace.swatchplot, colorspace.cvd_image
+    for name in colorspace._LAZY_:
+        assert not type(getattr(colorspace, name)).__name__ == "module"
+        assert name in dir(colorspace)
+    assert colorspace.palettes.__name__ == "colorspace.palettes"
+    with pytest.raises(AttributeError):
+        colorspace.foo
+
+# ------------------------------------------
+# Heavy submodules are not loaded by `import colorspace`
+# (timings: benchmarks/benchmark_import.py).
+# ------------------------------------------
+def test_import_no_heavy_modules():
+    code = "import sys, colorspace; " + \
+           "print([m for m in ['colorspace.palettes', 'colorspace.hclplot', 'matplotlib'] if m in sys.modules])"
+    assert _run(code) == "[]"
@@ -0,0 +1,108 @@
+
+import pytest
+from pytest import raises
+from colorspace import lut3d, bake_lut, load_lut, deutan, simulate_cvd
+from colorspace.colorlib import sRGB, hexcols
+import numpy as np
+
+# Affine transformation; reproduced exactly by both interpolation methods
+def _affine(x):
+    return np.stack(x._convert_coords_("sRGB"), axis = 1) * 0.5 + 0.25
+
+# ------------------------------------------
+# Wrong usage
+# ------------------------------------------
+def test_lut_wrong_usage():
+    raises(TypeError,  lut3d, [1, 2, 3])
+    raises(ValueError, lut3d, np.zeros((3, 3, 3)))
+    raises(ValueError, lut3d, np.zeros((3, 3, 2, 3)))
+    raises(ValueError, lut3d, np.zeros((1, 1, 1, 3)))
+    raises(TypeError,  lut3d, np.zeros((2, 2, 2, 3)), name = 1)
+
+    raises(TypeError,  bake_lut, "foo")
+    raises(TypeError,  bake_lut, deutan, size = 3.)
+    raises(ValueError, bake_lut, deutan, size = 1)
+    raises(ValueError, bake_lut, lambda x: np.zeros((2, 3)), size = 3)
+
+    lut = bake_lut(_affine, size = 3)
+    raises(ValueError, lut.apply, np.zeros((2, 3)), method = "foo")
+    raises(TypeError,  lut.apply, np.zeros((2, 3)), chunksize = 1.)
+    raises(ValueError, lut.apply, np.zeros((2, 3)), chunksize = 0)
+    raises(TypeError,  lut.apply, 3)
+    raises(TypeError,  lut.apply, np.zeros((2, 3), dtype = np.uint16))
+    raises(ValueError, lut.apply, np.zeros((2, 5)))
+
+    raises(TypeError,  lut.save, 1)
+    raises(ValueError, lut.save, "foo.txt")
+    raises(TypeError,  load_lut, 1)
+    raises(FileNotFoundError, load_lut, "__not_existing__.cube")
+
+# ------------------------------------------
+# Applying lookup tables
+# ------------------------------------------
+@pytest.mark.parametrize("method", ["trilinear", "tetrahedral"])
+def test_lut_apply(method):
+    lut = bake_lut(_affine, size = 5, name = "affine")
+    assert lut.size() == 5 and repr(lut) == "3D LUT \"affine\" (5^3 nodes)"
+
+    # Float input, chunked
+    x   = np.random.default_rng(1).random((10, 20, 3))
+    res = lut.apply(x, method = method, chunksize = 33)
+    assert res.shape == x.shape and res.dtype == x.dtype
+    assert np.allclose(res, x * 0.5 + 0.25, atol = 1e-12)
+
+    # Unsigned 8 bit integers, alpha is kept
+    x   = np.random.default_rng(2).integers(0, 256, (10, 20, 4), dtype = np.uint8)
+    res = lut.apply(x, method = method)
+    assert res.shape == x.shape and res.dtype == np.uint8
+    assert np.array_equal(res[..., 3], x[..., 3])
+    assert np.abs(res[..., :3] - np.floor(x[..., :3] * 0.5 + 0.25 * 255 + 0.5)).max() <= 1
+
+    # Hex colors and color objects
+    res = lut.apply(["#000000", "#FFFFFF80"], method = method)
+    assert isinstance(res, sRGB)
+    assert np.allclose(res.get("R"), [0.25, 0.75])
+    assert np.allclose(res.get("alpha"), [np.nan, 128 / 255], equal_nan = True)
+    assert np.allclose(lut.apply(sRGB([0.5], [0.5], [0.5]), method = method).get("G"), [0.5])
+
+@pytest.mark.parametrize("method", ["trilinear", "tetrahedral"])
+def test_lut_cvd(method):
+    # Approximation of a non-linear transformation
+    lut = bake_lut(deutan, size = 33)
+    x   = np.random.default_rng(3).random((2000, 3))
+    ref = simulate_cvd(sRGB(x[:, 0], x[:, 1], x[:, 2]), "deutan")[0, 0]
+    err = np.abs(lut.apply(x, method = method) - ref)
+    assert err.mean() < 2e-3 and err.max() < 0.1
+
+    # Nodes are reproduced exactly
+    res = lut.apply(["#FF0000", "#00FF00"], method = method)
+    assert res.colors() == deutan(hexcols(["#FF0000", "#00FF00"])).colors()
+
+# ------------------------------------------
+# Saving and loading
+# ------------------------------------------
+def test_lut_save_load(tmp_path):
+    lut = bake_lut(deutan, size = 9, name = "deutan")
+
+    file = str(tmp_path / "lut.npy")
+    lut.save(file)
+    assert np.array_equal(load_lut(file).table, lut.table)
+
+    file = str(tmp_path / "lut.cube")
+    lut.save(file)
+    res = load_lut(file)
+    assert res.name == "deutan" and res.size() == 9
+    assert np.allclose(res.table, lut.table, atol = 1e-7)
+    with open(file, "r") as fid:
+        lines = fid.readlines()
+    # Red changes fastest
+    assert lines[1].strip() == "LUT_3D_SIZE 9"
+    assert np.allclose([float(x) for x in lines[3].split()], lut.table[1, 0, 0])
+
+    # Unsupported files
+    with open(file, "w") as fid:
+        fid.write("LUT_1D_SIZE 2\n0 0 0\n1 1 1\n")
+    raises(ValueError, load_lut, file)
+    with open(file, "w") as fid:
+        fid.write("LUT_3D_SIZE 2\n0 0 0\n1 1 1\n")
+    raises(ValueError, load_lut, file)
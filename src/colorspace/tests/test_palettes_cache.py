@@ -0,0 +1,91 @@
+
+import pytest
+from pytest import raises
+from colorspace import sequential_hcl, diverging_hcl, qualitative_hcl, rainbow
+from colorspace import set_palette_cache, palette_cache_info, clear_palette_cache
+
+@pytest.fixture
+def cache():
+    set_palette_cache(8)
+    clear_palette_cache()
+    yield
+    set_palette_cache(0)
+    clear_palette_cache()
+
+def test_palette_cache_wrong_usage():
+    raises(TypeError,  set_palette_cache, 1.)
+    raises(TypeError,  set_palette_cache, True)
+    raises(ValueError, set_palette_cache, -1)
+
+def test_palette_cache_disabled():
+    # Disabled by default
+    assert palette_cache_info()["maxsize"] == 0
+    sequential_hcl().colors(5)
+    assert palette_cache_info() == {"hits": 0, "misses": 0, "maxsize": 0, "currsize": 0}
+
+def test_palette_cache(cache):
+    pal = sequential_hcl("Blues")
+    ref = pal.colors(5)
+    res = pal.colors(5)
+    assert res == ref
+    assert palette_cache_info() == {"hits": 1, "misses": 1, "maxsize": 8, "currsize": 1}
+
+    # Returns a copy; modifying the result does not modify the cache
+    res[0] = "#000000"
+    assert pal.colors(5) == ref
+
+    # Different arguments, different palette
+    assert pal.colors(5, rev = True) == ref[::-1]
+    assert sequential_hcl("Blues", rev = True).colors(5) == ref[::-1]
+    assert pal.colors(5, alpha = 0.5) != ref
+    assert diverging_hcl().colors(5) != ref
+    assert palette_cache_info()["misses"] == 5
+
+    # Changing the settings invalidates the cache
+    pal.settings["h1"] = 0
+    assert pal.colors(5) != ref
+    assert palette_cache_info()["misses"] == 6
+
+    # Palettes with functions in the settings
+    qualitative_hcl().colors(3); rainbow().colors(3)
+    assert qualitative_hcl().colors(3) == qualitative_hcl().colors(3)
+
+def test_palette_cache_resize(cache):
+    for n in range(2, 10):
+        sequential_hcl().colors(n)
+    assert palette_cache_info()["currsize"] == 8
+    set_palette_cache(2)
+    assert palette_cache_info()["currsize"] == 2
+    sequential_hcl().colors(9)
+    assert palette_cache_info()["hits"] == 1
+    clear_palette_cache()
+    assert palette_cache_info() == {"hits": 0, "misses": 0, "maxsize": 2, "currsize": 0}
+
+def test_palette_cache_numeric(cache):
+    pal = sequential_hcl()
+    res = pal.colors(5, format = "rgba8")
+    res[0] = 0
+    assert not (pal.colors(5, format = "rgba8")[0] == 0).all()
+    assert palette_cache_info()["hits"] == 1
+
+def test_palette_cache_arguments(cache):
+    # Positional, named, and explicit default arguments share one entry
+    pal = sequential_hcl("Blues")
+    ref = pal.colors(5)
+    assert pal.colors(n = 5) == ref
+    assert pal.colors(5, fixup = None, alpha = None, format = "hex") == ref
+    assert palette_cache_info()["hits"] == 2 and palette_cache_info()["currsize"] == 1
+
+    # Identical (new) lambdas share one entry
+    for i in range(3):
+        qualitative_hcl([0, lambda n: 360. * (n - 1.) / n]).colors(4)
+    assert palette_cache_info()["hits"] == 4 and palette_cache_info()["currsize"] == 2
+
+    # Functions using global names are not cached
+    import math
+    pal = qualitative_hcl([0, lambda n: math.floor(360. * (n - 1.) / n)])
+    assert pal.colors(4) == pal.colors(4)
+    assert palette_cache_info()["currsize"] == 2
+
+    # Invalid arguments raise as without cache
+    raises(TypeError, sequential_hcl().colors, 5, n = 3)
@@ -195,3 +195,28 @@ def test_diverging_hcl_methods():
     match("\n".join(pattern), txt)
 
 
+
+
+# ------------------------------------------
+# Batch palette generation
+# ------------------------------------------
+def test_hclpalettes_colors_batch():
+    from colorspace import hclpalettes
+    pals = hclpalettes()
+
+    raises(TypeError,  pals.colors_batch, 3.)
+    raises(TypeError,  pals.colors_batch, [])
+    raises(ValueError, pals.colors_batch, [3, 0])
+    raises(TypeError,  pals.colors_batch, 3, type_ = 1)
+    raises(TypeError,  pals.colors_batch, 3, fixup = None)
+
+    # Identical to the colors of the individual palettes
+    res = pals.colors_batch([1, 2, 7])
+    assert len(res) == len(pals.get_palettes())
+    for pal in pals.get_palettes():
+        assert res[pal.name()] == {1: pal(1), 2: pal(2), 7: pal(7)}
+
+    res = pals.colors_batch(4, type_ = ["Basic: Qualitative", "Advanced: DivergingX"])
+    assert res["Pastel 1"] == pals.get_palette("Pastel 1")(4)
+    assert res["Zissou 1"] == pals.get_palette("Zissou 1")(4)
+    assert "Blues 2" not in res
@@ -0,0 +1,91 @@
+
+import pytest
+from pytest import raises
+from colorspace import sequential_hcl, diverging_hcl, qualitative_hcl, rainbow
+import numpy as np
+
+try:
+    import matplotlib
+    _got_mpl = True
+except:
+    _got_mpl = False
+
+def _rgba8(cols):
+    # Hex colors to uint8 rgba array (N, 4)
+    return np.asarray([[int(c[i:i + 2], 16) for i in [1, 3, 5]] + [255] for c in cols], dtype = np.uint8)
+
+# ------------------------------------------
+# Wrong usage
+# ------------------------------------------
+def test_map_wrong_usage():
+    pal = sequential_hcl()
+    raises(ValueError, pal.map, "foo")
+    raises(TypeError,  pal.map, [1, 2], vmin = "0")
+    raises(ValueError, pal.map, [1, 2], vmin = 3, vmax = 2)
+    raises(ValueError, pal.map, [1, 2], breaks = [1])
+    raises(ValueError, pal.map, [1, 2], breaks = [1, 3, 2])
+    raises(TypeError,  pal.map, [1, 2], n = 2.)
+    raises(ValueError, pal.map, [1, 2], n = 0)
+    raises(ValueError, pal.map, [1, 2], out = "hex")
+    raises(ValueError, pal.map, [1, 2], under = 3)
+    raises(ValueError, pal.map, [1, 2], nan = "#zzz")
+
+# ------------------------------------------
+# Mapping values
+# ------------------------------------------
+def test_map_values():
+    pal  = sequential_hcl("Blues 3")
+    cols = _rgba8(pal.colors(4))
+
+    x = np.asarray([[0, 0.24, 0.25], [0.99, 1., np.nan]])
+    res = pal.map(x, n = 4)
+    assert res.dtype == np.uint8 and res.shape == (2, 3, 4)
+    assert np.array_equal(res[0], cols[[0, 0, 1]])
+    assert np.array_equal(res[1, :2], cols[[3, 3]])
+    assert np.array_equal(res[1, 2], [0, 0, 0, 0])
+
+    # Limits; under and over colors
+    res = pal.map([-1, 0, 10, 11], vmin = 0, vmax = 10, n = 4, under = "#ff0000", over = "#00ff00")
+    assert np.array_equal(res, np.vstack([[255, 0, 0, 255], cols[[0, 3]], [0, 255, 0, 255]]))
+    res = pal.map([-1, 11], vmin = 0, vmax = 10, n = 4)
+    assert np.array_equal(res, cols[[0, 3]])
+
+    # Output formats
+    assert np.array_equal(pal.map(x, n = 4, out = "rgb8"), pal.map(x, n = 4)[..., :3])
+    assert np.array_equal(pal.map(x, n = 4, out = "rgba"), pal.map(x, n = 4) / 255.)
+    assert pal.map(x, out = "rgb").shape == (2, 3, 3)
+
+    # Constant values, scalar input
+    assert np.array_equal(pal.map([3, 3], n = 4), cols[[0, 0]])
+    assert pal.map(1.).shape == (4,)
+
+    # Other palettes, semi-transparent color for missing values
+    assert qualitative_hcl().map([0, 1]).shape == (2, 4)
+    assert rainbow().map([0, 1]).shape == (2, 4)
+    assert np.array_equal(pal.map([np.nan], nan = "#ff000080"), [[255, 0, 0, 128]])
+
+def test_map_breaks():
+    pal  = diverging_hcl()
+    cols = _rgba8(pal.colors(3))
+    res  = pal.map([0, 0.5, 1, 2, 10, 100, -1, 101, np.nan], breaks = [0, 1, 10, 100])
+    assert np.array_equal(res[:6], cols[[0, 0, 1, 1, 2, 2]])
+    assert np.array_equal(res[6:8], cols[[0, 2]])
+    assert np.array_equal(res[8], [0, 0, 0, 0])
+
+def test_map_cache():
+    pal = sequential_hcl("Blues 3")
+    pal.map([0, 1], n = 4)
+    lut = pal._map_lut_(4, None, None, "#00000000", True)
+    assert lut is pal._map_lut_(4, None, None, "#00000000", True)
+    assert not lut.flags.writeable
+
+    # Changing the settings invalidates the cache
+    pal.settings["h1"] = 0
+    assert not np.array_equal(pal.map([0, 1], n = 4), lut[[0, 3]])
+    assert np.array_equal(pal.map([0, 1], n = 4), _rgba8(pal.colors(4))[[0, 3]])
+
+@pytest.mark.skipif(not _got_mpl, reason = "Requires matplotlib")
+def test_map_matplotlib():
+    pal = diverging_hcl()
+    x   = np.random.default_rng(1).random((50, 40))
+    assert np.array_equal(pal.map(x, vmin = 0, vmax = 1), pal.cmap(256)(x, bytes = True))
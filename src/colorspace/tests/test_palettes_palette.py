@@ -283,3 +283,43 @@ def test_specplot():
     plt.close()
 
 
+
+
+# ------------------------------------------
+# Nearest palette colors
+# ------------------------------------------
+def test_nearest():
+    from colorspace import color_distance, sRGB
+
+    pal = palette(diverging_hcl(), n = 5)
+    raises(TypeError,  pal.nearest, 3)
+    raises(ValueError, pal.nearest, np.zeros((10, 4)))
+    raises(ValueError, pal.nearest, "#ff0000", space = "HCL")
+    raises(TypeError,  pal.nearest, "#ff0000", chunksize = 1.)
+    raises(ValueError, pal.nearest, "#ff0000", cores = 0)
+
+    # Palette colors are their own nearest colors
+    [idx, dist] = pal.nearest(pal.colors())
+    assert np.array_equal(idx, np.arange(5))
+    assert np.allclose(dist, 0.)
+
+    # Image (uint8), compared against the distance matrix (CIE76)
+    img = np.random.default_rng(1).integers(0, 256, (30, 40, 3), dtype = np.uint8)
+    [idx, dist] = pal.nearest(img)
+    assert idx.shape == (30, 40) and dist.shape == (30, 40)
+    rgb = img.reshape((-1, 3)).T / 255.
+    D   = color_distance(sRGB(*rgb), pal.colors(), metric = "deltaE76", pairwise = True)
+    assert np.array_equal(idx.ravel(), np.argmin(D, axis = 1))
+    assert np.allclose(dist.ravel(), np.min(D, axis = 1))
+
+    # Float input, chunks and threads; colorobjects
+    [idx2, dist2] = pal.nearest(img / 255., chunksize = 100, cores = 2)
+    assert np.array_equal(idx2, idx) and np.allclose(dist2, dist)
+    [idx3, dist3] = pal.nearest(sRGB(*rgb))
+    assert np.array_equal(idx3, idx.ravel()) and np.allclose(dist3, dist.ravel())
+
+    # Other color space
+    [idx, dist] = pal.nearest(sRGB(*rgb), space = "sRGB")
+    D = np.sqrt(np.sum((rgb.T[:, np.newaxis, :] -
+                        pal._nearest_coords_("sRGB")[np.newaxis, :, :])**2, axis = 2))
+    assert np.array_equal(idx, np.argmin(D, axis = 1))
@@ -18,3 +18,14 @@ def test_list_return_length2():
     assert np.all(res)
 
 
+
+# Numeric output formats
+def test_numeric_return():
+    for x in types:
+        pal = eval("colorspace.{:s}_hcl()".format(x))
+        res = pal.colors(3, format = "rgba8")
+        assert isinstance(res, np.ndarray) and res.shape == (3, 4)
+        assert np.array_equal(res, colorspace.palette(pal.colors(3)).colors(format = "rgba8"))
+        assert pal.colors(3, format = "hcl").shape == (3, 3)
+    assert colorspace.rainbow().colors(3, format = "rgb").shape == (3, 3)
+    assert colorspace.diverging_hsv().colors(3, format = "rgba").shape == (3, 4)
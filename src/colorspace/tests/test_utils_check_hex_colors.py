@@ -91,3 +91,30 @@ def test_matplotlib_to_hex():
 
 
 
+
+
+# ------------------------------------------
+# Batch decoding; invalid entries reported by index
+# ------------------------------------------
+def test_invalid_index():
+    with raises(ValueError, match = r"\(index 2\)"):
+        check_hex_colors(["#FF0000", "#0F0", "#GG0000"])
+    with raises(ValueError, match = r"2 strings .* \(index 1\), .* \(index 3\)"):
+        check_hex_colors(np.asarray(["#FF0000", "#F0", "#00F", "#0000FF0"]))
+
+def test_batch_decoding():
+    x = ["#f0f", None, "#00FFFF", "#ff003311", "#AbCdEf"]
+    res = check_hex_colors(x)
+    assert res == ["#FF00FF", None, "#00FFFF", "#FF003311", "#ABCDEF"]
+
+    cols = hexcols(x)
+    assert cols.get("hex_").tolist() == ["#FF00FF", None, "#00FFFF", "#FF0033", "#ABCDEF"]
+    assert np.array_equal(cols.get("alpha"), [np.nan, np.nan, np.nan, 0x11 / 255, np.nan],
+                          equal_nan = True)
+
+    # Decoding to sRGB (three, six, eight digit; invalid as NaN)
+    from colorspace.colorlib import colorlib
+    [r, g, b] = colorlib().hex_to_sRGB(["#F0F", "#00FF0080", None, "#FF"])
+    assert np.array_equal(r, [1., 0., np.nan, np.nan], equal_nan = True)
+    assert np.array_equal(g, [0., 1., np.nan, np.nan], equal_nan = True)
+    assert np.array_equal(b, [1., 0., np.nan, np.nan], equal_nan = True)
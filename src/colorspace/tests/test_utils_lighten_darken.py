@@ -1,6 +1,7 @@
 
 
 from colorspace import lighten, darken
+import pytest
 from pytest import raises
 import numpy as np
 
@@ -126,3 +127,61 @@ def test_return_colorobject():
     assert isinstance(res, colorobject)
     assert col.length() == res.length()
 
+
+# ------------------------------------------
+# Color objects and per-color amounts
+# ------------------------------------------
+def test_lighten_colorobject():
+    from colorspace.colorlib import sRGB, HCL, hexcols
+
+    # Same class, no quantization to hex, input not modified
+    col = sRGB(R = [0.2, 0.6], G = [0.3, 0.1], B = [0.6, 0.2], alpha = [1., 0.5])
+    res = lighten(col, amount = 0.3)
+    assert isinstance(res, sRGB) and np.allclose(col.get("R"), [0.2, 0.6])
+    assert np.allclose(res.get("alpha"), [1., 0.5])
+    assert res.colors() == lighten(col.colors(), amount = 0.3)
+    assert not np.allclose(res.get("R") * 255, np.round(res.get("R") * 255))
+
+    col = HCL(H = [0, 120], C = [30, 40], L = [40, 50])
+    res = darken(col, amount = 0.5, method = "absolute")
+    assert isinstance(res, HCL)
+    assert np.allclose(res.get("L"), [0, 0], atol = 1e-4)
+
+    # One amount per color
+    col = hexcols(["#BB7784", "#BB7784", "#BB7784"])
+    res = lighten(col, amount = [0.1, 0.2, 0.5])
+    assert res.colors() == ["#C7828F", "#D28E9A", "#F6B0BD"]
+    res = darken(col, amount = np.asarray([0.1, 0.2, 0.5]), space = "HLS")
+    assert res.colors() == ["#B16372", "#A35261", "#66333D"]
+
+    raises(TypeError,  lighten, col, amount = "foo")
+    raises(TypeError,  darken,  col, amount = True)
+    raises(ValueError, lighten, col, amount = [0.1, 0.2])
+    raises(ValueError, darken,  col, amount = [[0.1, 0.2, 0.5]])
+
+def _hex_to_int(x):
+    return np.asarray([[int(c[i:i + 2], 16) for i in (1, 3, 5)] for c in x])
+
+@pytest.mark.parametrize("space", ["HCL", "HLS", "combined"])
+@pytest.mark.parametrize("cls", ["HCL", "RGB", "HSV"])
+def test_lighten_colorobject_vs_hex(cls, space):
+    from colorspace import diverging_hcl
+    from colorspace.colorlib import hexcols, HCL, RGB, HSV
+
+    # Same colors as color objects or hex colors; at most one step (8 bit)
+    # apart due to rounding as the object is not quantized.
+    cols = diverging_hcl("Blue-Red 3")(7) + ["#000000", "#FFFFFF", "#808080"]
+    for method in ["relative", "absolute"]:
+        for amount in [-0.6, -0.3, 0.3, 0.6]:
+            col = hexcols(cols)
+            col.to(cls)
+            res = lighten(col, amount = amount, method = method, space = space)
+            assert res.__class__ is col.__class__
+            ref = lighten(cols, amount = amount, method = method, space = space)
+            assert np.abs(_hex_to_int(res.colors()) - _hex_to_int(ref)).max() <= 1
+
+    # Adjusted in the color space requested, not on the coordinates of the object
+    for col in [HCL(260, 40, 50), RGB(0.2, 0.3, 0.6), HSV(200, 0.5, 0.5)]:
+        res = lighten(col, amount = 0.3, space = space)
+        ref = lighten(col.colors(), amount = 0.3, space = space)
+        assert np.abs(_hex_to_int(res.colors()) - _hex_to_int(ref)).max() <= 1
@@ -75,3 +75,77 @@ def test_input_length():
 
 
 
+
+
+# -------------------------------------------------------------------
+# The lookup table is loaded once and the hue is wrapped into [0, 360).
+# -------------------------------------------------------------------
+def test_lookup_table():
+    from colorspace.utils import _max_chroma_table_
+
+    tab = _max_chroma_table_()
+    assert tab is _max_chroma_table_()
+    assert tab.shape == (361, 101)
+    assert not tab.flags.writeable
+
+    x = max_chroma(0, [25, 50, 75])
+    assert np.all(x == np.asarray([69.51, 137.96, 64.37]))
+
+    H = np.asarray([0., 10.5, 123.4, 359.9])
+    assert np.allclose(max_chroma(H - 360., 42.3), max_chroma(H, 42.3))
+    assert np.allclose(max_chroma(H + 720., 42.3), max_chroma(H, 42.3))
+    assert max_chroma(-1e-20, 50) == max_chroma(0, 50)
+
+
+# -------------------------------------------------------------------
+# Exact mode (bisection) and dense tables created by make_max_chroma_table
+# -------------------------------------------------------------------
+def test_exact_mode():
+    from colorspace import polarLUV
+
+    raises(ValueError, max_chroma, H = 10, L = 10, mode = "foo")
+    raises(ValueError, max_chroma, H = 10, L = 10, mode = None)
+    raises(TypeError,  max_chroma, H = 10, L = 10, table = 3)
+
+    H = np.repeat(np.arange(0., 360., 15.), 9)
+    L = np.tile(np.linspace(0., 100., 9), 24)
+    C = max_chroma(H, L, mode = "exact")
+    assert np.all(C[(L == 0) | (L == 100)] == 0.)
+    assert np.all(np.abs(C - max_chroma(H, L)) < 10.)
+
+    # Maximum chroma is within the gamut, slightly more is not
+    for delta, expected in [(0., True), (1e-4, False)]:
+        x = polarLUV(H = H, C = C + delta, L = L)
+        x.to("sRGB")
+        rgb = np.asarray([x.get(d) for d in ["R", "G", "B"]])
+        ok  = np.all((rgb >= -1e-10) & (rgb <= 1. + 1e-10), axis = 0)
+        assert np.all(ok[(L > 0) & (L < 100)] == expected)
+
+    assert np.all(max_chroma(H, L, mode = "exact", floor = True) == np.floor(C))
+
+
+def test_make_max_chroma_table(tmp_path):
+    from colorspace import make_max_chroma_table
+
+    file = str(tmp_path / "max_chroma.npy")
+    raises(TypeError,  make_max_chroma_table, 3)
+    raises(TypeError,  make_max_chroma_table, file, hstep = "1")
+    raises(ValueError, make_max_chroma_table, file, hstep = 0.7)
+    raises(ValueError, make_max_chroma_table, file, lstep = -1)
+    raises(ValueError, make_max_chroma_table, file, tol = 0)
+
+    tab = make_max_chroma_table(file, hstep = 2.5, lstep = 2)
+    assert isinstance(tab, np.memmap)
+    assert tab.shape == (145, 51)
+    assert not tab.flags.writeable
+    assert np.array_equal(np.load(file), tab)
+
+    # Grid points match the exact mode, interpolation is close
+    assert np.allclose(max_chroma([0, 2.5, 180], [50, 50, 42], table = file),
+                       max_chroma([0, 2.5, 180], [50, 50, 42], mode = "exact"))
+    H = np.linspace(0, 359, 50); L = np.linspace(1, 99, 50)
+    assert np.all(np.abs(max_chroma(H, L, table = file) - max_chroma(H, L, mode = "exact")) < 5.)
+
+    # Invalid table
+    np.save(tmp_path / "invalid.npy", np.arange(10.))
+    raises(ValueError, max_chroma, 10, 10, table = str(tmp_path / "invalid.npy"))
@@ -9,7 +9,12 @@ def test_mixcolor_wrong_usage():
     c1 = sRGB(1, 0, 0)
     c2 = sRGB(0, 1, 0)
 
-    raises(TypeError, mixcolor, alpha = [1, 2, 3], color1 = c1, color2 = c2, where = "sRGB")
+    raises(TypeError, mixcolor, alpha = "foo", color1 = c1, color2 = c2, where = "sRGB")
+    raises(TypeError, mixcolor, alpha = ["a", "b"], color1 = c1, color2 = c2, where = "sRGB")
+    # Alpha array out of range, empty or not one-dimensional
+    raises(ValueError, mixcolor, alpha = [1, 2, 3], color1 = c1, color2 = c2, where = "sRGB")
+    raises(ValueError, mixcolor, alpha = [], color1 = c1, color2 = c2, where = "sRGB")
+    raises(ValueError, mixcolor, alpha = [[0.5]], color1 = c1, color2 = c2, where = "sRGB")
     # Alpha out of allowed range
     raises(ValueError, mixcolor, alpha = -0.000001, color1 = c1, color2 = c2, where = "sRGB")
     raises(ValueError, mixcolor, alpha = +1.000001, color1 = c1, color2 = c2, where = "sRGB")
@@ -20,6 +25,9 @@ def test_mixcolor_wrong_usage():
     # where not among the allowed types
     raises(ValueError, mixcolor, alpha = 0.5, color1 = c1, color2 = c2, where = "foo")
 
+    # outer not bool
+    raises(TypeError, mixcolor, alpha = 0.5, color1 = c1, color2 = c2, where = "sRGB", outer = 1)
+
     # object 'color1' cannot be converted to a hexcolor object.
     # Using the 'min' function for this test.
     raises(Exception, mixcolor, alpha = 0.5, color1 = min, color2 = c2,  where = "sRGB")
@@ -66,4 +74,66 @@ def test_mixcolor_hex_in_CIEXYZ():
     assert mix.colors()[0] == "#E77C00"
 
 
-
+# Gradients (multiple alphas) and all combinations of colors
+def test_mixcolor_gradient_outer():
+    import numpy as np
+    res = mixcolor(np.linspace(0, 1, 6), ["#FF0000", "#0000FF"], "#00FF00", "sRGB")
+    assert isinstance(res, sRGB) and len(res) == 12
+    assert res.colors()[:6] == ["#FF0000", "#CC3300", "#996600", "#669900", "#33CC00", "#00FF00"]
+    assert res.colors()[6] == "#0000FF" and res.colors()[11] == "#00FF00"
+
+    res = mixcolor([0.2, 0.8], ["#FF0000", "#0000FF"], ["#00FF00", "#FFFFFF", "#000000"], "sRGB", outer = True)
+    assert len(res) == 12
+    assert res.colors()[:2] == ["#CC3300", "#33CC00"]
+    assert res.colors()[10:] == ["#0000CC", "#000033"]
+
+
+# Mixing in HCL (shorter way around the color wheel), CIELAB, and linear RGB
+def test_mixcolor_HCL_CIELAB_RGB():
+    import numpy as np
+    from colorspace.colorlib import HCL, CIELAB, RGB
+    res = mixcolor(0.5, HCL(350, 40, 50), HCL([10, 90], [60, 0], [70, 50]), "HCL")
+    assert isinstance(res, HCL)
+    assert np.allclose(res.get("H"), [0, 350]) and np.allclose(res.get("C"), [50, 20])
+    assert np.allclose(res.get("L"), [60, 50])
+
+    res = mixcolor([0, 1], sRGB(1, 0, 0), sRGB(0, 0, 1), "CIELAB")
+    assert isinstance(res, CIELAB) and res.colors() == ["#FF0000", "#0000FF"]
+
+    # Linear RGB; color objects are not rounded to hex colors
+    res = mixcolor(0.5, sRGB(1, 0, 0), sRGB(0, 0.1, 0), "RGB")
+    assert isinstance(res, RGB)
+    assert np.allclose(res.get("G"), sRGB(0, 0.1, 0)._convert_coords_("RGB")[1] / 2)
+
+
+
+# HSV/HLS colors (ambiguous conversions) and white points
+def test_mixcolor_ambiguous_whitepoint():
+    import numpy as np
+    from colorspace.colorlib import HSV, HLS, CIEXYZ
+    # HSV and HLS colors are converted via sRGB
+    x = HSV([0, 120], [1, 1], [1, 1])
+    assert mixcolor(0.5, x, "#0000FF", "sRGB").colors() == ["#800080", "#008080"]
+    assert mixcolor(0.5, x, "#0000FF", "CIEXYZ").colors() == ["#BC00BC", "#00BCBC"]
+    for where in ["CIELAB", "HCL"]:
+        res = mixcolor(0.5, "#0000FF", HLS(0, 0.5, 1), where)
+        assert res.colors() == mixcolor(0.5, "#0000FF", "#FF0000", where).colors()
+
+    # Different white points are rejected, else the white point is kept
+    a = CIEXYZ(40, 30, 20); a.set_whitepoint(X = 96.42, Y = 100., Z = 82.52)
+    raises(ValueError, mixcolor, 0.5, a, CIEXYZ(20, 30, 40), "CIEXYZ")
+    b = CIEXYZ(20, 30, 40); b.set_whitepoint(X = 96.42, Y = 100., Z = 82.52)
+    res = mixcolor(0.5, a, b, "CIELAB")
+    assert res.get_whitepoint() == a.get_whitepoint()
+
+def test_mixcolor_out_of_gamut():
+    import numpy as np
+    from colorspace.colorlib import HCL
+    # Limited to the gamut for additive mixing (as for hex colors)
+    x = HCL(260, 120, 60)
+    assert mixcolor(0.5, x, "#ffffff", "sRGB").colors() == ["#ADC3FF"]
+    assert mixcolor(0.5, x, "#ffffff", "sRGB").colors() == \
+           mixcolor(0.5, x.colors(), "#ffffff", "sRGB").colors()
+    res = mixcolor([0., 0.5, 1.], x, "#ffffff", "RGB")
+    assert res.colors() == [x.colors()[0], "#C4CFFF", "#FFFFFF"]
+    assert np.all(res.get("R") >= 0.) and np.all(res.get("B") <= 1.)
@@ -1,24 +1,41 @@
 
-def mixcolor(alpha, color1, color2, where):
+def mixcolor(alpha, color1, color2, where, outer = False):
     """Compute the Convex Combination of Two Colors
 
     This function can be used to compute the result of color mixing, assuming
     additive mixing (e.g., as appropriate for RGB and XYZ).
 
+    Besides additive mixing (`"sRGB"`, `"RGB"`, `"CIEXYZ"`), colors can be
+    interpolated in the perceptually based `"CIELAB"` and `"HCL"` spaces.
+    In `"HCL"` the hue is interpolated along the shorter way around the color
+    wheel; for achromatic colors (chroma close to zero) the hue of the other
+    color is used. For additive mixing, colors outside the gamut are limited to
+    valid sRGB coordinates first; `HSV` and `HLS` colors are converted via sRGB.
+
+    If `alpha` contains multiple values, a gradient is created for each pair of
+    colors, i.e., the result contains `len(alpha)` colors per pair (pair by pair).
+    With `outer = True` each color of `color1` is mixed with each color of
+    `color2`, else the shorter of the two is recycled.
+
     Args:
-        alpha (float): The mixed color is obtained by combining an amount
-            `1 - alpha` of `color1` with an amount `alpha` of `color2`.
-        color1: an object that can be converted into a
+        alpha (float, list, numpy.ndarray): The mixed color is obtained by combining
+            an amount `1 - alpha` of `color1` with an amount `alpha` of `color2`.
+            Single value or multiple values (gradient), all in `[0., 1.]`.
+        color1: a color object, or an object that can be converted into a
             :py:class:`palette <colorspace.palettes.palette>`.
-        color2: a second object that can be converted into a
-            :py:class:`palette <colorspace.palettes.palette>`. Must have the same number
-            of colors as the argument on `color1`.
-        where (str): The color space where the mixing is to take place, either `"RGB"` or `"CIEXYZ"`.
+        color2: a second color object, or an object that can be converted into a
+            :py:class:`palette <colorspace.palettes.palette>`. If not of the same
+            length as `color1`, the shorter one is recycled (see `outer`).
+        where (str): The color space where the mixing is to take place, one of
+            `"sRGB"`, `"RGB"` (linear RGB), `"CIEXYZ"`, `"CIELAB"`, or `"HCL"`.
+        outer (bool): If `True` every color of `color1` is mixed with every color
+            of `color2` (`len(color1) * len(color2)` pairs). Defaults to `False`.
 
     Return:
-        colorspace.colorlib.*: Returns an object of the same class as either
-        `color1` with the new mixed color(s). Call `.swatchplot()` to check the
-        result or `.colors()` to get a list of mixed hex colors.
+        colorspace.colorlib.*: Returns an object of the class given by `where`
+        (`HCL` for `"HCL"`) with the new mixed color(s), using the white point
+        of the inputs. Call `.swatchplot()` to
+        check the result or `.colors()` to get a list of mixed hex colors.
 
     Examples:
         >>> from colorspace.colorlib import RGB
@@ -65,68 +82,116 @@ def mixcolor(alpha, color1, color2, where):
         >>> #:
         >>> swatchplot([RGB_1, RES_2, HEX_2, RES_1, RES_2],
         >>>            show_names = False, figsize = (5.5, 2));
+        >>>
+        >>> #: Gradients (7 colors each) from two colors to white in HCL,
+        >>> #  and all combinations of two sets of colors
+        >>> import numpy as np
+        >>> GRAD = mixcolor(np.linspace(0, 1, 7), ["#023FA5", "#8E063B"], "#FFFFFF", "HCL")
+        >>> OUT  = mixcolor(0.5, HEX_1, ["#FFFFFF", "#000000"], "CIELAB", outer = True)
+        >>> swatchplot({"gradients": GRAD, "outer": OUT}, figsize = (5.5, 2));
 
     Raises:
-        TypeError: In case `alpha` is not float or `int`.
+        TypeError: In case `alpha` is not float or int, or an array of floats.
         ValueError: If `alpha` is not larger than `0.0` and smaller than `1.0`.
+        ValueError: If `alpha` is an empty or not a one-dimensional array.
         TypeError: If `where` is not a str.
         ValueError: If `where` is not among the allowed color spaces used for adaptive mixing.
+        TypeError: If `outer` is not bool.
         Exception: If `color1` or `color2` cannot be converted into a palette object.
+        ValueError: If `color1` and `color2` do not have the same white point.
     """
 
-    from numpy import resize
-    from colorspace.colorlib import colorobject, hexcols
+    import numpy as np
+    from colorspace.colorlib import colorobject, hexcols, _SPACE_ALIASES_, _SPACE_CLASSES_, _SPACE_DIMS_
+    from colorspace.colorlib import _is_ambiguous_
     from colorspace.palettes import palette
 
-    if not isinstance(alpha, (float, int)):
-        raise TypeError("argument `alpha` must be float or int")
-    if isinstance(alpha, int): alpha = float(alpha)
-    if alpha < 0. or alpha > 1.:
+    if isinstance(alpha, (float, int)) and not isinstance(alpha, bool):
+        alpha = np.asarray([alpha], dtype = float)
+    elif isinstance(alpha, (list, np.ndarray)):
+        try:
+            alpha = np.asarray(alpha, dtype = float)
+        except (TypeError, ValueError):
+            raise TypeError("argument `alpha` must be float, int, or an array of floats")
+        if not alpha.ndim == 1 or len(alpha) == 0:
+            raise ValueError("argument `alpha` must be float or a non-empty one-dimensional array")
+    else:
+        raise TypeError("argument `alpha` must be float, int, or an array of floats")
+    if np.any(np.isnan(alpha)) or np.any(alpha < 0.) or np.any(alpha > 1.):
         raise ValueError("argument `alpha` must be in the range of [0., 1.]")
     if not isinstance(where, str):
         raise TypeError("argument `where` must be str")
+    if not isinstance(outer, bool):
+        raise TypeError("argument `outer` must be bool")
 
     # Allowed color types:
-    allowed_spaces = ["sRGB", "CIEXYZ"]
+    allowed_spaces = ["sRGB", "RGB", "CIEXYZ", "CIELAB", "HCL"]
     if not where in allowed_spaces:
         raise ValueError(f"argument `{where}` none of the allowed types: {', '.join(allowed_spaces)}")
+    space = _SPACE_ALIASES_.get(where, where)
 
-    # Converting colors
+    # Color objects are used as they are, everything else
+    # is converted into hex colors via palette.
     try:
-        color1 = hexcols(palette(color1).colors())
+        if not isinstance(color1, colorobject): color1 = hexcols(palette(color1).colors())
     except:
         raise Exception("cannot convert object provided on `color1` into a `colorspace.palettes.palette`")
     try:
-        color2 = hexcols(palette(color2).colors())
+        if not isinstance(color2, colorobject): color2 = hexcols(palette(color2).colors())
     except:
         raise Exception("cannot convert object provided on `color2` into a `colorspace.palettes.palette`")
 
-    # Convert and extract coordinates
-    color1.to(where)
-    color2.to(where)
-    coord1 = color1.get()
-    coord2 = color2.get()
-
-    # If length is not equal; recycle shorter color object
-    if len(color1) > len(color2):
-        for k in coord2:
-            if coord2[k] is None: continue
-            coord2[k] = resize(coord2[k], len(color1))
-    elif len(color1) < len(color2):
-        for k in coord1:
-            if coord1[k] is None: continue
-            coord1[k] = resize(coord1[k], len(color2))
-
-    # Mixing
+    # Same white point required
+    white = color1.get_whitepoint()
+    if not white == color2.get_whitepoint():
+        raise ValueError("`color1` and `color2` must have the same white point")
+
+    # Coordinates of the colors in the color space `space`. HSV and HLS are
+    # converted via sRGB (ambiguous otherwise). For additive mixing the colors
+    # are limited to the gamut (sRGB coordinates clipped as for hex colors).
+    def _get_coords(x):
+        if not space in ["sRGB", "RGB", "CIEXYZ"] and not _is_ambiguous_(x.__class__.__name__, space):
+            return x._convert_coords_(space)
+        srgb = x._convert_coords_("sRGB")
+        if space in ["sRGB", "RGB", "CIEXYZ"]:
+            srgb = [np.clip(v, 0., 1.) for v in srgb]
+        return x._convert_coords_(space, coords = srgb, from_ = "sRGB")
+
+    # Extract coordinates (plus alpha channel if both have one)
+    coord1 = dict(zip(_SPACE_DIMS_[space], _get_coords(color1)))
+    coord2 = dict(zip(_SPACE_DIMS_[space], _get_coords(color2)))
+    if color1.hasalpha() and color2.hasalpha():
+        coord1["alpha"] = color1.get("alpha")
+        coord2["alpha"] = color2.get("alpha")
+
+    # Pairs of colors; all combinations or recycling the shorter color object
+    [n1, n2] = [len(color1), len(color2)]
+    if outer:
+        idx1 = np.repeat(np.arange(n1), n2)
+        idx2 = np.tile(np.arange(n2), n1)
+    else:
+        idx1 = np.arange(max(n1, n2)) % n1
+        idx2 = np.arange(max(n1, n2)) % n2
+
+    # Hue along the shorter way; hue of achromatic colors is not defined
+    if space == "polarLUV":
+        [H1, H2] = [coord1["H"][idx1], coord2["H"][idx2]]
+        H1 = np.where(coord1["C"][idx1] < 1e-3, H2, H1)
+        H2 = np.where(coord2["C"][idx2] < 1e-3, H1, H2)
+        dH = np.mod(H2 - H1 + 180., 360.) - 180.
+
+    # Mixing; one row per pair of colors, one column per alpha
     res = dict()
     for k in coord1:
-        if coord1[k] is None or coord2[k] is None: continue
-        res[k] = coord1[k] * (1. - alpha) + coord2[k] * alpha
+        if space == "polarLUV" and k == "H":
+            tmp = np.mod(H1[:, np.newaxis] + dH[:, np.newaxis] * alpha, 360.)
+        else:
+            tmp = coord1[k][idx1][:, np.newaxis] * (1. - alpha) + \
+                  coord2[k][idx2][:, np.newaxis] * alpha
+        res[k] = tmp.ravel()
 
-    import importlib
-    module = importlib.import_module("colorspace.colorlib")
-    FUN    = getattr(module, where)
-    res    = FUN(**res)
+    res = _SPACE_CLASSES_[space](**res)
+    res.set_whitepoint(**white)
     return res
 
 
@@ -179,9 +244,45 @@ def check_hex_colors(colors):
         TypeError: If `colors` is neither str or list of str.
         ValueError: If at least one of the colors is an invalid hex color.
     """
-    from re import match, compile
-    from numpy import all, repeat, ndarray, nan, isnan
-    from .colorlib import colorobject
+    from numpy import any
+    from .colorlib import colorlib
+
+    [rgb, alpha, isnone] = _check_hex_colors_(colors)
+
+    # Encode (upper case, three digit colors extended), keep None
+    res = colorlib()._hex_encode_(rgb, alpha if any(alpha >= 0) else None)
+    res = res.astype(object)
+    res[isnone] = None
+
+    return res.tolist()
+
+
+def _check_hex_colors_(colors):
+    """Checking and Decoding Hex Colors
+
+    Batch version of :py:func:`check_hex_colors` (see there for details)
+    returning the decoded colors. All entries are validated and decoded at
+    once (see `colorlib._hex_decode_`); `matplotlib.colors.to_hex` is only called
+    for the (rare) entries which are not hex colors such as `"black"`.
+
+    Args:
+        colors (str, list, numpy.ndarray, colorobject): see
+            :py:func:`check_hex_colors`.
+
+    Returns:
+        list: List with three `numpy.ndarray`s; the red, green, and blue
+        intensities as integers in `[0, 255]` (shape `(3, N)`), alpha
+        (`[0, 255]`, `-1` if not defined), and a bool array indicating `None`
+        entries.
+
+    Raises:
+        ValueError: In case `colors` is a list but does not only contain strnigs.
+        TypeError: If `colors` is neither str or list of str.
+        ValueError: If at least one of the colors is an invalid hex color,
+            reporting the invalid entries by index.
+    """
+    from numpy import all, ndarray, where
+    from .colorlib import colorobject, colorlib
 
     # Saniy checks
     if isinstance(colors, str):
@@ -192,50 +293,44 @@ def check_hex_colors(colors):
     elif isinstance(colors, ndarray):
         if not len(colors.shape) == 1:
             raise TypeError("if an `numpy.ndarray` is provided on argument `colors` it must be 1-dimensional")
-        colors = colors.flatten().tolist()
+        if not colors.dtype.kind == "U":
+            colors = colors.tolist()
+            if not all([isinstance(x, (str, type(None))) for x in colors]):
+                raise TypeError("`numpy.ndarray` on argument `colors` must only contain str or None")
     elif isinstance(colors, colorobject):
         colors = colors.colors()
     else:
         raise TypeError("argument `colors` none of the allowed types")
 
-    # Regular expression for checking for valid hex colors
-    pat   = compile("^#([0-9A-Fa-f]{3}|[0-9A-Fa-f]{6})([0-9A-Fa-f]{2})?$")
-
-    # check individual entry. Also extends the color if needed.
-    def check(x, pat):
-        # If is none, leave it as None (from fixup = False)
-        if x is None: return x
-
-        # Check if str is of allowed type
-        tmp = pat.match(x)
-
-        # In case this is no hex definition (not matching the regular expression
-        # above) we try if we can convert the color via matplotlib.colors.to_hex.
-        # This allows to convert e.g., "0" or "black" into hex cols. If this works
-        # We once again shoot it trough our regular expression.
-        if not tmp:
-            if x[0] == "#":
-                raise ValueError(f"string \"{x}\" is not a valid 3/6/8 digit hex color")
-            try:
-                from matplotlib.colors import to_hex
-                x = to_hex(x)
-            except:
-                raise ValueError(f"string \"{x}\" could not be converted to valid hex color")
-            x = x.upper()
-
-        tmp = pat.match(x)
-        # Testing pattern matching (hex color validation)
-        if len(tmp.group(1)) == 3 and not tmp.group(2) == None:
-            raise ValueError(f"string \"{x}\" is no valid hex color")
-        # Three digit: extend
-        elif len(tmp.group(1)) == 3:
-            x = "#" + "".join(repeat([x for x in tmp.group(1)], 2))
-
-        return x.upper()
-
-    colors = [check(x, pat) for x in colors]
+    clib = colorlib()
+    [rgb, alpha, valid, isnone] = clib._hex_decode_(colors)
+
+    # Entries which are neither valid hex colors nor None
+    bad = where(~valid & ~isnone)[0]
+    if len(bad) == 0: return [rgb, alpha, isnone]
+
+    # Invalid hex colors (starting with "#")
+    inv = [i for i in bad if str(colors[i]).startswith("#")]
+    if len(inv) == 1:
+        raise ValueError(f"string \"{colors[inv[0]]}\" (index {inv[0]}) is not a valid 3/6/8 digit hex color")
+    elif len(inv) > 1:
+        tmp = ", ".join([f"\"{colors[i]}\" (index {i})" for i in inv[:10]])
+        raise ValueError(f"{len(inv)} strings are not valid 3/6/8 digit hex colors: {tmp}" + \
+                         (", ..." if len(inv) > 10 else ""))
+
+    # In case this is no hex definition we try if we can convert the color
+    # via matplotlib.colors.to_hex. This allows to convert e.g., "0" or "black"
+    # into hex cols.
+    conv = []
+    for i in bad:
+        try:
+            from matplotlib.colors import to_hex
+            conv.append(to_hex(colors[i]))
+        except:
+            raise ValueError(f"string \"{colors[i]}\" (index {i}) could not be converted to valid hex color")
+    [rgb[:, bad], alpha[bad]] = clib._hex_decode_(conv)[:2]
 
-    return colors
+    return [rgb, alpha, isnone]
 
 
 # --------------------------------------------------------------------
@@ -628,12 +723,171 @@ def contrast_ratio(colors, bg = "#FFFFFF", plot = False, ax = None, \
 
 
 
-def max_chroma(H, L, floor = False):
+# Maximum chroma tables used by max_chroma; loaded once (key `None` for the
+# default table shipped with the package, `(file, mtime)` for `.npy` tables).
+_MAX_CHROMA_TABLE_ = {}
+
+def _max_chroma_table_(file = None):
+    """Maximum Chroma Table
+
+    Loads `data/max_chroma_table.json` (once) and returns the table as
+    `numpy.ndarray` of shape `(361, 101)` with the maximum chroma for
+    integer hues `[0, 360]` (first dimension) and luminances `[0, 100]`.
+
+    If `file` is specified, a table created by :py:func:`make_max_chroma_table`
+    is loaded as read-only memory map instead. The resolution of the table
+    follows from its shape, `(360 / hstep + 1, 100 / lstep + 1)`.
+    """
+    import os
+    import numpy as np
+
+    key = None if file is None else (os.path.realpath(file), os.path.getmtime(file))
+    if key in _MAX_CHROMA_TABLE_:
+        return _MAX_CHROMA_TABLE_[key]
+
+    if file is None:
+        import json
+        resource_package = os.path.dirname(__file__)
+        filename = os.path.join(resource_package, "data", "max_chroma_table.json")
+        with open(filename, "r") as fid:
+            tmp = json.loads(fid.readline())
+
+        res = np.full((361, 101), np.nan)
+        for k, val in tmp.items():
+            [h, l] = k.split("-")
+            res[int(h), int(l)] = val[0]
+        res.setflags(write = False)
+    else:
+        res = np.load(file, mmap_mode = "r")
+        if not res.ndim == 2 or res.shape[0] < 2 or res.shape[1] < 2 \
+                or not np.issubdtype(res.dtype, np.floating):
+            raise ValueError(f"file \"{file}\" does not contain a valid maximum chroma table")
+        # Drop outdated versions of the same file
+        for k in [k for k in _MAX_CHROMA_TABLE_ if k is not None and k[0] == key[0]]:
+            del _MAX_CHROMA_TABLE_[k]
+
+    _MAX_CHROMA_TABLE_[key] = res
+    return res
+
+
+def _max_chroma_exact_(H, L, tol = 1e-6):
+    """Exact Maximum Chroma
+
+    Computes the maximum chroma for given hue-luminance combinations by
+    vectorized bisection against the sRGB cube, converting the candidate
+    colors with the `polarLUV` to `sRGB` kernels of :py:class:`colorlib`.
+    As the sRGB gamut is convex in each CIELUV plane of constant luminance,
+    the boundary is crossed exactly once along each hue.
+
+    Args:
+        H (numpy.ndarray): hues.
+        L (numpy.ndarray): luminances in `[0, 100]`, same length as `H`.
+        tol (float): absolute tolerance of the chroma.
+
+    Returns:
+        numpy.ndarray: Maximum chroma; the largest chroma found to be
+        within the gamut (i.e., at most `tol` below the true maximum).
+    """
+    import numpy as np
+    from .colorlib import colorlib
+
+    clib = colorlib()
+    def in_gamut(C):
+        [l, u, v] = clib.polarLUV_to_LUV(L, C, H)
+        rgb = clib.RGB_to_sRGB(*clib.XYZ_to_RGB(*clib.LUV_to_XYZ(l, u, v)))
+        return np.all([(x >= -1e-10) & (x <= 1. + 1e-10) for x in rgb], axis = 0)
+
+    # The chroma within the sRGB gamut never exceeds ~180 (red)
+    lo = np.zeros(len(H))
+    hi = np.full(len(H), 200.)
+    for i in range(int(np.ceil(np.log2(200. / tol)))):
+        mid = (lo + hi) / 2.
+        ok  = in_gamut(mid)
+        lo  = np.where(ok, mid, lo)
+        hi  = np.where(ok, hi, mid)
+
+    # No chroma possible for black and white
+    return np.where((L <= 0.) | (L >= 100.), 0., lo)
+
+
+def make_max_chroma_table(file, hstep = 0.1, lstep = 0.1, tol = 1e-6):
+    """Create Maximum Chroma Table
+
+    Computes the exact maximum chroma (see :py:func:`max_chroma`, `mode =
+    "exact"`) on a regular grid of hues `[0, 360]` and luminances `[0, 100]`
+    and stores the result as a `.npy` file. The table is written block by
+    block into a memory map and can be used by :py:func:`max_chroma` via
+    argument `table`, allowing for a more accurate table lookup than the
+    default table (`hstep = lstep = 1`).
+
+    Args:
+        file (str): name of the `.npy` file to be created (overwritten if existing).
+        hstep (int, float): hue step, `360 / hstep` must be an integer.
+            Defaults to `0.1`.
+        lstep (int, float): luminance step, `100 / lstep` must be an integer.
+            Defaults to `0.1`.
+        tol (float): absolute tolerance of the chroma. Defaults to `1e-6`.
+
+    Returns:
+        numpy.memmap: Table of shape `(360 / hstep + 1, 100 / lstep + 1)`
+        (read-only).
+
+    Examples:
+
+        >>> from colorspace import make_max_chroma_table, max_chroma
+        >>> make_max_chroma_table("max_chroma_table.npy", hstep = 0.5, lstep = 0.5)
+        >>> max_chroma(10.25, 50.75, table = "max_chroma_table.npy")
+
+    Raises:
+        TypeError: If `file` is not str or `hstep`, `lstep`, `tol` are not numeric.
+        ValueError: If `hstep`, `lstep` do not divide `360` and `100` or
+            `tol` is not positive.
+    """
+    import numpy as np
+
+    if not isinstance(file, str):
+        raise TypeError("argument `file` must be str")
+    for name, val in {"hstep": hstep, "lstep": lstep, "tol": tol}.items():
+        if not isinstance(val, (int, float)) or isinstance(val, bool):
+            raise TypeError(f"argument `{name}` must be int or float")
+    nh = 360. / hstep if hstep > 0 else 0.5
+    nl = 100. / lstep if lstep > 0 else 0.5
+    if not np.isclose(nh, np.round(nh), rtol = 0., atol = 1e-9) or np.round(nh) < 1:
+        raise ValueError("argument `hstep` must be positive, `360 / hstep` must be an integer")
+    if not np.isclose(nl, np.round(nl), rtol = 0., atol = 1e-9) or np.round(nl) < 1:
+        raise ValueError("argument `lstep` must be positive, `100 / lstep` must be an integer")
+    if not tol > 0:
+        raise ValueError("argument `tol` must be positive")
+
+    nh, nl = int(np.round(nh)) + 1, int(np.round(nl)) + 1
+    L = np.linspace(0., 100., nl)
+
+    res = np.lib.format.open_memmap(file, mode = "w+", dtype = "float64", shape = (nh, nl))
+    # Blocks of hues (limits memory usage)
+    block = max(1, 2**18 // nl)
+    for i in range(0, nh, block):
+        H = np.linspace(0., 360., nh)[i:i + block]
+        res[i:i + len(H), :] = _max_chroma_exact_(np.repeat(H, nl), np.tile(L, len(H)),
+                                                  tol).reshape((len(H), nl))
+    res.flush()
+    del res
+
+    return _max_chroma_table_(file)
+
+
+def max_chroma(H, L, floor = False, mode = "table", table = None):
     """Compute Maximum Chroma for Given Hue and Luminance in HCL
 
     Compute approximately the maximum chroma possible for a given hue
     and luminance combination in the HCL color space.
 
+    By default (`mode = "table"`) the maximum chroma is interpolated
+    bilinearly from a precomputed table with a resolution of one degree hue
+    and one unit luminance. A denser table created by
+    :py:func:`make_max_chroma_table` can be used via argument `table`.
+    With `mode = "exact"` the maximum chroma is computed by bisection against
+    the sRGB gamut (slower, but exact up to `1e-6`).
+
     `H` and `L` can be single values or multiple values. If both have length `>
     1`, the length must match. If one is of length `1` it will be recycled to
     match the length of the other argument. In case the function is not able to
@@ -645,6 +899,10 @@ def max_chroma(H, L, floor = False):
         L (int, float, list, numpy.ndarray): luminance, one or multiple values (must be
             convertable to float).
         floor (bool): should return be rounded? Defaults to `False`.
+        mode (str): one of `"table"` (default) or `"exact"`, see description.
+        table (None, str): name of a `.npy` file created by
+            :py:func:`make_max_chroma_table` used with `mode = "table"`.
+            Defaults to `None` (default table).
 
     Returns:
         numpy.ndarray: Array of the same length as `max(len(H), len(L))` with
@@ -665,17 +923,20 @@ def max_chroma(H, L, floor = False):
         >>> 
         >>> #: Same as above but floored
         >>> max_chroma(np.arange(0, 360, 60), 50, floor = True)
+        >>>
+        >>> #: Exact maximum chroma
+        >>> max_chroma(np.arange(0, 360, 60), 50, mode = "exact")
 
     Raises:
         TypeError: If unexpected input on `H` or `L`.
         TypeError: If length of `H` and `L` do not match (see description).
         TypeError: If input `floor` is not bool.
+        ValueError: If `mode` is not `"table"` or `"exact"`.
+        TypeError: If `table` is neither `None` nor str.
+        ValueError: If `table` does not contain a valid maximum chroma table.
     """
 
     import numpy as np
-    import json
-    import os
-    import re
 
     if isinstance(H, (float, int)):
         H = np.atleast_1d(np.asarray(H, dtype = "float"))
@@ -692,6 +953,10 @@ def max_chroma(H, L, floor = False):
         raise TypeError("unexpected input on argument `L`")
     if not isinstance(floor, bool):
         raise TypeError("argument `floor` must be bool")
+    if not isinstance(mode, str) or mode not in ["table", "exact"]:
+        raise ValueError("argument `mode` must be \"table\" or \"exact\"")
+    if not isinstance(table, (type(None), str)):
+        raise TypeError("argument `table` must be None or str")
 
     # Check if we have to repeat one of the two inputs.
     # This is only used if one is of length > 1 while the other
@@ -704,42 +969,38 @@ def max_chroma(H, L, floor = False):
     if not len(H) == len(L):
         raise ValueError("number of values and `H` and `L` do not match or cannot be matched")
 
-    # Make sure that all hue values lie in the range of 0-360 
-    while np.any(H < 0):    H = np.where(H < 0,    H + 360., H)
-    while np.any(H >= 360): H = np.where(H >= 360, H - 360., H)
+    # Make sure that all hue values lie in the range of 0-360 (the
+    # second step is needed for tiny negative values where H % 360 == 360)
+    H = np.mod(H, 360.)
+    H = np.where(H >= 360, H - 360., H)
 
     # Prepare the values used for the 'table search'.
     # Fix luminance to values between [0., 100.]
     L = np.fmin(100, np.fmax(0, L))
 
-    # Loading json data set
-    resource_package = os.path.dirname(__file__)
-    filename = os.path.join(resource_package, "data", "max_chroma_table.json")
-    with open(filename, "r") as fid:
-        mctab = json.loads(fid.readline())
+    if mode == "exact":
+        C = _max_chroma_exact_(H, L)
+        return np.floor(C) if floor else C
+
+    # Loading table (cached); hue and luminance in units of the table grid
+    mctab = _max_chroma_table_(table)
+    [nh, nl] = [mctab.shape[0] - 1, mctab.shape[1] - 1]
+    if not (nh == 360 and nl == 100):
+        H = H * (nh / 360.)
+        L = L * (nl / 100.)
 
     # Minimum/maximum hue and luminance
-    hmin = np.fmax(0,   [int(np.floor(x + 1e-08)) for x in H])
-    lmin = np.fmax(0,   [int(np.floor(x + 1e-08)) for x in L])
-    hmax = np.fmin(360, [int(np.ceil(x  + 1e-08)) for x in H])
-    lmax = np.fmin(100, [int(np.ceil(x  + 1e-08)) for x in L])
-
-    # Not very efficient. However, the best I came up for now :|
-    # Reading/loading the json data set takes about half of the time, maybe
-    # more efficient to directly code it rather than reading it from disc.
-    # TODO(enhancement): Investigate this at some point; room for improvement.
-    def get_max(a, b):
-        res = []
-        for i in range(len(a)):
-            res.append(mctab[f"{a[i]:d}-{b[i]:d}"])
-        return np.asarray(res).flatten()
-
-    # Calculate max chroma
-    C = (hmax - H) * (lmax - L) * get_max(hmin, lmin) + \
-        (hmax - H) * (L - lmin) * get_max(hmin, lmax) + \
-        (H - hmin) * (lmax - L) * get_max(hmax, lmin) + \
-        (H - hmin) * (L - lmin) * get_max(hmax, lmax)
-    C = np.where(np.logical_or(L < 0., L > 100.), 999, C)
+    hmin = np.fmax(0,  np.floor(H + 1e-08).astype(int))
+    lmin = np.fmax(0,  np.floor(L + 1e-08).astype(int))
+    hmax = np.fmin(nh, np.ceil(H  + 1e-08).astype(int))
+    lmax = np.fmin(nl, np.ceil(L  + 1e-08).astype(int))
+
+    # Calculate max chroma (bilinear interpolation)
+    C = (hmax - H) * (lmax - L) * mctab[hmin, lmin] + \
+        (hmax - H) * (L - lmin) * mctab[hmin, lmax] + \
+        (H - hmin) * (lmax - L) * mctab[hmax, lmin] + \
+        (H - hmin) * (L - lmin) * mctab[hmax, lmax]
+    C = np.where(np.logical_or(L < 0., L > nl), 999, C)
 
     # Floor if requested and return
     if floor: C = np.floor(C)
@@ -756,13 +1017,18 @@ def darken(col, amount = 0.1, method = "relative", space = "HCL", fixup = True):
             color object,
             a :py:class:`palette <colorspace.palettes.palette>` object, or a
             str/list of str with valid hex colors.
-        amount (float): value between `[0., 1.]` with the amount the colors
-            should be lightened. Defaults to `0.1`.
+        amount (float, list, numpy.ndarray): value between `[0., 1.]` with the
+            amount the colors should be darkened, or one value per color.
+            Defaults to `0.1`.
         method (str): either `"relative"` (default) or `"absolute"`.
-        space (str): one of `"HCL"` or `"HSV"`. Defaults to `"HCL"`.
+        space (str): one of `"HCL"`, `"HLS"`, or `"combined"`. Defaults to `"HCL"`.
         fixup (bool): should colors which fall outside the defined RGB space
             be fixed (corrected)? Defaults to `True`.
 
+    Returns:
+        Darkened colors of the same type as `col` (str, list of str,
+        palette, or a colorobject of the same class).
+
     Example:
 
         >>> from colorspace import darken, lighten, swatchplot
@@ -773,14 +1039,33 @@ def darken(col, amount = 0.1, method = "relative", space = "HCL", fixup = True):
         >>>            show_names = False, figsize = (6, 1));
 
     Raises:
+        TypeError: If `amount` is not float or an array of floats.
+        ValueError: If the length of `amount` does not match the number of colors.
         TypeError: If `method` is not str.
         ValueError: If `method` is not one of `"absolute"` or `"relative"`.
         TypeError: If `space` is not str.
-        ValueError: If `space` is not one of `"HCL"` or `"HSV"`.
+        ValueError: If `space` is not one of `"HCL"`, `"HLS"`, or `"combined"`.
         TypeError: If 'col' is not among the one of the recognized objects.
         TypeError: If `fixup` is not bool.
     """
-    return lighten(col, amount = amount * -1., method = method, space = space, fixup = fixup)
+    return lighten(col, amount = -_lighten_amount_(amount), method = method, space = space, fixup = fixup)
+
+
+def _lighten_amount_(amount):
+    """Converts `amount` of :py:func:`lighten` into a float or a 1D float array."""
+    from numpy import asarray, ndarray
+
+    if isinstance(amount, (int, float)) and not isinstance(amount, bool):
+        return float(amount)
+    elif not isinstance(amount, (list, ndarray)):
+        raise TypeError("argument `amount` must be float or an array of floats")
+    try:
+        amount = asarray(amount, dtype = float)
+    except (TypeError, ValueError):
+        raise TypeError("argument `amount` must be float or an array of floats")
+    if not amount.ndim == 1:
+        raise ValueError("argument `amount` must be float or a one-dimensional array")
+    return amount
 
 
 def lighten(col, amount = 0.1, method = "relative", space = "HCL", fixup = True):
@@ -789,17 +1074,26 @@ def lighten(col, amount = 0.1, method = "relative", space = "HCL", fixup = True)
     Takes one or multiple colors and adjust them sucht hat they apper
     lightened. See also: :py:func:`darken`.
 
+    The colors are adjusted on their coordinates (no rounding to hex colors
+    in between); color objects are returned as an object of the same class
+    (e.g., `sRGB` in, `sRGB` out), alpha is kept.
+
     Args:
         col: color (or colors) to be manipulated. Can be a color object
             a :py:class:`palette <colorspace.palettes.palette>` object, or a
             str/list of str with valid hex colors.
-        amount (float): value between `[0., 1.]` with the amount the colors
-            should be lightened. Defaults to `0.1`.
+        amount (float, list, numpy.ndarray): value between `[0., 1.]` with the
+            amount the colors should be lightened, or one value per color.
+            Defaults to `0.1`.
         method (str): either `"relative"` (default) or `"absolute"`.
-        space (str): one of `"HCL"` or `"HLS"`. Defaults to `"HCL"`.
+        space (str): one of `"HCL"`, `"HLS"`, or `"combined"`. Defaults to `"HCL"`.
         fixup (bool): should colors which fall outside the defined RGB space
             be fixed (corrected)? Defaults to `True`.
 
+    Returns:
+        Lightened colors of the same type as `col` (str, list of str,
+        palette, or a colorobject of the same class).
+
     Example:
 
         >>> from colorspace import darken, lighten, swatchplot
@@ -808,8 +1102,14 @@ def lighten(col, amount = 0.1, method = "relative", space = "HCL", fixup = True)
         >>> darker   = darken(original,  amount = 0.3, method = "relative", space = "HCL")
         >>> swatchplot([lighter, original, darker],
         >>>            show_names = False, figsize = (6, 1));
+        >>>
+        >>> #: One amount per color, color objects keep their class
+        >>> from colorspace.colorlib import sRGB
+        >>> lighten(sRGB([0.2, 0.4], [0.3, 0.1], [0.6, 0.2]), amount = [0.2, 0.5])
 
     Raises:
+        TypeError: If `amount` is not float or an array of floats.
+        ValueError: If the length of `amount` does not match the number of colors.
         TypeError: If `method` is not str.
         ValueError: If `method` is not one of `"absolute"` or `"relative"`.
         TypeError: If `space` is not str.
@@ -820,7 +1120,10 @@ def lighten(col, amount = 0.1, method = "relative", space = "HCL", fixup = True)
 
     from colorspace.colorlib import colorobject, hexcols
     from colorspace.palettes import palette
-    from numpy import fmin, fmax, where
+    from copy import copy
+    from numpy import clip, fmin, fmax, where
+
+    amount = _lighten_amount_(amount)
 
     if not isinstance(method, str):
         raise TypeError("argument `method` must be str")
@@ -835,83 +1138,92 @@ def lighten(col, amount = 0.1, method = "relative", space = "HCL", fixup = True)
     if not isinstance(fixup, bool):
         raise TypeError("argument `fixup` must be bool")
 
-    # If the input is a colorobject (hex, HSV, ...) we first
-    # put everything into a (temporary) palette.
-    if isinstance(col, colorobject):  x = palette(col.colors(), "_temp_palette_object_")
-    # In case the input is a str or a list of str
-    # we convert the input (temporarily) into a palette.
-    # This allows us to check if all colors are valid hex colors.
-    elif isinstance(col, str):        x = palette([col], "_temp_palette_object_")
-    elif isinstance(col, list):       x = palette(col,   "_temp_palette_object_")
-    # If the input is a palette object; keep it as it is.
-    elif isinstance(col, palette):    x = col
+    # Color objects are modified on a (shallow) copy; hex colors (str, list
+    # of str, palettes) are converted into a hexcols object which also checks
+    # if all colors are valid hex colors.
+    if isinstance(col, colorobject):  x = copy(col)
+    elif isinstance(col, str):        x = hexcols([col])
+    elif isinstance(col, list):       x = hexcols(col)
+    elif isinstance(col, palette):    x = hexcols(col.colors())
     else:
         raise TypeError("argument `col` must be a colorobject, palette, a str, " + \
                         "or list of str with valid hex colors")
 
+    if not isinstance(amount, float) and not len(amount) in [1, x.length()]:
+        raise ValueError("length of argument `amount` must be 1 or match the number of colors")
+
+    # Converting coordinates using white point and gamma of the object.
+    # Always via sRGB, HSV and HLS are defined on sRGB coordinates.
+    def _conv(coords, from_, to):
+        return x._convert_coords_(to, fixup = fixup, coords = coords, from_ = from_)
+
+    # The colors are adjusted based on their sRGB coordinates limited to the
+    # gamut (as when converting to hex colors, without rounding to 8 bit).
+    # Coordinates close to the bounds are snapped to 0/1; numerical noise of
+    # the conversion (~1e-7) would otherwise define hue and saturation (HLS)
+    # of black and white.
+    srgb = [clip(v, 0., 1.) for v in x._convert_coords_("sRGB")]
+    srgb = [where(v < 1e-6, 0., where(v > 1. - 1e-6, 1., v)) for v in srgb]
+
     # Function to lighten colors in the HCL space.
-    # Returns a colorobject with transformed coordinates.
-    def _lighten_in_HCL(colors, amount, method):
-        tmp = hexcols(x.colors())
-        tmp.to("HCL")
-        tmp.set(L = fmin(100, fmax(0, tmp.get("L")))) # Fix bounds
+    # Returns the transformed [L, C, H] coordinates.
+    def _lighten_in_HCL(srgb, amount, method):
+        [L, C, H] = _conv(srgb, "sRGB", "polarLUV")
+        L = fmin(100, fmax(0, L)) # Fix bounds
         if method == "relative":
-            tmp.set(L = where(amount >= 0, \
-                              100. - (100. - tmp.get("L")) * (1. - amount), \
-                              tmp.get("L") * (1. + amount)))
-
+            L = where(amount >= 0, 100. - (100. - L) * (1. - amount), L * (1. + amount))
         else:
-            tmp.set(L = tmp.get("L") + amount * 100.)
-        tmp.set(L = fmin(100, fmax(0, tmp.get("L")))) # Fix bounds again
-        tmp.set(C = fmin(max_chroma(tmp.get("H"), tmp.get("L"), floor = True), \
-                         fmax(0, tmp.get("C"))))
+            L = L + amount * 100.
+        L = fmin(100, fmax(0, L)) # Fix bounds again
+        C = fmin(max_chroma(H, L, floor = True), fmax(0, C))
 
-        return tmp
+        return [L, C, H]
 
     # Function to lighten colors in the HLS space.
-    # Returns a colorobject with transformed coordinates.
-    def _lighten_in_HLS(colors, amount, method):
-        tmp = hexcols(x.colors())
-        tmp.to("HLS")
+    # Returns the transformed [H, L, S] coordinates.
+    def _lighten_in_HLS(srgb, amount, method):
+        [H, L, S] = _conv(srgb, "sRGB", "HLS")
         if method == "relative":
-            tmp.set(L = where(amount >= 0, \
-                              1. - (1. - tmp.get("L")) * (1. - amount), \
-                              tmp.get("L") * (1. + amount)))
+            L = where(amount >= 0, 1. - (1. - L) * (1. - amount), L * (1. + amount))
         else:
-            tmp.set(L = tmp.get("L") + amount)
-        tmp.set(L = fmin(1., fmax(0, tmp.get("L"))))
-
-        return tmp
+            L = L + amount
+        L = fmin(1., fmax(0, L))
 
+        return [H, L, S]
 
     # Lighten colors depending on the users choice 'space'
     if space == "HCL":
-        tmp = _lighten_in_HCL(x.colors(), amount, method)
+        coords = _lighten_in_HCL(srgb, amount, method)
+        from_  = "polarLUV"
     elif space == "HLS":
-        tmp = _lighten_in_HLS(x.colors(), amount, method)
+        coords = _lighten_in_HLS(srgb, amount, method)
+        from_  = "HLS"
     else:
-        tmp    = _lighten_in_HCL(x.colors(), amount, method) # Via HCL color space
-        tmpHLS = _lighten_in_HLS(x.colors(), amount, method) # Via HLS color space
-        tmpHLS.to("RGB"); tmpHLS.to("HCL")
-
-        # fix-up L and copy C over from HLS-converted color
-        tmp.set(C = tmpHLS.get("C"))
+        [L, C, H] = _lighten_in_HCL(srgb, amount, method) # Via HCL color space
+        tmpHLS    = _lighten_in_HLS(srgb, amount, method) # Via HLS color space
 
+        # fix-up L and copy C over from HLS-converted color,
         # make sure chroma is in allowed range
-        tmp.set(C = fmin(max_chroma(tmp.get("H"), tmp.get("L"), floor = True), \
-                         fmax(0, tmp.get("C"))))
-
-    # Job done, convert back to HEX
-    tmp.to("hex")
+        # (HLS coordinates interpreted as RGB, as in the original implementation)
+        C = _conv(_conv(tmpHLS, "HLS", "RGB"), "RGB", "polarLUV")[1]
+        C = fmin(max_chroma(H, L, floor = True), fmax(0, C))
+        coords = [L, C, H]
+        from_  = "polarLUV"
+
+    # Job done, convert back into the color space of the input (via sRGB)
+    to   = x.__class__.__name__
+    srgb = _conv(coords, from_, "sRGB")
+    if fixup: srgb = [clip(v, 0., 1.) for v in srgb]
+    x._replace_coords_(to, _conv(srgb, "sRGB", to))
 
     # If the original input was a single str: return str
-    if isinstance(col, str):              res = tmp.colors()[0]
+    if isinstance(col, str):              res = x.colors()[0]
     # In case the original input has been a list, return list
-    elif isinstance(col, list):           res = tmp.colors()
+    elif isinstance(col, list):           res = x.colors()
     # In case the input was a palette, return palette with original name.
-    elif isinstance(col, palette):        res = palette(tmp.colors(), col.name())
-    # Else the input has been a colorobject, return hex color object :)
-    else:                                 res = tmp
+    elif isinstance(col, palette):        res = palette(x.colors(), col.name())
+    # Else the input has been a colorobject, return object of the same class
+    else:                                 res = x
 
     return res
 